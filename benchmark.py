@@ -0,0 +1,194 @@
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from unittest import mock
+from equipo import Equipo
+from jugador import Jugador, JugadorCompacto
+from decodificador_jugadores import decodificar_jugadores
+from generador_roster import escribir_roster
+from funciones_auxiliares import (exportar_csv, exportar_json, crear_db, insertar_filas_db,
+                                  quick_sort_lista_jugadores_recursivo, quick_sort_lista_jugadores_recursivo_dos_parametros,
+                                  quick_sort_lista_jugadores_atributo_primera_capa, listar_jugadores_ordenados_con_porcentaje,
+                                  obtener_registros_ordenados_por, exportar_registros_csv, exportar_registros_json,
+                                  exportar_registros_db)
+
+VERSION_REPORTE = 1
+TAMANIOS_POR_DEFECTO = (12, 1_000, 10_000, 100_000)
+
+def medir(funcion, repeticiones: int, preparar=None) -> dict:
+    '''
+    Ejecuta 'funcion' varias veces y retorna el mejor tiempo y la mediana en segundos.
+    'preparar' se llama antes de cada repetición, fuera de la medición.
+    '''
+    tiempos = []
+    for _ in range(repeticiones):
+        if preparar is not None:
+            preparar()
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return {'mejor_s': min(tiempos), 'mediana_s': statistics.median(tiempos), 'repeticiones': repeticiones}
+
+def _texto_estadisticas(jugador) -> str:
+    # Mismo formato 'clave: valor' que recibe exportar_csv desde la opción 3 del menu
+    return ''.join(f'{clave}: {valor}\n' for clave, valor in jugador.a_diccionario()['estadisticas'].items())
+
+def medir_tamanio(tamanio: int, directorio: str, repeticiones: int) -> dict:
+    '''
+    Genera un roster sintético de 'tamanio' jugadores y mide cada operación sobre él.
+    Retorna un diccionario {operacion: medición}.
+    '''
+    ruta = os.path.join(directorio, f'roster_{tamanio}.json')
+    escribir_roster(ruta, tamanio)
+    salida = os.path.join(directorio, f'salida_{tamanio}')
+    resultados = {}
+    contador = iter(range(sys.maxsize))
+
+    resultados['construccion'] = medir(lambda: Equipo(ruta), repeticiones)
+    resultados['construccion_compacto'] = medir(lambda: Equipo(ruta, compacto=True), repeticiones)
+    resultados['construccion_columnar'] = medir(lambda: Equipo(ruta, columnar=True), repeticiones)
+    Equipo(ruta, usar_snapshot=True)
+    resultados['construccion_snapshot'] = medir(lambda: Equipo(ruta, usar_snapshot=True), repeticiones)
+
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        diccionarios = json.load(archivo)['jugadores']
+    resultados['constructores_jugador'] = medir(lambda: [Jugador(diccionario) for diccionario in diccionarios], repeticiones)
+    resultados['decodificar_jugadores'] = medir(lambda: decodificar_jugadores(diccionarios), repeticiones)
+    resultados['constructores_jugador_compacto'] = medir(lambda: [JugadorCompacto(diccionario) for diccionario in diccionarios], repeticiones)
+    resultados['decodificar_jugadores_compacto'] = medir(lambda: decodificar_jugadores(diccionarios, JugadorCompacto), repeticiones)
+    del diccionarios
+
+    equipo = Equipo(ruta)
+    jugadores = equipo.lista_jugadores
+    nombre_buscado = jugadores[len(jugadores) // 2].nombre
+    with mock.patch('builtins.input', return_value=nombre_buscado):
+        equipo.buscar_jugador_por_nombre()
+        resultados['buscar_jugador_por_nombre'] = medir(equipo.buscar_jugador_por_nombre, repeticiones)
+
+    def descartar_cache():
+        equipo.lista_jugadores = jugadores
+    resultados['maximo_o_minimo'] = medir(
+        lambda: equipo.buscar_jugador_con_maximo_o_minimo_apartado_estadistico('get_rebotes_totales', True),
+        repeticiones, descartar_cache)
+    resultados['maximo_o_minimo_cacheado'] = medir(
+        lambda: equipo.buscar_jugador_con_maximo_o_minimo_apartado_estadistico('get_rebotes_totales', True), repeticiones)
+
+    resultados['quick_sort_estadistica'] = medir(
+        lambda: quick_sort_lista_jugadores_recursivo(jugadores, True, 'get_promedio_puntos_por_partido'), repeticiones)
+    resultados['quick_sort_dos_estadisticas'] = medir(
+        lambda: quick_sort_lista_jugadores_recursivo_dos_parametros(jugadores, False, 'get_robos_totales', 'get_bloqueos_totales'),
+        repeticiones)
+    resultados['quick_sort_atributo'] = medir(
+        lambda: quick_sort_lista_jugadores_atributo_primera_capa(jugadores, True, 'nombre'), repeticiones)
+
+    ordenados = quick_sort_lista_jugadores_recursivo_dos_parametros(jugadores, False, 'get_robos_totales', 'get_bloqueos_totales')
+    resultados['listar_jugadores_ordenados_con_porcentaje'] = medir(
+        lambda: listar_jugadores_ordenados_con_porcentaje(ordenados, 'get_robos_totales', 'get_bloqueos_totales', True),
+        repeticiones)
+
+    registros = obtener_registros_ordenados_por(jugadores)
+    texto_jugador = _texto_estadisticas(jugadores[0])
+    resultados['exportar_csv'] = medir(lambda: exportar_csv(f'{salida}_jugador.csv', 'w', texto_jugador), repeticiones)
+    resultados['exportar_json'] = medir(lambda: exportar_json(f'{salida}.json', 'w', dict(registros)), repeticiones)
+
+    # Cada repetición escribe una base nueva para no acumular filas de la anterior
+    def insertar_en_base_nueva():
+        ruta_db = f'{salida}_filas_{next(contador)}'
+        crear_db(ruta_db, 'jugadores')
+        insertar_filas_db(ruta_db, 'jugadores', dict(registros))
+    resultados['crear_db_e_insertar_filas_db'] = medir(insertar_en_base_nueva, repeticiones)
+
+    resultados['exportar_registros_csv'] = medir(lambda: exportar_registros_csv(f'{salida}_registros.csv', 'w', registros), repeticiones)
+    resultados['exportar_registros_json'] = medir(lambda: exportar_registros_json(f'{salida}_registros.json', 'w', registros), repeticiones)
+    resultados['exportar_registros_db'] = medir(
+        lambda: exportar_registros_db(f'{salida}_registros_{next(contador)}', 'jugadores', registros), repeticiones)
+    resultados['exportar_roster_csv'] = medir(lambda: equipo.exportar_csv(f'{salida}_roster.csv'), repeticiones)
+    resultados['exportar_roster_csv_gzip'] = medir(lambda: equipo.exportar_csv(f'{salida}_roster.csv.gz'), repeticiones)
+    resultados['exportar_sqlite'] = medir(lambda: equipo.exportar_sqlite(f'{salida}_equipo_{next(contador)}.db'), repeticiones)
+    return resultados
+
+def _commit_actual() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def ejecutar_benchmark(tamanios: list[int], repeticiones: int) -> dict:
+    '''
+    Mide todas las operaciones para cada tamaño y retorna el reporte completo.
+    '''
+    reporte = {
+        'version': VERSION_REPORTE,
+        'metadatos': {
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'commit': _commit_actual(),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'procesador': platform.processor() or platform.machine(),
+        },
+        'resultados': {},
+    }
+    with tempfile.TemporaryDirectory() as directorio:
+        for tamanio in tamanios:
+            print(f'Midiendo {tamanio} jugadores...', file=sys.stderr)
+            # Los mensajes que imprimen los exportadores no se muestran ni se miden contra la consola
+            with redirect_stdout(io.StringIO()):
+                reporte['resultados'][str(tamanio)] = medir_tamanio(tamanio, directorio, repeticiones)
+    return reporte
+
+def comparar_reportes(anterior: dict, actual: dict, tolerancia: float = 0.2, diferencia_minima: float = 0.001) -> list[str]:
+    '''
+    Retorna una línea por operación medida en ambos reportes con el cociente entre los tiempos
+    (actual / anterior, con el mejor tiempo) y marca las que empeoraron más que la tolerancia.
+    Las diferencias menores a 'diferencia_minima' segundos se consideran ruido y no se marcan.
+    '''
+    lineas = []
+    for tamanio, operaciones in actual['resultados'].items():
+        anteriores = anterior['resultados'].get(tamanio, {})
+        for operacion, medicion in operaciones.items():
+            if operacion not in anteriores:
+                continue
+            cociente = medicion['mejor_s'] / anteriores[operacion]['mejor_s'] if anteriores[operacion]['mejor_s'] else float('inf')
+            empeoro = medicion['mejor_s'] - anteriores[operacion]['mejor_s'] > diferencia_minima
+            marca = '  REGRESION' if cociente > 1 + tolerancia and empeoro else ''
+            lineas.append(f'{tamanio:>9} {operacion:<42} {anteriores[operacion]["mejor_s"]:10.5f} s -> '
+                          f'{medicion["mejor_s"]:10.5f} s  x{cociente:.2f}{marca}')
+    return lineas
+
+def formatear_reporte(reporte: dict) -> str:
+    lineas = []
+    for tamanio, operaciones in reporte['resultados'].items():
+        for operacion, medicion in operaciones.items():
+            lineas.append(f'{tamanio:>9} {operacion:<42} mejor: {medicion["mejor_s"]:10.5f} s  mediana: {medicion["mediana_s"]:10.5f} s')
+    return '\n'.join(lineas)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Mide carga, búsquedas, ordenamientos y exportadores con rosters sintéticos')
+    parser.add_argument('--tamanios', type=int, nargs='+', default=list(TAMANIOS_POR_DEFECTO))
+    parser.add_argument('--repeticiones', '-r', type=int, default=5)
+    parser.add_argument('--salida', '-s', default='benchmark.json', help='Archivo JSON donde guardar el reporte')
+    parser.add_argument('--comparar', '-c', help='Reporte anterior contra el que comparar los tiempos')
+    parser.add_argument('--tolerancia', type=float, default=0.2, help='Empeoramiento relativo a partir del cual se marca una regresión')
+    argumentos = parser.parse_args()
+
+    reporte = ejecutar_benchmark(argumentos.tamanios, argumentos.repeticiones)
+    with open(argumentos.salida, 'w', encoding='utf-8') as archivo:
+        json.dump(reporte, archivo, ensure_ascii=False, indent=4)
+    if argumentos.comparar:
+        with open(argumentos.comparar, 'r', encoding='utf-8') as archivo:
+            lineas = comparar_reportes(json.load(archivo), reporte, argumentos.tolerancia)
+        print('\n'.join(lineas))
+        if any(linea.endswith('REGRESION') for linea in lineas):
+            sys.exit(1)
+    else:
+        print(formatear_reporte(reporte))
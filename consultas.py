@@ -0,0 +1,333 @@
+'''
+Consultas sobre los jugadores de un Equipo escritas como expresiones de Python, por ejemplo:
+
+    posicion == 'Base' and promedio_asistencias_por_partido > 10 and hall_of_fame
+    robos_totales + bloqueos_totales >= 3000 or logro('MVP de las Finales')
+    posicion in ('Ala-Pivot', 'Pivot') and 'malone' in nombre and not 10 <= temporadas < 15
+
+Nombres disponibles: nombre, posicion, los doce apartados estadísticos (con o sin 'get_'),
+hall_of_fame y la función logro('texto'), que usa el mismo criterio que Equipo.jugadores_con_logro.
+'texto' in nombre no distingue mayúsculas ni acentos. Las comparaciones con un valor faltante dan False.
+'''
+import ast
+import functools
+import operator
+from estadisticas import normalizar_apartado
+from indices import normalizar_texto, LOGRO_HALL_OF_FAME
+
+_COMPARADORES = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt,
+    ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge,
+}
+_OPUESTOS = {ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE, ast.Eq: ast.Eq}
+_ARITMETICOS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+
+class AccesoIndice:
+    '''
+    Describe cómo resolver una condición con un índice del equipo en lugar de recorrerlo.
+
+    tipo es 'posicion' (argumentos: conjunto de posiciones), 'nombre' (texto contenido),
+    'logro' (texto del logro y si se busca exacto) o 'rango' (campo, minimo, incluye_minimo, maximo, incluye_maximo).
+    '''
+    def __init__(self, tipo: str, *argumentos) -> None:
+        self.tipo = tipo
+        self.argumentos = argumentos
+
+    def contar(self, equipo) -> int:
+        '''
+        Retorna cuántos jugadores cumplen la condición sin armar la lista.
+        '''
+        if self.tipo == 'posicion':
+            return equipo.indice_posiciones.contar(*self.argumentos[0])
+        if self.tipo == 'nombre':
+            return len(equipo.indice_nombres.buscar_subcadena(self.argumentos[0]))
+        if self.tipo == 'logro':
+            return equipo.indice_logros.contar(*self.argumentos)
+        campo, *limites = self.argumentos
+        return equipo.indice_estadistica(campo).contar(*limites)
+
+    def candidatos(self, equipo) -> list:
+        '''
+        Retorna los jugadores que cumplen la condición, en el orden del equipo.
+        '''
+        if self.tipo == 'posicion':
+            return equipo.indice_posiciones.buscar(*self.argumentos[0])
+        if self.tipo == 'nombre':
+            return equipo.indice_nombres.buscar_subcadena(self.argumentos[0])
+        if self.tipo == 'logro':
+            return equipo.indice_logros.buscar(*self.argumentos)
+        campo, *limites = self.argumentos
+        jugadores = equipo.lista_jugadores
+        return [jugadores[fila] for fila in equipo.indice_estadistica(campo).rango(*limites)]
+
+    def __repr__(self) -> str:
+        if self.tipo == 'rango':
+            campo, minimo, incluye_minimo, maximo, incluye_maximo = self.argumentos
+            desde = '' if minimo is None else f'{minimo} {"<=" if incluye_minimo else "<"} '
+            hasta = '' if maximo is None else f' {"<=" if incluye_maximo else "<"} {maximo}'
+            return f'índice ordenado de {campo}: {desde}{campo}{hasta}'
+        return f'índice de {self.tipo}: {self.argumentos[0]!r}'
+
+class Condicion:
+    '''
+    Una de las condiciones unidas por 'and' en el nivel superior de la consulta:
+    su función compilada y, si la tiene, la forma de resolverla con un índice.
+    '''
+    def __init__(self, texto: str, evaluar, acceso: AccesoIndice = None) -> None:
+        self.texto = texto
+        self.evaluar = evaluar
+        self.acceso = acceso
+
+class Consulta:
+    '''
+    Consulta compilada. Las condiciones se compilan una sola vez a funciones de Python.
+    Al ejecutarla se cuenta cuántos jugadores deja cada condición con índice, se arma la
+    lista de candidatos solo con la más selectiva y las demás se evalúan sobre esos candidatos.
+    Sin condiciones con índice se recorre todo el equipo.
+    '''
+    def __init__(self, texto: str, condiciones: list[Condicion]) -> None:
+        self.texto = texto
+        self.condiciones = condiciones
+
+    def __planificar(self, equipo) -> tuple:
+        '''
+        Retorna (condición elegida o None, cantidad de candidatos, condiciones restantes).
+        '''
+        elegida, cantidad = None, len(equipo.lista_jugadores)
+        for condicion in self.condiciones:
+            if condicion.acceso is not None:
+                cantidad_condicion = condicion.acceso.contar(equipo)
+                if elegida is None or cantidad_condicion < cantidad:
+                    elegida, cantidad = condicion, cantidad_condicion
+                if not cantidad:
+                    break
+        return elegida, cantidad, [condicion for condicion in self.condiciones if condicion is not elegida]
+
+    def ejecutar(self, equipo) -> list:
+        '''
+        Retorna los jugadores del equipo que cumplen la consulta, en el orden del equipo.
+        '''
+        elegida, cantidad, restantes = self.__planificar(equipo)
+        if not cantidad:
+            return []
+        candidatos = equipo.lista_jugadores if elegida is None else elegida.acceso.candidatos(equipo)
+        if not restantes:
+            return list(candidatos)
+        evaluar = _todas([condicion.evaluar for condicion in restantes])
+        return [jugador for jugador in candidatos if evaluar(jugador, equipo)]
+
+    def explicar(self, equipo) -> str:
+        '''
+        Describe el plan que se usaría con el equipo recibido.
+        '''
+        elegida, cantidad, restantes = self.__planificar(equipo)
+        if elegida is None:
+            lineas = [f'recorrido completo de {cantidad} jugadores']
+        else:
+            lineas = [f'{elegida.acceso} -> {cantidad} candidatos']
+        lineas += [f'filtro: {condicion.texto}' for condicion in restantes]
+        return '\n'.join(lineas)
+
+def _todas(partes: list):
+    if len(partes) == 1:
+        return partes[0]
+    primera, resto = partes[0], _todas(partes[1:])
+    return lambda jugador, equipo: primera(jugador, equipo) and resto(jugador, equipo)
+
+def _alguna(partes: list):
+    if len(partes) == 1:
+        return partes[0]
+    primera, resto = partes[0], _alguna(partes[1:])
+    return lambda jugador, equipo: primera(jugador, equipo) or resto(jugador, equipo)
+
+def _obtener_campo(nombre: str):
+    '''
+    Retorna la función que obtiene el valor de un nombre de la expresión para un jugador.
+    '''
+    if nombre in ('nombre', 'posicion'):
+        obtener = operator.attrgetter(nombre)
+        return lambda jugador, equipo: obtener(jugador)
+    if nombre == 'hall_of_fame':
+        return lambda jugador, equipo: equipo.indice_logros.tiene_logro(jugador, LOGRO_HALL_OF_FAME)
+    try:
+        campo = normalizar_apartado(nombre)
+    except ValueError:
+        raise ValueError(f'Nombre desconocido en la consulta: {nombre}') from None
+    obtener = operator.attrgetter(f'estadistica.get_{campo}')
+    return lambda jugador, equipo: obtener(jugador)
+
+def _constante(nodo):
+    '''
+    Retorna el valor de un nodo constante (o tupla/lista de constantes), o lanza ValueError.
+    '''
+    if isinstance(nodo, ast.Constant) and isinstance(nodo.value, (str, int, float, bool)):
+        return nodo.value
+    if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, ast.USub):
+        valor = _constante(nodo.operand)
+        if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+            return -valor
+    if isinstance(nodo, (ast.Tuple, ast.List, ast.Set)):
+        return tuple(_constante(elemento) for elemento in nodo.elts)
+    raise ValueError(f'Se esperaba un valor constante: {ast.unparse(nodo)}')
+
+def _es_constante(nodo) -> bool:
+    try:
+        _constante(nodo)
+        return True
+    except ValueError:
+        return False
+
+def _es_numero(valor) -> bool:
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+def _compilar(nodo):
+    '''
+    Compila un nodo del árbol de la expresión a una función (jugador, equipo) -> valor.
+    '''
+    if _es_constante(nodo):
+        valor = _constante(nodo)
+        return lambda jugador, equipo: valor
+    if isinstance(nodo, ast.Name):
+        return _obtener_campo(nodo.id)
+    if isinstance(nodo, ast.Call):
+        if not (isinstance(nodo.func, ast.Name) and nodo.func.id == 'logro' and len(nodo.args) == 1
+                and not nodo.keywords and _es_constante(nodo.args[0]) and isinstance(_constante(nodo.args[0]), str)):
+            raise ValueError(f'Función no soportada en la consulta: {ast.unparse(nodo)}')
+        texto = _constante(nodo.args[0])
+        return lambda jugador, equipo: equipo.indice_logros.coincide_con_busqueda(jugador, texto)
+    if isinstance(nodo, ast.BoolOp):
+        partes = [_compilar(valor) for valor in nodo.values]
+        return _todas(partes) if isinstance(nodo.op, ast.And) else _alguna(partes)
+    if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, ast.Not):
+        operando = _compilar(nodo.operand)
+        return lambda jugador, equipo: not operando(jugador, equipo)
+    if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, ast.USub):
+        operando = _compilar(nodo.operand)
+        return lambda jugador, equipo: None if (valor := operando(jugador, equipo)) is None else -valor
+    if isinstance(nodo, ast.BinOp) and type(nodo.op) in _ARITMETICOS:
+        izquierda, derecha, operar = _compilar(nodo.left), _compilar(nodo.right), _ARITMETICOS[type(nodo.op)]
+        def aritmetica(jugador, equipo):
+            try:
+                return operar(izquierda(jugador, equipo), derecha(jugador, equipo))
+            except (TypeError, ZeroDivisionError):
+                return None
+        return aritmetica
+    if isinstance(nodo, ast.Compare):
+        operandos = [nodo.left] + nodo.comparators
+        return _todas([_compilar_comparacion(operador, *operandos[i:i + 2]) for i, operador in enumerate(nodo.ops)])
+    raise ValueError(f'Expresión no soportada en la consulta: {ast.unparse(nodo)}')
+
+def _compilar_comparacion(operador, izquierda_nodo, derecha_nodo):
+    '''
+    Compila una comparación entre dos operandos. Si el de la derecha es constante se usa
+    directamente en la función compilada en lugar de evaluarlo para cada jugador.
+    '''
+    izquierda = _compilar(izquierda_nodo)
+    if isinstance(operador, (ast.In, ast.NotIn)):
+        negar = isinstance(operador, ast.NotIn)
+        if isinstance(derecha_nodo, ast.Name) and derecha_nodo.id == 'nombre' and _es_constante(izquierda_nodo):
+            texto = normalizar_texto(str(_constante(izquierda_nodo)))
+            return lambda jugador, equipo: (jugador.nombre is not None and texto in normalizar_texto(jugador.nombre)) != negar
+        derecha = _compilar(derecha_nodo)
+        def pertenece(jugador, equipo):
+            try:
+                return (izquierda(jugador, equipo) in derecha(jugador, equipo)) != negar
+            except TypeError:
+                return negar
+        return pertenece
+    if type(operador) not in _COMPARADORES:
+        raise ValueError(f'Operador no soportado en la consulta: {type(operador).__name__}')
+    comparar = _COMPARADORES[type(operador)]
+    if _es_constante(derecha_nodo):
+        valor = _constante(derecha_nodo)
+        def comparar_con_constante(jugador, equipo):
+            try:
+                return comparar(izquierda(jugador, equipo), valor)
+            except TypeError:
+                return False
+        return comparar_con_constante
+    derecha = _compilar(derecha_nodo)
+    def comparar_operandos(jugador, equipo):
+        try:
+            return comparar(izquierda(jugador, equipo), derecha(jugador, equipo))
+        except TypeError:
+            return False
+    return comparar_operandos
+
+def _campo_estadistico(nodo) -> str:
+    if isinstance(nodo, ast.Name):
+        try:
+            return normalizar_apartado(nodo.id)
+        except ValueError:
+            return None
+    return None
+
+def _acceso_rango(nodo: ast.Compare) -> AccesoIndice:
+    '''
+    Rangos sobre un apartado: campo > 10, 10 <= campo, 10 < campo <= 20, campo == 5.
+    '''
+    operandos = [nodo.left] + nodo.comparators
+    campo = None
+    minimo, incluye_minimo, maximo, incluye_maximo = None, True, None, True
+    for i, operador in enumerate(nodo.ops):
+        izquierda, derecha = operandos[i:i + 2]
+        operador = type(operador)
+        if operador not in _OPUESTOS:
+            return None
+        if _campo_estadistico(izquierda) and _es_constante(derecha):
+            campo_actual, valor = _campo_estadistico(izquierda), _constante(derecha)
+        elif _campo_estadistico(derecha) and _es_constante(izquierda):
+            campo_actual, valor = _campo_estadistico(derecha), _constante(izquierda)
+            operador = _OPUESTOS[operador]
+        else:
+            return None
+        if campo not in (None, campo_actual) or not _es_numero(valor):
+            return None
+        campo = campo_actual
+        # Con varios límites del mismo lado se queda el más restrictivo
+        if operador in (ast.Gt, ast.GtE, ast.Eq) and (minimo is None or valor >= minimo):
+            incluye = operador is not ast.Gt and (valor != minimo or incluye_minimo)
+            minimo, incluye_minimo = valor, incluye
+        if operador in (ast.Lt, ast.LtE, ast.Eq) and (maximo is None or valor <= maximo):
+            incluye = operador is not ast.Lt and (valor != maximo or incluye_maximo)
+            maximo, incluye_maximo = valor, incluye
+    return AccesoIndice('rango', campo, minimo, incluye_minimo, maximo, incluye_maximo)
+
+def _acceso_indice(nodo) -> AccesoIndice:
+    '''
+    Retorna cómo resolver la condición con un índice, o None si hay que evaluarla jugador por jugador.
+    '''
+    if isinstance(nodo, ast.Name) and nodo.id == 'hall_of_fame':
+        return AccesoIndice('logro', LOGRO_HALL_OF_FAME, True)
+    if isinstance(nodo, ast.Call):
+        return AccesoIndice('logro', _constante(nodo.args[0]), False)
+    if not isinstance(nodo, ast.Compare):
+        return None
+    if len(nodo.ops) == 1:
+        izquierda, derecha, operador = nodo.left, nodo.comparators[0], type(nodo.ops[0])
+        # Los textos de menos de tres letras no tienen trigramas y el índice de nombres los compara con todos
+        if (operador is ast.In and isinstance(derecha, ast.Name) and derecha.id == 'nombre' and _es_constante(izquierda)
+                and len(normalizar_texto(str(_constante(izquierda)))) >= 3):
+            return AccesoIndice('nombre', str(_constante(izquierda)))
+        if operador is ast.Eq and isinstance(derecha, ast.Name) and derecha.id == 'posicion':
+            izquierda, derecha = derecha, izquierda
+        if isinstance(izquierda, ast.Name) and izquierda.id == 'posicion' and _es_constante(derecha):
+            valor = _constante(derecha)
+            if operador is ast.Eq:
+                return AccesoIndice('posicion', {valor})
+            if operador is ast.In and isinstance(valor, tuple):
+                return AccesoIndice('posicion', set(valor))
+    return _acceso_rango(nodo)
+
+@functools.lru_cache(maxsize=256)
+def compilar_consulta(texto: str) -> Consulta:
+    '''
+    Compila el texto de una consulta. Los planes compilados se guardan, por lo que repetir
+    una consulta no vuelve a analizarla. Lanza ValueError si la expresión no es válida.
+    '''
+    try:
+        arbol = ast.parse(texto.strip(), mode='eval').body
+    except SyntaxError as error:
+        raise ValueError(f'Consulta inválida: {error.msg}') from None
+    partes = arbol.values if isinstance(arbol, ast.BoolOp) and isinstance(arbol.op, ast.And) else [arbol]
+    return Consulta(texto, [Condicion(ast.unparse(parte), _compilar(parte), _acceso_indice(parte)) for parte in partes])
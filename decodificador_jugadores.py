@@ -0,0 +1,262 @@
+import functools
+import math
+from typing import Iterable
+from jugador import Jugador
+from estadisticas import CAMPOS_ESTADISTICOS, CAMPOS_ENTEROS
+from snapshot import sin_recolector_de_basura
+
+# Esquema declarado de cada jugador del archivo: (campo, tipo). Todos son obligatorios salvo 'logros'.
+ESQUEMA_JUGADOR = (('nombre', str), ('posicion', str))
+ESQUEMA_ESTADISTICAS = tuple((campo, int if campo in CAMPOS_ENTEROS else float) for campo in CAMPOS_ESTADISTICOS)
+_TIPOS_ESTADISTICAS = tuple(tipo for _, tipo in ESQUEMA_ESTADISTICAS)
+_NOMBRES_TIPOS = {str: 'un texto', int: 'un entero', float: 'un número'}
+_MAXIMO_ERRORES_EN_MENSAJE = 20
+
+class ErrorDecodificacion(ValueError):
+    '''
+    Errores encontrados al validar los jugadores de un roster. Se informan todos juntos.
+
+    Atributos:
+        errores (list[tuple[int, str, str]]): (índice del jugador, campo, mensaje) de cada error.
+    '''
+    def __init__(self, errores: list[tuple[int, str, str]]) -> None:
+        self.errores = errores
+        lineas = [f'jugador {indice}{", " + campo if campo else ""}: {mensaje}'
+                  for indice, campo, mensaje in errores[:_MAXIMO_ERRORES_EN_MENSAJE]]
+        if len(errores) > _MAXIMO_ERRORES_EN_MENSAJE:
+            lineas.append(f'... y {len(errores) - _MAXIMO_ERRORES_EN_MENSAJE} errores más')
+        super().__init__(f'Jugadores inválidos en el roster ({len(errores)} errores):\n' + '\n'.join(lineas))
+
+def convertir_valor(valor, tipo: type):
+    '''
+    Convierte un valor del archivo al tipo del esquema: acepta enteros escritos como 52.0 o '52'
+    y números escritos como texto. Lanza ValueError con el motivo si no se puede.
+    '''
+    if tipo is str:
+        if not isinstance(valor, str) or not valor:
+            raise ValueError(f'se esperaba {_NOMBRES_TIPOS[tipo]} no vacío y se recibió {valor!r}')
+        return valor
+    if isinstance(valor, bool) or not isinstance(valor, (int, float, str)):
+        raise ValueError(f'se esperaba {_NOMBRES_TIPOS[tipo]} y se recibió {valor!r}')
+    try:
+        numero = float(valor) if isinstance(valor, str) else valor
+    except ValueError:
+        raise ValueError(f'se esperaba {_NOMBRES_TIPOS[tipo]} y se recibió {valor!r}') from None
+    if not math.isfinite(numero):
+        raise ValueError(f'se esperaba {_NOMBRES_TIPOS[tipo]} y se recibió {valor!r}')
+    if tipo is int:
+        if numero != int(numero):
+            raise ValueError(f'se esperaba {_NOMBRES_TIPOS[tipo]} y se recibió {valor!r}')
+        return int(numero)
+    return float(numero)
+
+def _validar_estadisticas(estadisticas: dict, indice: int, errores: list) -> dict:
+    # Caso habitual: todos los valores ya tienen el tipo del esquema y se comprueban de una vez
+    if tuple(map(type, map(estadisticas.get, CAMPOS_ESTADISTICOS))) == _TIPOS_ESTADISTICAS:
+        return estadisticas
+    resultado = dict(estadisticas)
+    for campo, tipo in ESQUEMA_ESTADISTICAS:
+        if campo not in estadisticas:
+            errores.append((indice, f'estadisticas.{campo}', 'falta el campo'))
+            continue
+        try:
+            resultado[campo] = convertir_valor(estadisticas[campo], tipo)
+        except ValueError as error:
+            errores.append((indice, f'estadisticas.{campo}', str(error)))
+    return resultado
+
+def validar_jugador(diccionario, indice: int, errores: list) -> dict:
+    '''
+    Valida un jugador campo por campo. Retorna el diccionario con los valores convertidos a los
+    tipos del esquema, o None si tiene errores (que se agregan a 'errores').
+    '''
+    if not isinstance(diccionario, dict):
+        errores.append((indice, '', f'se esperaba un objeto y se recibió {diccionario!r}'))
+        return None
+    cantidad_errores = len(errores)
+    resultado = {}
+    for campo, tipo in ESQUEMA_JUGADOR:
+        valor = diccionario.get(campo)
+        # Casi todos los valores ya tienen el tipo del esquema: solo se convierten los demás
+        if type(valor) is tipo and valor:
+            resultado[campo] = valor
+        elif campo not in diccionario:
+            errores.append((indice, campo, 'falta el campo'))
+        else:
+            try:
+                resultado[campo] = convertir_valor(valor, tipo)
+            except ValueError as error:
+                errores.append((indice, campo, str(error)))
+
+    logros = diccionario.get('logros')
+    if logros is None:
+        resultado['logros'] = []
+    elif not isinstance(logros, list) or not all(isinstance(logro, str) for logro in logros):
+        errores.append((indice, 'logros', f'se esperaba una lista de textos y se recibió {logros!r}'))
+    else:
+        resultado['logros'] = logros
+
+    estadisticas = diccionario.get('estadisticas')
+    if not isinstance(estadisticas, dict):
+        errores.append((indice, 'estadisticas', 'falta el campo' if estadisticas is None else f'se esperaba un objeto y se recibió {estadisticas!r}'))
+    else:
+        resultado['estadisticas'] = _validar_estadisticas(estadisticas, indice, errores)
+    return resultado if len(errores) == cantidad_errores else None
+
+def _expresion_construccion(clase_jugador: type) -> str:
+    '''
+    Retorna la expresión que arma el objeto a partir de las variables ya validadas. Si la clase tiene
+    el constructor desde_valores se usa ese (y el de su clase_estadistica); si no, su constructor
+    habitual con un diccionario. Sin clase se arma la tupla de decodificar_valores.
+    '''
+    variables = ', '.join(f'v_{campo}' for campo in CAMPOS_ESTADISTICOS)
+    if clase_jugador is None:
+        return f'(nombre, posicion, logros, ({variables}))'
+    if hasattr(clase_jugador, 'desde_valores') and hasattr(clase_jugador, 'clase_estadistica'):
+        return f'construir_jugador(nombre, posicion, logros, construir_estadistica({variables}))'
+    estadisticas = ', '.join(f"'{campo}': v_{campo}" for campo in CAMPOS_ESTADISTICOS)
+    return f"clase_jugador({{'nombre': nombre, 'posicion': posicion, 'logros': logros, 'estadisticas': {{{estadisticas}}}}})"
+
+def _codigo_decodificacion(rechazar: list[str], aceptar: list[str], construccion: str) -> list[str]:
+    '''
+    Retorna las líneas que leen y comprueban un jugador según el esquema. Si algo no coincide
+    exactamente se ejecuta 'rechazar'; si no, 'aceptar' con la expresión de construcción.
+    '''
+    lineas = [
+        'try:',
+        "    nombre = diccionario['nombre']",
+        "    posicion = diccionario['posicion']",
+        "    logros = diccionario.get('logros')",
+        "    estadisticas = diccionario['estadisticas']",
+        *(f"    v_{campo} = estadisticas['{campo}']" for campo in CAMPOS_ESTADISTICOS),
+        'except (KeyError, TypeError, AttributeError):',
+        *(f'    {linea}' for linea in rechazar),
+        'if logros is None:',
+        '    logros = []',
+        'if (type(nombre) is not str or type(posicion) is not str or not nombre or not posicion or type(logros) is not list',
+        *(f'        or type(v_{campo}) is not int' for campo, tipo in ESQUEMA_ESTADISTICAS if tipo is int),
+        '        ):',
+        *(f'    {linea}' for linea in rechazar),
+    ]
+    # Un número entero en un campo decimal (por ejemplo 100 en un porcentaje) se convierte sin pasar por validar
+    for campo, tipo in ESQUEMA_ESTADISTICAS:
+        if tipo is float:
+            lineas += [
+                f'if type(v_{campo}) is not float:',
+                f'    if type(v_{campo}) is not int:',
+                *(f'        {linea}' for linea in rechazar),
+                f'    v_{campo} = float(v_{campo})',
+            ]
+    lineas += [
+        'for logro in logros:',
+        '    if type(logro) is not str:',
+        '        break',
+        'else:',
+        *(f'    {linea.format(construccion)}' for linea in aceptar),
+        *rechazar,
+    ]
+    return lineas
+
+@functools.lru_cache(maxsize=None)
+def _generar_decodificadores(clase_jugador: type) -> tuple:
+    '''
+    Genera a partir del esquema las dos funciones de crear_decodificador y crear_decodificador_roster
+    para 'clase_jugador'. Los tipos se reciben como argumentos por defecto para leerlos como
+    variables locales.
+    '''
+    construccion = _expresion_construccion(clase_jugador)
+    locales = 'type=type, str=str, int=int, float=float, list=list'
+    lineas = [
+        f'def decodificar(diccionario, indice, errores, {locales}):',
+        *(f'    {linea}' for linea in _codigo_decodificacion(['return validar(diccionario, indice, errores)'], ['return {}'], construccion)),
+        '',
+        # El roster completo se arma en el mismo ciclo, sin una llamada a decodificar por jugador
+        f'def decodificar_roster(diccionarios, errores, {locales}):',
+        '    jugadores = []',
+        '    agregar = jugadores.append',
+        '    for indice, diccionario in enumerate(diccionarios):',
+        *(f'        {linea}' for linea in _codigo_decodificacion(['agregar(validar(diccionario, indice, errores))', 'continue'],
+                                                              ['agregar({})', 'continue'], construccion)),
+        '    return jugadores',
+    ]
+
+    def validar(diccionario, indice, errores):
+        valores = validar_jugador(diccionario, indice, errores)
+        return None if valores is None else decodificar(valores, indice, errores)
+
+    espacio = {'validar': validar, 'clase_jugador': clase_jugador}
+    if hasattr(clase_jugador, 'desde_valores') and hasattr(clase_jugador, 'clase_estadistica'):
+        espacio['construir_jugador'] = clase_jugador.desde_valores
+        espacio['construir_estadistica'] = clase_jugador.clase_estadistica.desde_valores
+    exec(compile('\n'.join(lineas), f'<decodificador {getattr(clase_jugador, "__qualname__", "valores")}>', 'exec'), espacio)
+    decodificar = espacio['decodificar']
+    return decodificar, espacio['decodificar_roster']
+
+def crear_decodificador(clase_jugador: type = Jugador):
+    '''
+    Retorna una función decodificar(diccionario, indice, errores), generada a partir del esquema, que
+    arma un jugador de 'clase_jugador' en una sola pasada: lee cada campo una vez, comprueba su tipo
+    y llama al constructor desde_valores. Si algo no coincide exactamente con el esquema el jugador
+    se valida campo por campo (convirtiendo los tipos cuando se puede); si tiene errores se agregan
+    a 'errores' y se retorna None. Las funciones generadas se guardan por clase.
+    '''
+    return _generar_decodificadores(clase_jugador)[0]
+
+def crear_decodificador_roster(clase_jugador: type = Jugador):
+    '''
+    Igual que crear_decodificador, pero la función generada, decodificar_roster(diccionarios, errores),
+    arma la lista con todos los jugadores de una vez. Con clase_jugador=None arma las tuplas de
+    decodificar_valores.
+    '''
+    return _generar_decodificadores(clase_jugador)[1]
+
+def decodificar_jugador(diccionario: dict, clase_jugador: type = Jugador, indice: int = 0):
+    '''
+    Arma un solo jugador. Lanza ErrorDecodificacion con todos sus errores si no cumple el esquema.
+    '''
+    errores = []
+    jugador = crear_decodificador(clase_jugador)(diccionario, indice, errores)
+    if errores:
+        raise ErrorDecodificacion(errores)
+    return jugador
+
+def decodificar_jugadores(diccionarios: Iterable[dict], clase_jugador: type = Jugador) -> list:
+    '''
+    Arma todos los jugadores de un roster. Valida a todos antes de retornar: si alguno no cumple
+    el esquema lanza ErrorDecodificacion con los errores de todos los jugadores y su índice.
+    '''
+    decodificar_roster = crear_decodificador_roster(clase_jugador)
+    errores = []
+    # Los jugadores no forman ciclos: el recolector solo recorrería objetos vivos una y otra vez
+    with sin_recolector_de_basura():
+        jugadores = decodificar_roster(diccionarios, errores)
+    if errores:
+        raise ErrorDecodificacion(errores)
+    return jugadores
+
+def decodificar_valores(diccionarios: Iterable[dict]) -> list[tuple]:
+    '''
+    Valida un roster igual que decodificar_jugadores pero en lugar de objetos retorna una tupla
+    (nombre, posicion, logros, estadísticas en el orden de CAMPOS_ESTADISTICOS) por jugador.
+    Las tuplas se serializan mucho más rápido que los objetos para pasarlas entre procesos;
+    construir_jugadores arma los jugadores a partir de ellas.
+    '''
+    errores = []
+    valores = crear_decodificador_roster(None)(diccionarios, errores)
+    if errores:
+        raise ErrorDecodificacion(errores)
+    return valores
+
+def construir_jugadores(valores: Iterable[tuple], clase_jugador: type = Jugador) -> list:
+    '''
+    Arma los jugadores de 'clase_jugador' a partir de las tuplas ya validadas de decodificar_valores.
+    '''
+    with sin_recolector_de_basura():
+        if hasattr(clase_jugador, 'desde_valores') and hasattr(clase_jugador, 'clase_estadistica'):
+            construir_jugador = clase_jugador.desde_valores
+            construir_estadistica = clase_jugador.clase_estadistica.desde_valores
+            return [construir_jugador(nombre, posicion, logros, construir_estadistica(*estadisticas))
+                    for nombre, posicion, logros, estadisticas in valores]
+        return [clase_jugador({'nombre': nombre, 'posicion': posicion, 'logros': logros,
+                               'estadisticas': dict(zip(CAMPOS_ESTADISTICOS, estadisticas))})
+                for nombre, posicion, logros, estadisticas in valores]
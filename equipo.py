@@ -1,17 +1,212 @@
+import heapq
 import json
 import re
-from jugador import Jugador
+from typing import Callable, Iterator
+from jugador import Jugador, JugadorCompacto
+from lector_jugadores import generar_jugadores
+from decodificador_jugadores import decodificar_jugadores
+from estadisticas_columnares import TablaEstadisticas, EstadisticaFila
+from ordenamiento import ordenar_jugadores, clave_suma_estadisticas
+from equipo_sqlite import exportar_equipo_sqlite, actualizar_equipo_sqlite
+from seguimiento_cambios import Cambios, calcular_hashes, detectar_cambios, hash_jugador, exportar_delta_csv, exportar_delta_ndjson
+from exportador_csv import exportar_roster_csv
+from snapshot import cargar_snapshot, guardar_snapshot
+from indice_offsets import LectorRoster
+from indices import IndiceNombres, IndiceNombresAproximado, IndiceLogros, IndicePosiciones, IndiceEstadistica, LOGRO_HALL_OF_FAME
+from estadisticas import normalizar_apartado
+from consultas import compilar_consulta
+from instrumentacion import instrumentar
 import copy
 
 class Equipo:
-    def __init__(self) -> None:
-        self.ruta = 'dream_team.json'
-        self.lista_jugadores = self.crear_lista_jugadores()
+    @instrumentar
+    def __init__(self, ruta: str = 'dream_team.json', lazy: bool = False, columnar: bool = False,
+                 compacto: bool = False, usar_snapshot: bool = False) -> None:
+        '''
+        Recibe:
+            ruta (str): Ruta del archivo JSON del equipo.
+            lazy (bool): Si es True los jugadores se leen del archivo a medida que se consultan
+                         en lugar de construirse todos al crear el equipo.
+            columnar (bool): Si es True las estadísticas se guardan en una TablaEstadisticas
+                             por columnas en lugar de un objeto Estadistica por jugador.
+            compacto (bool): Si es True los jugadores se construyen como JugadorCompacto.
+            usar_snapshot (bool): Si es True (y no es lazy) los jugadores se leen del snapshot binario
+                                  guardado junto al archivo cuando está actualizado, y se lo genera si no.
+        '''
+        self.ruta = ruta
+        self.usar_snapshot = usar_snapshot
+        self.clase_jugador = JugadorCompacto if compacto else Jugador
+        self.tabla_estadisticas = None
+        # Jugador de cada fila de la tabla columnar (None en las filas borradas)
+        self.__jugadores_por_fila = []
+        # Aumenta cada vez que cambian los jugadores; sirve para invalidar resultados guardados afuera
+        self.version = 0
+        self.__indice_nombres = None
+        self.__indice_aproximado = None
+        self.__indice_logros = None
+        self.__cache_extremos = {}
+        self.__hashes = None
+        self.__indices_consultas = (None, {})
+        self.__lector_roster = None
+        self.__jugadores_pendientes = None
+        # Jugadores decodificados por obtener_jugador antes de que la lectura secuencial llegue a ellos
+        self.__jugadores_adelantados = {}
+        if lazy:
+            self.__lista_jugadores = []
+            self.__jugadores_pendientes = generar_jugadores(self.ruta, clase_jugador=self.clase_jugador)
+        else:
+            self.__lista_jugadores = self.cargar_lista_jugadores()
+            self.__indice_logros = IndiceLogros(self.__lista_jugadores)
+        if columnar:
+            self.usar_tabla_columnar()
     
+    @property
+    def lista_jugadores(self) -> list[Jugador]:
+        '''
+        Retorna la lista completa de jugadores. En modo lazy termina de leer el archivo
+        la primera vez que se la pide.
+        '''
+        if self.__jugadores_pendientes is not None:
+            self.__lista_jugadores.extend(self.__jugadores_pendientes)
+            self.__jugadores_pendientes = None
+            for indice, jugador in self.__jugadores_adelantados.items():
+                if indice < len(self.__lista_jugadores):
+                    self.__lista_jugadores[indice] = jugador
+            self.__jugadores_adelantados = {}
+        return self.__lista_jugadores
+
+    @lista_jugadores.setter
+    def lista_jugadores(self, lista_jugadores: list[Jugador]):
+        self.__jugadores_pendientes = None
+        self.__jugadores_adelantados = {}
+        self.__lista_jugadores = lista_jugadores
+        self.version += 1
+        self.__indice_nombres = None
+        self.__indice_aproximado = None
+        self.__indice_logros = None
+        self.__cache_extremos = {}
+        if self.tabla_estadisticas is not None:
+            self.usar_tabla_columnar()
+
+    @property
+    def indice_nombres(self) -> IndiceNombres:
+        '''
+        Índice de nombres del equipo. Se construye la primera vez que se lo pide.
+        '''
+        if self.__indice_nombres is None:
+            self.__indice_nombres = IndiceNombres(self.lista_jugadores)
+        return self.__indice_nombres
+
+    @property
+    def indice_aproximado(self) -> IndiceNombresAproximado:
+        '''
+        Índice de nombres tolerante a errores de tipeo. Se construye la primera vez que se lo pide.
+        '''
+        if self.__indice_aproximado is None:
+            self.__indice_aproximado = IndiceNombresAproximado(self.lista_jugadores)
+        return self.__indice_aproximado
+
+    @property
+    def indice_logros(self) -> IndiceLogros:
+        '''
+        Índice invertido de logros del equipo. Se construye al cargar el equipo
+        (o la primera vez que se lo pide en modo lazy).
+        '''
+        if self.__indice_logros is None:
+            self.__indice_logros = IndiceLogros(self.lista_jugadores)
+        return self.__indice_logros
+
+    def __indice_para_consultas(self, clave, construir):
+        # Se construyen al consultar y se descartan en cuanto cambia la versión del equipo
+        version, indices = self.__indices_consultas
+        if version != self.version:
+            indices = {}
+            self.__indices_consultas = (self.version, indices)
+        if clave not in indices:
+            indices[clave] = construir()
+        return indices[clave]
+
+    @property
+    def indice_posiciones(self) -> IndicePosiciones:
+        '''
+        Jugadores agrupados por posición. Se construye la primera vez que se lo pide.
+        '''
+        return self.__indice_para_consultas('posicion', lambda: IndicePosiciones(self.lista_jugadores))
+
+    def indice_estadistica(self, apartado_estadistico: str) -> IndiceEstadistica:
+        '''
+        Retorna los valores del apartado ordenados, para resolver rangos sin recorrer el equipo.
+        Se construye la primera vez que se lo pide para cada apartado.
+        '''
+        campo = normalizar_apartado(apartado_estadistico)
+        return self.__indice_para_consultas(campo, lambda: IndiceEstadistica(self.lista_jugadores, f'get_{campo}'))
+
+    @instrumentar
+    def filtrar(self, consulta: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores que cumplen la consulta, en el orden del equipo. Por ejemplo:
+        equipo.filtrar("posicion == 'Base' and promedio_asistencias_por_partido > 10 and hall_of_fame")
+        Ver el módulo consultas para la sintaxis. Lanza ValueError si la consulta no es válida.
+        '''
+        return compilar_consulta(consulta).ejecutar(self)
+
+    def explicar_consulta(self, consulta: str) -> str:
+        '''
+        Retorna el plan con el que se resolvería la consulta: qué índice se usa y qué se filtra después.
+        '''
+        return compilar_consulta(consulta).explicar(self)
+
     @property #getter
     def get_lista_jugadores(self):
-        return self.__lista_jugadores
+        return self.lista_jugadores
+
+    def iterar_jugadores(self) -> Iterator[Jugador]:
+        '''
+        Recorre los jugadores del equipo. En modo lazy produce los que ya fueron leídos
+        y sigue leyendo el archivo a medida que se avanza, sin esperar a que termine.
+        '''
+        i = 0
+        while True:
+            if i < len(self.__lista_jugadores):
+                yield self.__lista_jugadores[i]
+                i += 1
+            elif self.__jugadores_pendientes is None:
+                return
+            else:
+                jugador = next(self.__jugadores_pendientes, None)
+                if jugador is None:
+                    self.__jugadores_pendientes = None
+                    self.__jugadores_adelantados = {}
+                    return
+                self.__lista_jugadores.append(self.__jugadores_adelantados.pop(i, jugador))
     
+    def obtener_jugador(self, indice: int) -> Jugador:
+        '''
+        Retorna el jugador que ocupa el índice recibido (empezando en 0).
+        En modo lazy, si ese jugador todavía no se leyó, se lo decodifica directamente del
+        archivo mapeado en memoria con el índice de offsets, sin leer los anteriores. Ese mismo
+        objeto es el que queda en lista_jugadores cuando la lectura llega a él, por lo que los
+        cambios que se le hagan y los índices que lo usen siguen valiendo.
+        '''
+        if self.__jugadores_pendientes is None or 0 <= indice < len(self.__lista_jugadores):
+            return self.__lista_jugadores[indice]
+        if self.__lector_roster is None:
+            self.__lector_roster = LectorRoster(self.ruta, self.clase_jugador)
+        if indice < 0:
+            indice += len(self.__lector_roster)
+            if 0 <= indice < len(self.__lista_jugadores):
+                return self.__lista_jugadores[indice]
+        jugador = self.__jugadores_adelantados.get(indice)
+        if jugador is None:
+            jugador = self.__jugadores_adelantados[indice] = self.__lector_roster[indice]
+        return jugador
+
+    def rutas_archivos(self) -> list[str]:
+        '''
+        Retorna los archivos de los que se leen los jugadores del equipo.
+        '''
+        return [self.ruta]
+
     def leer_archivo(self):
         try:
             with open(self.ruta, 'r', encoding='UTF-8') as archivo:
@@ -21,41 +216,203 @@ class Equipo:
             print("Error: Archivo no encontrado")
             return None
     
+    @instrumentar
+    def usar_tabla_columnar(self) -> TablaEstadisticas:
+        '''
+        Pasa las estadísticas de todos los jugadores a una TablaEstadisticas y reemplaza
+        la Estadistica de cada jugador por una vista de su fila en la tabla.
+        '''
+        tabla = TablaEstadisticas()
+        for jugador in self.lista_jugadores:
+            fila = tabla.agregar_fila(jugador.estadistica)
+            jugador.estadistica = EstadisticaFila(tabla, fila)
+        self.tabla_estadisticas = tabla
+        self.__jugadores_por_fila = list(self.lista_jugadores)
+        return tabla
+
+    @instrumentar
+    def exportar_sqlite(self, ruta_db: str, delta: bool = False) -> int:
+        '''
+        Exporta el equipo completo a una base SQLite normalizada que puede consultarse con EquipoSQLite.
+        Con delta=True solo se escriben los jugadores que cambiaron desde la exportación anterior
+        (ver equipo_sqlite.actualizar_equipo_sqlite). Retorna la cantidad de jugadores escritos.
+        '''
+        if delta:
+            cambios = actualizar_equipo_sqlite(self.lista_jugadores, ruta_db, self.hashes_por_nombre())
+            return len(cambios.pendientes)
+        return exportar_equipo_sqlite(self.iterar_jugadores(), ruta_db)
+
+    @instrumentar
+    def exportar_csv(self, path: str, columnas: list[str] = None, comprimir: bool = None, delta: bool = False) -> int:
+        '''
+        Exporta el equipo completo a CSV, una fila por jugador (ver exportador_csv.exportar_roster_csv).
+        Con delta=True solo se anexan los jugadores que cambiaron desde la exportación anterior
+        (ver seguimiento_cambios.exportar_delta_csv). Retorna la cantidad de jugadores escritos.
+        '''
+        if delta:
+            return len(exportar_delta_csv(path, self.lista_jugadores, columnas, self.hashes_por_nombre()).pendientes)
+        return exportar_roster_csv(path, self.iterar_jugadores(), columnas, comprimir)
+
+    @instrumentar
+    def exportar_ndjson(self, path: str) -> int:
+        '''
+        Anexa a un archivo NDJSON los jugadores que cambiaron desde la exportación anterior
+        (la primera vez, todos). Ver seguimiento_cambios.exportar_delta_ndjson.
+        '''
+        return len(exportar_delta_ndjson(path, self.lista_jugadores, self.hashes_por_nombre()).pendientes)
+
+    def clave_jugador(self, jugador: Jugador):
+        '''
+        Retorna lo que identifica al jugador al comparar el equipo con otra versión: su nombre.
+        '''
+        return jugador.nombre
+
+    def hashes_jugadores(self) -> dict:
+        '''
+        Retorna {clave del jugador: hash del contenido} de todos los jugadores (ver clave_jugador).
+        Se calcula una vez por versión del equipo.
+        '''
+        if self.__hashes is None or self.__hashes[0] != self.version:
+            self.__hashes = (self.version, calcular_hashes(self.lista_jugadores, self.clave_jugador))
+        return self.__hashes[1]
+
+    def hashes_por_nombre(self) -> dict[str, str]:
+        '''
+        Retorna {nombre: hash del contenido}, que es como identifican a cada jugador las exportaciones delta.
+        '''
+        return self.hashes_jugadores()
+
+    def detectar_cambios(self, hashes_anteriores: dict) -> Cambios:
+        '''
+        Compara el equipo con los hashes de otro momento (por ejemplo los de hashes_jugadores antes de un cambio).
+        '''
+        return detectar_cambios(self.lista_jugadores, hashes_anteriores, self.hashes_jugadores(), self.clave_jugador)
+
+    def cambios_respecto_de(self, jugadores: list[Jugador], clave: Callable[[Jugador], object] = None) -> Cambios:
+        '''
+        Compara otra versión del roster (por ejemplo la del archivo) con los jugadores cargados, sin modificar
+        el equipo. clave identifica a los jugadores recibidos y por defecto es clave_jugador.
+        Si el equipo cargado tiene claves repetidas no se puede saber a cuál corresponde cada jugador
+        recibido, y los cambios se marcan como completos para que aplicar_cambios reemplace la lista.
+        '''
+        jugadores = list(jugadores)
+        clave = clave or self.clave_jugador
+        cambios = detectar_cambios(jugadores, self.hashes_jugadores(), clave=clave)
+        if not cambios.completo and len(self.hashes_jugadores()) != len(self.lista_jugadores):
+            cambios.agregados, cambios.modificados, cambios.completo = jugadores, [], True
+        if cambios.completo and sorted(map(hash_jugador, jugadores)) == sorted(map(hash_jugador, self.lista_jugadores)):
+            # Mismo contenido: no hay nada que reemplazar
+            return Cambios([], [], [], cambios.hashes, clave)
+        return cambios
+
+    @instrumentar
+    def cargar_lista_jugadores(self) -> list[Jugador]:
+        '''
+        Retorna la lista de jugadores del archivo. Si el equipo usa snapshot la toma de él cuando
+        sigue vigente; si no, lee el JSON y actualiza el snapshot para el próximo inicio.
+        '''
+        if not self.usar_snapshot:
+            return self.crear_lista_jugadores()
+        lista_jugadores = cargar_snapshot(self.ruta, self.clase_jugador)
+        if lista_jugadores is None:
+            lista_jugadores = self.crear_lista_jugadores()
+            guardar_snapshot(self.ruta, lista_jugadores)
+        return lista_jugadores
+
     def crear_lista_jugadores(self):
         lista_jugadores = self.leer_archivo().get('jugadores')
-        lista_objetos_jugador = [Jugador(jugador) for jugador in lista_jugadores]
+        lista_objetos_jugador = decodificar_jugadores(lista_jugadores, self.clase_jugador)
         return lista_objetos_jugador
     
+    @instrumentar
     def mostrar_jugadores(self):
-        for jugador in self.lista_jugadores:
+        for jugador in self.iterar_jugadores():
            jugador.mostrar_nombre_y_posicion()
            
     def mostrar_estadisticas_jugadores(self):
         for jugador in self.lista_jugadores:
             jugador.mostrar_estadistica_jugador()        
             
-    def mostrar_logros_jugadores(self):
-        for jugador in self.lista_jugadores:
+    def mostrar_logros_jugadores(self, logro: str = None):
+        '''
+        Muestra los logros de todos los jugadores, o solo de los que tienen el logro recibido.
+        '''
+        jugadores = self.lista_jugadores if logro is None else self.jugadores_con_logro(logro)
+        for jugador in jugadores:
             jugador.mostrar_logros()
+
+    @instrumentar
+    def jugadores_con_logro(self, logro: str) -> list[Jugador]:
+        return self.indice_logros.buscar(logro)
+
+    def jugadores_con_todos_los_logros(self, *logros: str) -> list[Jugador]:
+        return self.indice_logros.interseccion(*logros)
+
+    def jugadores_con_algun_logro(self, *logros: str) -> list[Jugador]:
+        return self.indice_logros.union(*logros)
+
+    def es_hall_of_fame(self, jugador: Jugador) -> bool:
+        return self.indice_logros.tiene_logro(jugador, LOGRO_HALL_OF_FAME)
     
+    @instrumentar
     def imprimir_roster_con_indice(self):
         '''
         Recibe una instancia de la clase Equipo.
         Imprime por pantalla el nombre de cada jugador con un índice.
         '''
-        for i, jugador in enumerate(self.lista_jugadores, start=1):
+        for i, jugador in enumerate(self.iterar_jugadores(), start=1):
             print(f'{i}) {jugador.nombre}')
     
+    @instrumentar
+    def buscar(self, nombre: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores cuyo nombre contiene el texto recibido, sin distinguir mayúsculas ni acentos.
+        '''
+        return self.indice_nombres.buscar_subcadena(nombre)
+
+    @instrumentar
+    def buscar_por_prefijo(self, prefijo: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores cuyo nombre empieza con el texto recibido, sin distinguir mayúsculas ni acentos.
+        '''
+        return self.indice_nombres.buscar_prefijo(prefijo)
+
+    @instrumentar
+    def buscar_aproximado(self, nombre: str, cantidad: int = 5, distancia_maxima: int = None) -> list[tuple[Jugador, int]]:
+        '''
+        Retorna hasta 'cantidad' pares (jugador, distancia) con los nombres más parecidos al recibido,
+        de menor a mayor distancia de edición, aunque tenga errores de tipeo ('Jordn', 'Magic Jonson').
+        '''
+        return self.indice_aproximado.buscar(nombre, cantidad, distancia_maxima)
+
+    @instrumentar
+    def buscar_tolerante(self, nombre: str, cantidad: int = 5) -> tuple[list[Jugador], bool]:
+        '''
+        Retorna los jugadores cuyo nombre contiene el texto recibido. Si no hay ninguno retorna
+        los de nombre más parecido (todos los que empatan en la menor distancia, hasta 'cantidad').
+        El segundo valor indica si el resultado es aproximado.
+        '''
+        coincidencias = self.buscar(nombre)
+        if coincidencias:
+            return coincidencias, False
+        parecidos = self.buscar_aproximado(nombre, cantidad)
+        return [jugador for jugador, distancia in parecidos if distancia == parecidos[0][1]], True
+
     def buscar_jugador_por_nombre(self)->list[Jugador]:
         '''
-        Retorna una lista con los jugadores que hayan tenido coincidencias en el nombre
+        Retorna una lista con los jugadores que hayan tenido coincidencias en el nombre.
+        Si el nombre tiene errores de tipeo se usan los nombres más parecidos.
+        No se instrumenta porque espera al usuario; la búsqueda se mide en buscar_tolerante.
         '''
         lista_coincidencias = []
         while len(lista_coincidencias) == 0:
-            nombre_buscado = input("Ingrese el nombre del jugador: ").title()
-            for jugador in self.lista_jugadores:
-                if re.search(nombre_buscado,jugador.nombre):
-                    lista_coincidencias.append(jugador)
+            nombre_buscado = input("Ingrese el nombre del jugador: ")
+            lista_coincidencias, aproximado = self.buscar_tolerante(nombre_buscado)
+            if not lista_coincidencias:
+                print(f"No se encontraron jugadores parecidos a '{nombre_buscado}'")
+            elif aproximado:
+                print(f"No se encontró '{nombre_buscado}'; se muestran los nombres más parecidos: "
+                      f"{', '.join(jugador.nombre for jugador in lista_coincidencias)}")
         return lista_coincidencias
     
     # def buscar_jugador_con_maximo_o_minimo_apartado_estadistico(self, apartado_estadistico: str, busco_mayor:bool) -> Jugador:
@@ -81,6 +438,7 @@ class Equipo:
     #     return jugador_retorno
     
     
+    @instrumentar
     def buscar_jugador_con_maximo_o_minimo_apartado_estadistico(self, apartado_estadistico: str, busco_mayor:bool) -> list[Jugador]:
         '''
         Recibe:
@@ -88,9 +446,29 @@ class Equipo:
                 un booleano (Si es True busca por mayor sino busca por menor)
         
         Propósito: Retornar al jugador con el mayor o menor apartado estadístico pasado por parametro
+        
+        El resultado queda guardado hasta que cambie el equipo, por lo que las consultas
+        repetidas no vuelven a recorrer la lista de jugadores.
+        El apartado se acepta con o sin el prefijo 'get_'.
             '''
+        # Se guarda siempre con el nombre del getter: agregar_jugador y __modificar_jugador lo leen con getattr
+        apartado_estadistico = f'get_{normalizar_apartado(apartado_estadistico)}'
+        clave = (apartado_estadistico, busco_mayor)
+        if clave not in self.__cache_extremos:
+            self.__cache_extremos[clave] = self.__calcular_extremo(apartado_estadistico, busco_mayor)
+        return list(self.__cache_extremos[clave][1])
+
+    def __calcular_extremo(self, apartado_estadistico: str, busco_mayor: bool) -> tuple:
+        '''
+        Recorre el equipo y retorna el valor máximo o mínimo del apartado junto a la lista de jugadores que lo tienen.
+        '''
         if not self.lista_jugadores:
-            return []
+            return (None, [])
+        if self.tabla_estadisticas is not None:
+            tabla = self.tabla_estadisticas
+            valor_extremo = tabla.maximo(apartado_estadistico) if busco_mayor else tabla.minimo(apartado_estadistico)
+            indices = tabla.indices_extremos(apartado_estadistico, busco_mayor)
+            return (valor_extremo, [self.__jugadores_por_fila[i] for i in indices])
 
         valor_extremo = None
         jugadores_retorno = []
@@ -110,17 +488,218 @@ class Equipo:
                     # El valor actual es igual al valor máximo o mínimo actual, agregar el jugador a la lista.
                     jugadores_retorno.append(jugador)
 
-        return jugadores_retorno
-    
-    def buscar_hall_oh_fame_por_nombre(self)->str:
+        return (valor_extremo, jugadores_retorno)
+
+    def agregar_jugador(self, jugador: Jugador) -> None:
+        '''
+        Agrega un jugador al equipo y actualiza los índices, la tabla columnar y los
+        extremos guardados sin reconstruirlos.
+        '''
+        self.lista_jugadores.append(jugador)
+        self.version += 1
+        if self.tabla_estadisticas is not None:
+            fila = self.tabla_estadisticas.agregar_fila(jugador.estadistica)
+            jugador.estadistica = EstadisticaFila(self.tabla_estadisticas, fila)
+            self.__jugadores_por_fila.append(jugador)
+        if self.__indice_nombres is not None:
+            self.__indice_nombres.agregar(jugador)
+        if self.__indice_aproximado is not None:
+            self.__indice_aproximado.agregar(jugador)
+        if self.__indice_logros is not None:
+            self.__indice_logros.agregar(jugador)
+
+        for (apartado_estadistico, busco_mayor), (valor_extremo, jugadores) in list(self.__cache_extremos.items()):
+            valor_actual = getattr(jugador.estadistica, apartado_estadistico)
+            if valor_actual is None:
+                continue
+            if valor_extremo is None or (busco_mayor and valor_actual > valor_extremo) or (not busco_mayor and valor_actual < valor_extremo):
+                self.__cache_extremos[(apartado_estadistico, busco_mayor)] = (valor_actual, [jugador])
+            elif valor_actual == valor_extremo:
+                jugadores.append(jugador)
+
+    def eliminar_jugador(self, jugador: Jugador) -> None:
+        '''
+        Quita un jugador del equipo. Los extremos guardados solo se descartan si el jugador
+        era el único con ese valor.
+        '''
+        self.__quitar_jugadores([jugador])
+
+    def __quitar_jugadores(self, jugadores_a_quitar: list[Jugador]) -> None:
+        '''
+        Quita varios jugadores en una sola pasada por la lista, borra sus filas de la tabla
+        columnar y los saca de los índices y de los extremos guardados.
+        '''
+        if len(jugadores_a_quitar) == 1:
+            self.lista_jugadores.remove(jugadores_a_quitar[0])
+        else:
+            ids_a_quitar = {id(jugador) for jugador in jugadores_a_quitar}
+            self.lista_jugadores[:] = [jugador for jugador in self.lista_jugadores if id(jugador) not in ids_a_quitar]
+        self.version += 1
+        if self.tabla_estadisticas is not None:
+            self.__borrar_filas(jugadores_a_quitar)
+        for jugador in jugadores_a_quitar:
+            if self.__indice_nombres is not None:
+                self.__indice_nombres.quitar(jugador)
+            if self.__indice_aproximado is not None:
+                self.__indice_aproximado.quitar(jugador)
+            if self.__indice_logros is not None:
+                self.__indice_logros.quitar(jugador)
+
+            for clave, (valor_extremo, jugadores) in list(self.__cache_extremos.items()):
+                if any(jugador_extremo is jugador for jugador_extremo in jugadores):
+                    if len(jugadores) == 1:
+                        del self.__cache_extremos[clave]
+                    else:
+                        self.__cache_extremos[clave] = (valor_extremo, [jugador_extremo for jugador_extremo in jugadores if jugador_extremo is not jugador])
+
+    def __borrar_filas(self, jugadores_a_quitar: list[Jugador]) -> None:
+        '''
+        Borra de la tabla columnar las filas de los jugadores quitados sin reconstruirla; cada uno
+        se queda con una estadística propia con sus valores. Recién cuando las filas borradas son
+        más que las vigentes se reconstruye la tabla, así el costo se reparte entre muchas bajas.
+        '''
+        tabla = self.tabla_estadisticas
+        for jugador in jugadores_a_quitar:
+            fila = jugador.estadistica._fila
+            jugador.estadistica = jugador.clase_estadistica.desde_valores(*tabla.valores_fila(fila))
+            tabla.quitar_fila(fila)
+            self.__jugadores_por_fila[fila] = None
+        if len(tabla.borradas) > len(tabla) // 2:
+            self.usar_tabla_columnar()
+
+    def __modificar_jugador(self, jugador: Jugador, jugador_nuevo: Jugador) -> None:
+        '''
+        Copia en el jugador cargado el contenido de su versión nueva, conservando el objeto y su fila
+        de la tabla columnar, y descarta los extremos guardados que el cambio puede afectar.
+        '''
+        logros_anteriores = list(jugador.lista_logros or ())
+        fila = jugador.estadistica._fila if self.tabla_estadisticas is not None else None
+        for clave, (valor_extremo, jugadores) in list(self.__cache_extremos.items()):
+            apartado_estadistico, busco_mayor = clave
+            valor_nuevo = getattr(jugador_nuevo.estadistica, apartado_estadistico)
+            supera = valor_nuevo is not None and valor_extremo is not None and (
+                valor_nuevo >= valor_extremo if busco_mayor else valor_nuevo <= valor_extremo)
+            if supera or any(jugador_extremo is jugador for jugador_extremo in jugadores):
+                del self.__cache_extremos[clave]
+
+        jugador.actualizar_desde(jugador_nuevo)
+        if fila is not None:
+            self.tabla_estadisticas.actualizar_fila(fila, jugador.estadistica)
+            jugador.estadistica = EstadisticaFila(self.tabla_estadisticas, fila)
+        if self.__indice_logros is not None and logros_anteriores != list(jugador.lista_logros or ()):
+            self.__indice_logros.actualizar(jugador, logros_anteriores)
+
+    @instrumentar
+    def aplicar_cambios(self, cambios: Cambios) -> None:
+        '''
+        Aplica al equipo cargado las diferencias detectadas con detectar_cambios: quita los eliminados,
+        actualiza en su lugar los modificados y agrega los nuevos, manteniendo al día los índices,
+        la tabla columnar y los extremos guardados sin reconstruirlos desde cero.
+        Si los cambios son completos (claves repetidas) la lista se reemplaza por los agregados.
+        '''
+        if cambios.completo:
+            self.lista_jugadores = list(cambios.agregados)
+        else:
+            jugadores_por_clave = {self.clave_jugador(jugador): jugador for jugador in self.lista_jugadores}
+            if cambios.eliminados:
+                self.__quitar_jugadores([jugadores_por_clave[clave] for clave in cambios.eliminados])
+            for jugador_nuevo in cambios.modificados:
+                self.__modificar_jugador(jugadores_por_clave[cambios.clave(jugador_nuevo)], jugador_nuevo)
+            for jugador in cambios.agregados:
+                self.agregar_jugador(jugador)
+        self.version += 1
+        # Los hashes del archivo nuevo son los del equipo actualizado: no hace falta recalcularlos
+        self.__hashes = (self.version, cambios.hashes)
+
+    @instrumentar
+    def cambios_en_archivo(self) -> Cambios:
+        '''
+        Vuelve a leer el archivo del equipo y lo compara por nombre con los jugadores cargados,
+        sin modificar el equipo. Retorna las diferencias para aplicar con aplicar_cambios.
+        '''
+        return self.cambios_respecto_de(self.cargar_lista_jugadores())
+
+    @instrumentar
+    def sincronizar(self) -> Cambios:
+        '''
+        Vuelve a leer el archivo del equipo, lo compara por nombre con los jugadores cargados
+        y aplica solo las diferencias (ver aplicar_cambios). Retorna los cambios aplicados.
+        '''
+        cambios = self.cambios_en_archivo()
+        if cambios:
+            self.aplicar_cambios(cambios)
+        return cambios
+
+    @instrumentar
+    def recargar(self) -> None:
+        '''
+        Vuelve a leer el archivo del equipo y descarta todos los índices y extremos guardados.
+        '''
+        self.lista_jugadores = self.cargar_lista_jugadores()
+
+    @instrumentar
+    def ordenar_por_estadisticas(self, *apartados: str, menor_a_mayor: bool = False) -> list[Jugador]:
+        '''
+        Retorna los jugadores ordenados por la suma de los apartados estadísticos recibidos.
+        Si el equipo usa la tabla columnar el ordenamiento se hace sobre sus columnas.
+        Los apartados se aceptan con o sin el prefijo 'get_' en los dos casos.
+        '''
+        if self.tabla_estadisticas is not None:
+            return [self.__jugadores_por_fila[i] for i in self.tabla_estadisticas.argsort(apartados, menor_a_mayor)]
+        apartados = tuple(f'get_{normalizar_apartado(apartado)}' for apartado in apartados)
+        return ordenar_jugadores(self.lista_jugadores, [(apartados, menor_a_mayor)])
+
+    @instrumentar
+    def obtener_top_k(self, cantidad: int, *apartados: str, mayor_a_menor: bool = True) -> tuple[list[Jugador], float]:
+        '''
+        Selecciona los jugadores con mayor (o menor) valor en la suma de los apartados recibidos
+        sin ordenar todo el equipo: O(n log k) en lugar de O(n log n).
+
+        Recibe:
+            cantidad (int): Cantidad de jugadores a retornar.
+            apartados (str): Uno o más apartados estadísticos que se suman, con o sin 'get_' (por ejemplo 'get_robos_totales').
+            mayor_a_menor (bool): Si es True retorna los mayores, sino los menores.
+
+        Retorna:
+            tuple[list[Jugador], float]: Los jugadores seleccionados ordenados igual que lo haría un
+            ordenamiento estable, y el valor máximo de la suma en todo el equipo (None si está vacío),
+            que se calcula en la misma pasada.
+        '''
+        if self.tabla_estadisticas is not None:
+            jugadores = self.__jugadores_por_fila
+            valores = self.tabla_estadisticas.sumar_columnas(*apartados)
+        else:
+            jugadores = self.lista_jugadores
+            valores = map(clave_suma_estadisticas(*(f'get_{normalizar_apartado(apartado)}' for apartado in apartados)), self.lista_jugadores)
+
+        maximo = None
+        seleccionados = []
+        for indice, valor in enumerate(valores):
+            if jugadores[indice] is None:
+                # Fila borrada de la tabla columnar
+                continue
+            if maximo is None or valor > maximo:
+                maximo = valor
+            # A igual valor gana el que aparece primero, como en un ordenamiento estable
+            orden = (valor, -indice) if mayor_a_menor else (-valor, -indice)
+            if len(seleccionados) < cantidad:
+                heapq.heappush(seleccionados, (orden, indice))
+            elif cantidad and orden > seleccionados[0][0]:
+                heapq.heapreplace(seleccionados, (orden, indice))
+
+        seleccionados.sort(reverse=True)
+        return [jugadores[indice] for _, indice in seleccionados], maximo
+
+    def buscar_hall_oh_fame_por_nombre(self, jugadores_consultados: list[Jugador] = None)->str:
         '''
         Recibe una lista de jugadores
-        le pide un nombre al usuario
+        si no la recibe le pide un nombre al usuario
         retorna un string indicando si es el jugador es miembro o no del salon de la fama
         '''
-        jugadores_consultados = self.buscar_jugador_por_nombre()
+        if jugadores_consultados is None:
+            jugadores_consultados = self.buscar_jugador_por_nombre()
         for jugador in jugadores_consultados:
-            if jugador.is_hall_of_fame():
+            if self.es_hall_of_fame(jugador):
                 print(f'{jugador.nombre} Es Hall of Fame')
             else:
                 print(f'{jugador.nombre} No es Hall of Fame')
@@ -146,7 +725,7 @@ class Equipo:
         retorna una copia del jugador que ocupa el indice indicado por el usuar
         '''
         indice_buscado = self.pedir_ingreso_de_dato_y_validar()
-        jugador_retorno = self.lista_jugadores[indice_buscado-1]
+        jugador_retorno = self.obtener_jugador(indice_buscado-1)
         print(jugador_retorno.nombre)
         return jugador_retorno 
     
@@ -155,6 +734,7 @@ class Equipo:
         jugador_selccionado = self.filtar_jugador_por_indice_estadisticas()
         return jugador_selccionado
     
+    @instrumentar
     def generar_lista_posiciones(self)->list[str]:
         '''
            Genera una lista de las posiciones válidas presentes en la lista de jugadores del equipo sin posiciones repetidas.
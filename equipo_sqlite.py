@@ -0,0 +1,332 @@
+import sqlite3
+import sys
+from typing import Callable, Iterable
+from jugador import Jugador
+from estadisticas import CAMPOS_ESTADISTICOS, CAMPOS_ENTEROS, normalizar_apartado
+from indices import normalizar_logro, normalizar_texto, LOGRO_HALL_OF_FAME
+from escritor_db import pool_conexiones, carga_masiva, iterar_lotes
+from seguimiento_cambios import Cambios, detectar_cambios
+
+SENTENCIAS_ESQUEMA = [
+    'drop table if exists jugador_logros',
+    'drop table if exists logros',
+    'drop table if exists estadisticas',
+    'drop table if exists jugadores',
+    'drop table if exists posiciones',
+    '''create table posiciones
+       (
+            id integer primary key,
+            nombre text unique not null
+       )''',
+    '''create table jugadores
+       (
+            id integer primary key,
+            nombre text not null,
+            clave text not null,
+            posicion_id integer references posiciones(id),
+            hash text
+       )''',
+    f'''create table estadisticas
+       (
+            jugador_id integer primary key references jugadores(id),
+            {", ".join(f"{campo} {'integer' if campo in CAMPOS_ENTEROS else 'real'}" for campo in CAMPOS_ESTADISTICOS)}
+       )''',
+    '''create table logros
+       (
+            id integer primary key,
+            texto text unique not null,
+            clave text not null,
+            clave_sin_cantidad text not null
+       )''',
+    '''create table jugador_logros
+       (
+            logro_id integer not null references logros(id),
+            jugador_id integer not null references jugadores(id),
+            primary key (logro_id, jugador_id)
+       ) without rowid''',
+]
+
+SENTENCIAS_INDICES = [
+    'create index idx_jugadores_nombre on jugadores(nombre)',
+    'create index idx_jugadores_posicion on jugadores(posicion_id)',
+    'create index idx_logros_clave on logros(clave)',
+    'create index idx_logros_clave_sin_cantidad on logros(clave_sin_cantidad)',
+    'create index idx_jugador_logros_jugador on jugador_logros(jugador_id)',
+] + [f'create index idx_estadisticas_{campo} on estadisticas({campo})' for campo in CAMPOS_ESTADISTICOS]
+
+class _FilasNormalizadas:
+    '''
+    Arma las filas de las cinco tablas para un lote de jugadores, asignando ids nuevos
+    a las posiciones y logros que todavía no están en la base.
+    '''
+    def __init__(self, ids_posiciones: dict = None, ids_logros: dict = None) -> None:
+        self.ids_posiciones = ids_posiciones or {}
+        self.ids_logros = ids_logros or {}
+        self.__proximo_id_posicion = max(self.ids_posiciones.values(), default=0) + 1
+        self.__proximo_id_logro = max(self.ids_logros.values(), default=0) + 1
+        self.vaciar()
+
+    def vaciar(self) -> None:
+        self.posiciones = []
+        self.jugadores = []
+        self.estadisticas = []
+        self.logros = []
+        self.jugador_logros = []
+
+    def agregar(self, id_jugador: int, jugador: Jugador, hash_contenido: str = None) -> None:
+        id_posicion = self.ids_posiciones.get(jugador.posicion)
+        if id_posicion is None and jugador.posicion is not None:
+            id_posicion = self.ids_posiciones[jugador.posicion] = self.__proximo_id_posicion
+            self.__proximo_id_posicion += 1
+            self.posiciones.append((id_posicion, jugador.posicion))
+        self.jugadores.append((id_jugador, jugador.nombre, normalizar_texto(jugador.nombre or ''), id_posicion, hash_contenido))
+        self.estadisticas.append((id_jugador,) + tuple(
+            getattr(jugador.estadistica, f'get_{campo}') for campo in CAMPOS_ESTADISTICOS))
+        for logro in dict.fromkeys(jugador.lista_logros or ()):
+            id_logro = self.ids_logros.get(logro)
+            if id_logro is None:
+                id_logro = self.ids_logros[logro] = self.__proximo_id_logro
+                self.__proximo_id_logro += 1
+                claves = normalizar_logro(logro)
+                self.logros.append((id_logro, logro, claves[0], claves[-1]))
+            self.jugador_logros.append((id_logro, id_jugador))
+
+    def insertar(self, conexion) -> None:
+        marcadores_estadisticas = ', '.join('?' * (len(CAMPOS_ESTADISTICOS) + 1))
+        conexion.executemany('insert into posiciones(id, nombre) values (?,?)', self.posiciones)
+        conexion.executemany('insert or replace into jugadores(id, nombre, clave, posicion_id, hash) values (?,?,?,?,?)', self.jugadores)
+        conexion.executemany(f'insert or replace into estadisticas(jugador_id, {", ".join(CAMPOS_ESTADISTICOS)}) '
+                             f'values ({marcadores_estadisticas})', self.estadisticas)
+        conexion.executemany('insert into logros(id, texto, clave, clave_sin_cantidad) values (?,?,?,?)', self.logros)
+        conexion.executemany('insert into jugador_logros(logro_id, jugador_id) values (?,?)', self.jugador_logros)
+        self.vaciar()
+
+def exportar_equipo_sqlite(jugadores: Iterable[Jugador], ruta_db: str, tamanio_lote: int = 10000,
+                           reportar_progreso: Callable[[int], None] = None, hashes: dict[str, str] = None) -> int:
+    '''
+    Exporta un roster completo a una base SQLite normalizada: posiciones, jugadores,
+    sus doce apartados estadísticos y sus logros, con índices sobre cada apartado.
+    Las tablas existentes se reemplazan.
+
+    Recibe:
+        jugadores (Iterable[Jugador]): Los jugadores a exportar. Puede ser un generador
+                                       (por ejemplo lector_jugadores.generar_jugadores) para no cargar el roster completo.
+        ruta_db (str): Ruta del archivo de la base de datos.
+        tamanio_lote (int): Cantidad de jugadores por cada executemany.
+        reportar_progreso (Callable[[int], None]): Recibe la cantidad de jugadores exportados después de cada lote.
+        hashes (dict[str, str]): Opcional, {nombre: hash} del contenido de cada jugador. Si se recibe se guarda
+                                 en la base para que actualizar_equipo_sqlite pueda escribir solo los cambios.
+
+    Retorna:
+        int: La cantidad de jugadores exportados.
+    '''
+    filas = _FilasNormalizadas()
+    jugadores_exportados = 0
+    with carga_masiva(ruta_db) as conexion:
+        for sentencia in SENTENCIAS_ESQUEMA:
+            conexion.execute(sentencia)
+        for lote in iterar_lotes(jugadores, tamanio_lote):
+            for jugador in lote:
+                jugadores_exportados += 1
+                filas.agregar(jugadores_exportados, jugador, hashes.get(jugador.nombre) if hashes else None)
+            filas.insertar(conexion)
+            if reportar_progreso:
+                reportar_progreso(jugadores_exportados)
+        # Los índices se crean al final: es más rápido que mantenerlos durante la carga
+        for sentencia in SENTENCIAS_INDICES:
+            conexion.execute(sentencia)
+        conexion.execute('analyze')
+    return jugadores_exportados
+
+def actualizar_equipo_sqlite(jugadores: Iterable[Jugador], ruta_db: str, hashes: dict[str, str] = None) -> Cambios:
+    '''
+    Actualiza una base generada por exportar_equipo_sqlite escribiendo solo los jugadores
+    agregados, modificados o eliminados desde la exportación anterior, comparando el hash
+    del contenido de cada jugador con el guardado en la base. Los modificados y eliminados se
+    ubican por el id guardado de su fila; los agregados reciben ids nuevos.
+    Se exporta la base completa si no existe, si es de una versión anterior, si alguna fila no tiene
+    hash (por ejemplo si se exportó con exportar_equipo_sqlite sin hashes) o si la base o el roster
+    tienen nombres repetidos, porque en esos casos no se puede saber qué fila corresponde a cada jugador.
+
+    Retorna:
+        Cambios: Los jugadores agregados, modificados y eliminados.
+    '''
+    jugadores = list(jugadores)
+    conexion = pool_conexiones.obtener(ruta_db)
+    try:
+        # Las bases de versiones anteriores no tienen la columna clave y se vuelven a exportar completas
+        filas_guardadas = conexion.execute('select id, nombre, hash, clave from jugadores').fetchall()
+    except sqlite3.OperationalError:
+        filas_guardadas = []
+    guardados = {nombre: (id_jugador, hash_guardado) for id_jugador, nombre, hash_guardado, _ in filas_guardadas}
+    if not filas_guardadas or len(guardados) != len(filas_guardadas) or any(hash_guardado is None for _, hash_guardado in guardados.values()):
+        cambios = detectar_cambios(jugadores, {}, hashes)
+        exportar_equipo_sqlite(jugadores, ruta_db, hashes=cambios.hashes)
+        return cambios
+
+    cambios = detectar_cambios(jugadores, {nombre: hash_guardado for nombre, (_, hash_guardado) in guardados.items()}, hashes)
+    if cambios.completo:
+        exportar_equipo_sqlite(jugadores, ruta_db, hashes=cambios.hashes)
+        return cambios
+    if not cambios:
+        return cambios
+    with carga_masiva(ruta_db) as conexion:
+        filas = _FilasNormalizadas(
+            {nombre: id_posicion for id_posicion, nombre in conexion.execute('select id, nombre from posiciones')},
+            {texto: id_logro for id_logro, texto in conexion.execute('select id, texto from logros')})
+        ids_eliminados = [(guardados[nombre][0],) for nombre in cambios.eliminados]
+        ids_modificados = [(guardados[jugador.nombre][0],) for jugador in cambios.modificados]
+        # Los logros de los modificados se vuelven a insertar completos; sus filas de jugadores
+        # y estadísticas se reemplazan con 'insert or replace'
+        conexion.executemany('delete from jugador_logros where jugador_id = ?', ids_eliminados + ids_modificados)
+        conexion.executemany('delete from estadisticas where jugador_id = ?', ids_eliminados)
+        conexion.executemany('delete from jugadores where id = ?', ids_eliminados)
+
+        for jugador in cambios.modificados:
+            filas.agregar(guardados[jugador.nombre][0], jugador, cambios.hashes[jugador.nombre])
+        proximo_id = conexion.execute('select coalesce(max(id), 0) + 1 from jugadores').fetchone()[0]
+        for id_jugador, jugador in enumerate(cambios.agregados, start=proximo_id):
+            filas.agregar(id_jugador, jugador, cambios.hashes[jugador.nombre])
+        filas.insertar(conexion)
+    return cambios
+
+def _expresion_suma(apartados: tuple[str, ...]) -> str:
+    '''
+    Arma la expresión SQL que suma los apartados recibidos. Los nombres se validan
+    contra los campos de Estadistica, por lo que es seguro insertarlos en la sentencia.
+    '''
+    return ' + '.join(normalizar_apartado(apartado) for apartado in apartados)
+
+# Mismo criterio que IndiceLogros.tiene_logro: solo la clave exacta
+SUBCONSULTA_JUGADORES_CON_LOGRO_EXACTO = '''
+    select jugador_id from jugador_logros where logro_id in (
+        select id from logros where clave = ? or clave_sin_cantidad = ?)'''
+
+# Mismo criterio que IndiceLogros.buscar: clave exacta o, si no existe, cualquier logro que la contenga
+SUBCONSULTA_JUGADORES_CON_LOGRO = '''
+    select jugador_id from jugador_logros where logro_id in (
+        select id from logros where clave = ? or clave_sin_cantidad = ?
+        union all
+        select id from logros where clave like ? escape '\\' and not exists (
+            select 1 from logros where clave = ? or clave_sin_cantidad = ?))'''
+
+def _escapar_like(texto: str) -> str:
+    return texto.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def _parametros_logro(logro: str) -> tuple:
+    clave = normalizar_texto(logro)
+    return (clave, clave, f'%{_escapar_like(clave)}%', clave, clave)
+
+class EquipoSQLite:
+    '''
+    Equipo cuyas consultas se resuelven en una base generada por exportar_equipo_sqlite.
+    Tiene los mismos métodos de consulta que Equipo, pero solo construye objetos Jugador
+    para los resultados, por lo que el roster completo nunca se carga en memoria.
+    '''
+    def __init__(self, ruta_db: str, clase_jugador: type = Jugador) -> None:
+        self.ruta_db = ruta_db
+        self.clase_jugador = clase_jugador
+
+    @property
+    def conexion(self):
+        return pool_conexiones.obtener(self.ruta_db)
+
+    def __len__(self) -> int:
+        return self.conexion.execute('select count(*) from jugadores').fetchone()[0]
+
+    def construir_jugadores(self, ids: list[int]) -> list[Jugador]:
+        '''
+        Construye los objetos Jugador de los ids recibidos, respetando el orden de la lista.
+        '''
+        if not ids:
+            return []
+        diccionarios = {}
+        for id_inicio in range(0, len(ids), 500):
+            ids_lote = ids[id_inicio:id_inicio + 500]
+            marcadores = ', '.join('?' * len(ids_lote))
+            filas = self.conexion.execute(
+                f'''select j.id, j.nombre, p.nombre, {", ".join(f"e.{campo}" for campo in CAMPOS_ESTADISTICOS)}
+                    from jugadores j
+                    left join posiciones p on p.id = j.posicion_id
+                    join estadisticas e on e.jugador_id = j.id
+                    where j.id in ({marcadores})''', ids_lote)
+            for fila in filas:
+                diccionarios[fila[0]] = {
+                    'nombre': fila[1],
+                    'posicion': fila[2],
+                    'estadisticas': dict(zip(CAMPOS_ESTADISTICOS, fila[3:])),
+                    'logros': [],
+                }
+            logros = self.conexion.execute(
+                f'''select jl.jugador_id, l.texto from jugador_logros jl
+                    join logros l on l.id = jl.logro_id
+                    where jl.jugador_id in ({marcadores})
+                    order by jl.jugador_id, l.id''', ids_lote)
+            for id_jugador, texto in logros:
+                diccionarios[id_jugador]['logros'].append(texto)
+        return [self.clase_jugador(diccionarios[id_jugador]) for id_jugador in ids]
+
+    def __ids(self, sentencia: str, parametros: tuple = ()) -> list[int]:
+        return [fila[0] for fila in self.conexion.execute(sentencia, parametros)]
+
+    def buscar(self, nombre: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores cuyo nombre contiene el texto, sin distinguir mayúsculas ni acentos (como Equipo.buscar).
+        '''
+        clave = normalizar_texto(nombre)
+        if not clave:
+            return []
+        return self.construir_jugadores(self.__ids(
+            "select id from jugadores where clave like ? escape '\\' order by id", (f'%{_escapar_like(clave)}%',)))
+
+    def buscar_jugador_con_maximo_o_minimo_apartado_estadistico(self, apartado_estadistico: str, busco_mayor: bool) -> list[Jugador]:
+        campo = normalizar_apartado(apartado_estadistico)
+        funcion = 'max' if busco_mayor else 'min'
+        return self.construir_jugadores(self.__ids(
+            f'select jugador_id from estadisticas where {campo} = (select {funcion}({campo}) from estadisticas) order by jugador_id'))
+
+    def ordenar_por_estadisticas(self, *apartados: str, menor_a_mayor: bool = False, limite: int = -1) -> list[Jugador]:
+        '''
+        Retorna los jugadores ordenados por la suma de los apartados. A igual valor se respeta
+        el orden del roster, como en un ordenamiento estable.
+        '''
+        orden = 'asc' if menor_a_mayor else 'desc'
+        return self.construir_jugadores(self.__ids(
+            f'select jugador_id from estadisticas order by {_expresion_suma(apartados)} {orden}, jugador_id limit ?', (limite,)))
+
+    def obtener_top_k(self, cantidad: int, *apartados: str, mayor_a_menor: bool = True) -> tuple[list[Jugador], float]:
+        maximo = self.conexion.execute(f'select max({_expresion_suma(apartados)}) from estadisticas').fetchone()[0]
+        return self.ordenar_por_estadisticas(*apartados, menor_a_mayor=not mayor_a_menor, limite=cantidad), maximo
+
+    def __combinar_logros(self, logros: tuple[str, ...], operador: str) -> list[Jugador]:
+        if not logros:
+            return []
+        sentencia = f' {operador} '.join([SUBCONSULTA_JUGADORES_CON_LOGRO] * len(logros))
+        parametros = sum((_parametros_logro(logro) for logro in logros), ())
+        return self.construir_jugadores(self.__ids(f'select * from ({sentencia}) order by 1', parametros))
+
+    def jugadores_con_logro(self, logro: str) -> list[Jugador]:
+        return self.__combinar_logros((logro,), 'union')
+
+    def jugadores_con_todos_los_logros(self, *logros: str) -> list[Jugador]:
+        return self.__combinar_logros(logros, 'intersect')
+
+    def jugadores_con_algun_logro(self, *logros: str) -> list[Jugador]:
+        return self.__combinar_logros(logros, 'union')
+
+    def es_hall_of_fame(self, jugador: Jugador) -> bool:
+        sentencia = f'select 1 from jugadores where nombre = ? and id in ({SUBCONSULTA_JUGADORES_CON_LOGRO_EXACTO}) limit 1'
+        clave = normalizar_texto(LOGRO_HALL_OF_FAME)
+        return self.conexion.execute(sentencia, (jugador.nombre, clave, clave)).fetchone() is not None
+
+    def generar_lista_posiciones(self) -> list[str]:
+        return [fila[0] for fila in self.conexion.execute(
+            'select nombre from posiciones where id in (select distinct posicion_id from jugadores)')]
+
+if __name__ == '__main__':
+    from lector_jugadores import generar_jugadores
+    if len(sys.argv) != 3:
+        print('Uso: python equipo_sqlite.py <roster.json> <base.db>')
+        sys.exit(1)
+    cantidad = exportar_equipo_sqlite(generar_jugadores(sys.argv[1]), sys.argv[2], reportar_progreso=print)
+    print(f'Se exportaron {cantidad} jugadores a {sys.argv[2]}')
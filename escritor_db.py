@@ -0,0 +1,156 @@
+import atexit
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+from instrumentacion import instrumentar
+
+PRAGMAS_CARGA_MASIVA = {'journal_mode': 'MEMORY', 'synchronous': 'OFF'}
+
+class PoolConexiones:
+    '''
+    Guarda una conexión abierta por archivo de base de datos y por hilo, para no
+    abrir una conexión nueva en cada operación. Las conexiones quedan abiertas hasta
+    llamar a cerrar (el pool global se cierra solo al terminar el programa).
+    '''
+    def __init__(self) -> None:
+        self.__locales = threading.local()
+        self.__por_hilo = []
+        self.__candado = threading.Lock()
+
+    def obtener(self, ruta_db: str) -> sqlite3.Connection:
+        conexiones = getattr(self.__locales, 'conexiones', None)
+        if conexiones is None:
+            conexiones = self.__locales.conexiones = {}
+            with self.__candado:
+                self.__por_hilo.append(conexiones)
+        conexion = conexiones.get(ruta_db)
+        if conexion is None:
+            # Cada hilo usa solo la suya; check_same_thread=False es para que cerrar pueda cerrarlas desde otro hilo
+            conexion = sqlite3.connect(ruta_db, check_same_thread=False)
+            conexiones[ruta_db] = conexion
+        return conexion
+
+    def cerrar(self, ruta_db: str = None) -> None:
+        '''
+        Cierra las conexiones de todos los hilos a la base recibida, o a todas si no se recibe ninguna.
+        La próxima llamada a obtener abre una conexión nueva.
+        '''
+        with self.__candado:
+            for conexiones in self.__por_hilo:
+                for ruta in [ruta for ruta in conexiones if ruta_db is None or ruta == ruta_db]:
+                    conexiones.pop(ruta).close()
+
+pool_conexiones = PoolConexiones()
+atexit.register(pool_conexiones.cerrar)
+
+def mostrar_progreso(filas_escritas: int) -> None:
+    print(f'{filas_escritas} filas escritas')
+
+@contextmanager
+def carga_masiva(ruta_db: str, pragmas: dict = None) -> Iterator[sqlite3.Connection]:
+    '''
+    Entrega la conexión del pool dentro de una única transacción con los pragmas de carga
+    aplicados (por defecto PRAGMAS_CARGA_MASIVA). Al salir confirma la transacción, o la
+    deshace si hubo un error, y restaura los valores anteriores de los pragmas.
+    La transacción se abre explícitamente para que también incluya las sentencias de esquema
+    (create, drop), que sqlite3 ejecutaría fuera de ella.
+    '''
+    conexion = pool_conexiones.obtener(ruta_db)
+    pragmas = PRAGMAS_CARGA_MASIVA if pragmas is None else pragmas
+    valores_anteriores = {nombre: conexion.execute(f'pragma {nombre}').fetchone()[0] for nombre in pragmas}
+    for nombre, valor in pragmas.items():
+        conexion.execute(f'pragma {nombre} = {valor}')
+    try:
+        with conexion:
+            conexion.execute('begin')
+            yield conexion
+    finally:
+        for nombre, valor in valores_anteriores.items():
+            conexion.execute(f'pragma {nombre} = {valor}')
+
+def iterar_lotes(filas: Iterable, tamanio_lote: int) -> Iterator[list]:
+    iterador = iter(filas)
+    while True:
+        lote = list(islice(iterador, tamanio_lote))
+        if not lote:
+            return
+        yield lote
+
+@instrumentar
+def insertar_masivo(ruta_db: str, sentencia: str, filas: Iterable[tuple], tamanio_lote: int = 10000,
+                    pragmas: dict = None, reportar_progreso: Callable[[int], None] = None) -> int:
+    '''
+    Inserta muchas filas en una sola transacción usando executemany por lotes.
+
+    Recibe:
+        ruta_db (str): Ruta del archivo de la base de datos.
+        sentencia (str): Sentencia parametrizada, por ejemplo 'insert into tabla(a,b) values (?,?)'.
+        filas (Iterable[tuple]): Las filas a insertar. Se consumen de a un lote por vez.
+        tamanio_lote (int): Cantidad de filas por cada executemany.
+        pragmas (dict): Pragmas a aplicar durante la carga (por defecto PRAGMAS_CARGA_MASIVA).
+                        Al terminar se restauran los valores anteriores.
+        reportar_progreso (Callable[[int], None]): Función que recibe la cantidad de filas escritas después de cada lote.
+
+    Retorna:
+        int: La cantidad de filas insertadas. Si ocurre un error no se inserta ninguna.
+    '''
+    filas_escritas = 0
+    with carga_masiva(ruta_db, pragmas) as conexion:
+        for lote in iterar_lotes(filas, tamanio_lote):
+            conexion.executemany(sentencia, lote)
+            filas_escritas += len(lote)
+            if reportar_progreso:
+                reportar_progreso(filas_escritas)
+    return filas_escritas
+
+def medir_insercion(cantidad: int, repeticiones: int = 3) -> None:
+    '''
+    Compara el tiempo de insertar 'cantidad' filas con un execute por fila (como se hacía antes,
+    también en una sola transacción) contra insertar_masivo con distintos tamaños de lote, con y
+    sin reportar el progreso y sin los pragmas de carga. Las variantes se alternan en cada
+    repetición para que el ruido de la máquina las afecte por igual; se muestra el mejor tiempo.
+    '''
+    filas = [(f'Jugador {i}', i % 20) for i in range(cantidad)]
+    sentencia_tabla = 'create table jugadores (id integer primary key autoincrement, nombre text, temporadas integer)'
+    sentencia_insertar = 'insert into jugadores(nombre,temporadas) values (?,?)'
+
+    def por_fila(ruta_db: str) -> None:
+        with sqlite3.connect(ruta_db) as conexion:
+            for fila in filas:
+                conexion.execute(sentencia_insertar, fila)
+            conexion.commit()
+        conexion.close()
+
+    variantes = {
+        'Un execute por fila': por_fila,
+        'insertar_masivo, lotes de 10000': lambda ruta_db: insertar_masivo(ruta_db, sentencia_insertar, filas),
+        'insertar_masivo, un solo lote': lambda ruta_db: insertar_masivo(ruta_db, sentencia_insertar, filas, max(cantidad, 1)),
+        'insertar_masivo, con progreso': lambda ruta_db: insertar_masivo(ruta_db, sentencia_insertar, filas,
+                                                                         reportar_progreso=lambda filas_escritas: None),
+        'insertar_masivo, sin pragmas': lambda ruta_db: insertar_masivo(ruta_db, sentencia_insertar, filas, pragmas={}),
+    }
+    tiempos = {nombre: [] for nombre in variantes}
+    with tempfile.TemporaryDirectory() as directorio:
+        for repeticion in range(repeticiones):
+            for numero, (nombre, insertar) in enumerate(variantes.items()):
+                ruta_db = os.path.join(directorio, f'{repeticion}_{numero}.db')
+                with sqlite3.connect(ruta_db) as conexion:
+                    conexion.execute(sentencia_tabla)
+                conexion.close()
+                inicio = time.perf_counter()
+                insertar(ruta_db)
+                tiempos[nombre].append(time.perf_counter() - inicio)
+                pool_conexiones.cerrar(ruta_db)
+
+    referencia = min(tiempos['Un execute por fila'])
+    print(f'Filas: {cantidad} (mejor de {repeticiones})')
+    for nombre, tiempos_variante in tiempos.items():
+        print(f'{nombre:<34} {min(tiempos_variante):.3f} s  ({referencia / min(tiempos_variante):.2f}x)')
+
+if __name__ == '__main__':
+    medir_insercion(200_000)
@@ -1,3 +1,39 @@
+import operator
+
+CAMPOS_ESTADISTICOS = (
+    'temporadas',
+    'puntos_totales',
+    'promedio_puntos_por_partido',
+    'rebotes_totales',
+    'promedio_rebotes_por_partido',
+    'asistencias_totales',
+    'promedio_asistencias_por_partido',
+    'robos_totales',
+    'bloqueos_totales',
+    'porcentaje_tiros_de_campo',
+    'porcentaje_tiros_libres',
+    'porcentaje_tiros_triples',
+)
+CAMPOS_ENTEROS = frozenset({
+    'temporadas',
+    'puntos_totales',
+    'rebotes_totales',
+    'asistencias_totales',
+    'robos_totales',
+    'bloqueos_totales',
+})
+
+def normalizar_apartado(apartado: str) -> str:
+    '''
+    Recibe un apartado estadístico con o sin el prefijo 'get_' (por ejemplo 'get_rebotes_totales')
+    y retorna el nombre del campo ('rebotes_totales').
+    Lanza ValueError si el campo no es un apartado de la clase Estadistica.
+    '''
+    campo = apartado[4:] if apartado.startswith('get_') else apartado
+    if campo not in CAMPOS_ESTADISTICOS:
+        raise ValueError(f'Apartado estadístico inválido: {apartado}')
+    return campo
+
 class Estadistica:
     def __init__(self, diccionario) -> None:
         self.__temporadas = diccionario.get('temporadas')
@@ -12,7 +48,28 @@ class Estadistica:
         self.__porcentaje_tiros_de_campo = diccionario.get('porcentaje_tiros_de_campo')
         self.__porcentaje_tiros_libres = diccionario.get('porcentaje_tiros_libres')
         self.__porcentaje_tiros_triples  = diccionario.get('porcentaje_tiros_triples')
-        
+
+    @classmethod
+    def desde_valores(cls, temporadas, puntos_totales, promedio_puntos_por_partido, rebotes_totales, promedio_rebotes_por_partido, asistencias_totales, promedio_asistencias_por_partido, robos_totales, bloqueos_totales, porcentaje_tiros_de_campo, porcentaje_tiros_libres, porcentaje_tiros_triples):
+        '''
+        Arma una Estadistica a partir de los valores ya validados, en el orden de CAMPOS_ESTADISTICOS.
+        Es el constructor que usa el decodificador de jugadores para no pasar por un diccionario.
+        '''
+        estadistica = object.__new__(cls)
+        estadistica.__temporadas = temporadas
+        estadistica.__puntos_totales = puntos_totales
+        estadistica.__promedio_puntos_por_partido = promedio_puntos_por_partido
+        estadistica.__rebotes_totales = rebotes_totales
+        estadistica.__promedio_rebotes_por_partido = promedio_rebotes_por_partido
+        estadistica.__asistencias_totales = asistencias_totales
+        estadistica.__promedio_asistencias_por_partido = promedio_asistencias_por_partido
+        estadistica.__robos_totales = robos_totales
+        estadistica.__bloqueos_totales = bloqueos_totales
+        estadistica.__porcentaje_tiros_de_campo = porcentaje_tiros_de_campo
+        estadistica.__porcentaje_tiros_libres = porcentaje_tiros_libres
+        estadistica.__porcentaje_tiros_triples = porcentaje_tiros_triples
+        return estadistica
+
     @property #getter
     def get_temporadas(self):
         return self.__temporadas
@@ -51,3 +108,37 @@ class Estadistica:
         return self.__porcentaje_tiros_triples
     
         
+
+class EstadisticaCompacta:
+    '''
+    Versión de Estadistica sin __dict__ por instancia: cada apartado ocupa un slot.
+    Tiene los mismos getters que Estadistica.
+    '''
+    __slots__ = CAMPOS_ESTADISTICOS
+
+    def __init__(self, diccionario) -> None:
+        for campo in CAMPOS_ESTADISTICOS:
+            setattr(self, campo, diccionario.get(campo))
+
+    @classmethod
+    def desde_valores(cls, temporadas, puntos_totales, promedio_puntos_por_partido, rebotes_totales, promedio_rebotes_por_partido, asistencias_totales, promedio_asistencias_por_partido, robos_totales, bloqueos_totales, porcentaje_tiros_de_campo, porcentaje_tiros_libres, porcentaje_tiros_triples):
+        '''
+        Igual que Estadistica.desde_valores.
+        '''
+        estadistica = object.__new__(cls)
+        estadistica.temporadas = temporadas
+        estadistica.puntos_totales = puntos_totales
+        estadistica.promedio_puntos_por_partido = promedio_puntos_por_partido
+        estadistica.rebotes_totales = rebotes_totales
+        estadistica.promedio_rebotes_por_partido = promedio_rebotes_por_partido
+        estadistica.asistencias_totales = asistencias_totales
+        estadistica.promedio_asistencias_por_partido = promedio_asistencias_por_partido
+        estadistica.robos_totales = robos_totales
+        estadistica.bloqueos_totales = bloqueos_totales
+        estadistica.porcentaje_tiros_de_campo = porcentaje_tiros_de_campo
+        estadistica.porcentaje_tiros_libres = porcentaje_tiros_libres
+        estadistica.porcentaje_tiros_triples = porcentaje_tiros_triples
+        return estadistica
+
+for _campo in CAMPOS_ESTADISTICOS:
+    setattr(EstadisticaCompacta, f'get_{_campo}', property(operator.attrgetter(_campo)))
@@ -0,0 +1,161 @@
+import math
+import operator
+from array import array
+from typing import Iterable
+from estadisticas import CAMPOS_ESTADISTICOS, CAMPOS_ENTEROS, normalizar_apartado
+
+class TablaEstadisticas:
+    '''
+    Guarda las estadísticas de todo un equipo por columnas: un arreglo contiguo de
+    números por cada apartado estadístico, donde la fila i corresponde al jugador i.
+    Los valores faltantes se guardan como NaN. Las filas quitadas quedan borradas en su
+    lugar (ver quitar_fila) para no renumerar las siguientes.
+    '''
+    def __init__(self, estadisticas: Iterable = ()) -> None:
+        self.columnas = {campo: array('d') for campo in CAMPOS_ESTADISTICOS}
+        self.faltantes = dict.fromkeys(CAMPOS_ESTADISTICOS, 0)
+        self.borradas = set()
+        for estadistica in estadisticas:
+            self.agregar_fila(estadistica)
+
+    def __len__(self) -> int:
+        return len(self.columnas['temporadas'])
+
+    def agregar_fila(self, estadistica) -> int:
+        '''
+        Agrega al final de cada columna los valores de una Estadistica.
+        Retorna el número de fila asignado.
+        '''
+        for campo in CAMPOS_ESTADISTICOS:
+            valor = getattr(estadistica, f'get_{campo}')
+            if valor is None:
+                self.faltantes[campo] += 1
+                valor = math.nan
+            self.columnas[campo].append(valor)
+        return len(self) - 1
+
+    def actualizar_fila(self, fila: int, estadistica) -> None:
+        '''
+        Reemplaza los valores de una fila existente con los de una Estadistica.
+        '''
+        for campo in CAMPOS_ESTADISTICOS:
+            columna = self.columnas[campo]
+            if columna[fila] != columna[fila]:
+                self.faltantes[campo] -= 1
+            valor = getattr(estadistica, f'get_{campo}')
+            if valor is None:
+                self.faltantes[campo] += 1
+                valor = math.nan
+            columna[fila] = valor
+
+    def quitar_fila(self, fila: int) -> None:
+        '''
+        Borra una fila en O(1) sin mover las demás: sus valores pasan a faltantes (NaN), por lo
+        que ya no cuentan en máximos, mínimos ni sumas, y argsort deja de retornarla.
+        '''
+        for campo in CAMPOS_ESTADISTICOS:
+            columna = self.columnas[campo]
+            if columna[fila] == columna[fila]:
+                self.faltantes[campo] += 1
+                columna[fila] = math.nan
+        self.borradas.add(fila)
+
+    def valores_fila(self, fila: int) -> tuple:
+        '''
+        Retorna los valores de una fila en el orden de CAMPOS_ESTADISTICOS (ver Estadistica.desde_valores).
+        '''
+        return tuple(self.valor(campo, fila) for campo in CAMPOS_ESTADISTICOS)
+
+    def valor(self, campo: str, fila: int):
+        '''
+        Retorna el valor de un campo para una fila con el mismo tipo que tendría en
+        la clase Estadistica (int para los totales y None si falta).
+        '''
+        valor = self.columnas[campo][fila]
+        if valor != valor:
+            return None
+        if campo in CAMPOS_ENTEROS:
+            return int(valor)
+        return valor
+
+    def columna(self, apartado: str) -> array:
+        return self.columnas[normalizar_apartado(apartado)]
+
+    def sumar_columnas(self, *apartados: str) -> array:
+        '''
+        Retorna un arreglo con la suma fila a fila de los apartados recibidos.
+        '''
+        resultado = self.columna(apartados[0])
+        for apartado in apartados[1:]:
+            resultado = array('d', map(operator.add, resultado, self.columna(apartado)))
+        return resultado
+
+    def _valores_validos(self, apartado: str):
+        campo = normalizar_apartado(apartado)
+        columna = self.columnas[campo]
+        if self.faltantes[campo]:
+            return [valor for valor in columna if valor == valor]
+        return columna
+
+    def maximo(self, apartado: str):
+        valores = self._valores_validos(apartado)
+        return max(valores) if valores else None
+
+    def minimo(self, apartado: str):
+        valores = self._valores_validos(apartado)
+        return min(valores) if valores else None
+
+    def suma(self, apartado: str) -> float:
+        return math.fsum(self._valores_validos(apartado))
+
+    def indices_extremos(self, apartado: str, busco_mayor: bool) -> list[int]:
+        '''
+        Retorna las filas que tienen el valor máximo (o mínimo) del apartado, incluyendo empates.
+        '''
+        valor_extremo = self.maximo(apartado) if busco_mayor else self.minimo(apartado)
+        if valor_extremo is None:
+            return []
+        columna = self.columna(apartado)
+        indices = []
+        inicio = 0
+        try:
+            while True:
+                inicio = columna.index(valor_extremo, inicio)
+                indices.append(inicio)
+                inicio += 1
+        except ValueError:
+            pass
+        return indices
+
+    def argsort(self, apartados: tuple[str, ...], menor_a_mayor: bool) -> list[int]:
+        '''
+        Retorna las filas ordenadas según la suma de los apartados recibidos, sin las borradas.
+        El ordenamiento es estable. Las filas con algún valor faltante (NaN) van al final
+        en orden de roster, en cualquiera de los dos sentidos.
+        '''
+        valores = self.sumar_columnas(*apartados)
+        if not any(self.faltantes[normalizar_apartado(apartado)] for apartado in apartados):
+            return sorted(range(len(valores)), key=valores.__getitem__, reverse=not menor_a_mayor)
+        # NaN no es comparable: mezclado con el resto el orden dependería de su posición
+        validas = [fila for fila, valor in enumerate(valores) if valor == valor]
+        faltantes = [fila for fila, valor in enumerate(valores) if valor != valor and fila not in self.borradas]
+        return sorted(validas, key=valores.__getitem__, reverse=not menor_a_mayor) + faltantes
+
+class EstadisticaFila:
+    '''
+    Vista de una fila de TablaEstadisticas con los mismos getters que la clase Estadistica,
+    para que el código que usa getattr(jugador.estadistica, 'get_...') siga funcionando.
+    '''
+    __slots__ = ('_tabla', '_fila')
+
+    def __init__(self, tabla: TablaEstadisticas, fila: int) -> None:
+        self._tabla = tabla
+        self._fila = fila
+
+def _crear_getter(campo: str) -> property:
+    def getter(self):
+        return self._tabla.valor(campo, self._fila)
+    return property(getter)
+
+for _campo in CAMPOS_ESTADISTICOS:
+    setattr(EstadisticaFila, f'get_{_campo}', _crear_getter(_campo))
@@ -0,0 +1,71 @@
+import csv
+import gzip
+import operator
+from typing import Iterable
+from jugador import Jugador
+from estadisticas import CAMPOS_ESTADISTICOS, normalizar_apartado
+from instrumentacion import instrumentar
+
+COLUMNAS_ROSTER = ('nombre', 'posicion') + CAMPOS_ESTADISTICOS
+TAMANIO_BUFFER = 1024 * 1024
+
+def normalizar_columnas(columnas: Iterable[str] = None) -> tuple[str, ...]:
+    '''
+    Valida las columnas pedidas. Acepta 'nombre', 'posicion' y los apartados de Estadistica
+    con o sin el prefijo 'get_'. Sin columnas se usan todas las de COLUMNAS_ROSTER.
+    '''
+    if columnas is None:
+        return COLUMNAS_ROSTER
+    return tuple(columna if columna in ('nombre', 'posicion') else normalizar_apartado(columna) for columna in columnas)
+
+def crear_lector_fila(columnas: tuple[str, ...]):
+    '''
+    Retorna una función que recibe un Jugador y retorna la tupla de valores de las columnas.
+    '''
+    atributos = [columna if columna in ('nombre', 'posicion') else f'estadistica.get_{columna}' for columna in columnas]
+    if len(atributos) == 1:
+        obtener = operator.attrgetter(atributos[0])
+        return lambda jugador: (obtener(jugador),)
+    return operator.attrgetter(*atributos)
+
+def abrir_salida_texto(path: str, modo: str, comprimir: bool):
+    if comprimir:
+        return gzip.open(path, modo + 't', encoding='utf-8', newline='')
+    return open(path, modo, encoding='utf-8', newline='', buffering=TAMANIO_BUFFER)
+
+@instrumentar
+def exportar_roster_csv(path: str, jugadores: Iterable[Jugador], columnas: Iterable[str] = None,
+                        comprimir: bool = None, modo: str = 'w') -> int:
+    '''
+    Exporta un roster completo a CSV, una fila por jugador, escribiendo a medida que recorre
+    los jugadores: la memoria usada no depende de la cantidad de jugadores.
+
+    Recibe:
+        path (str): Ruta del archivo CSV.
+        jugadores (Iterable[Jugador]): Los jugadores a exportar. Puede ser un generador.
+        columnas (Iterable[str]): Las columnas a exportar (por defecto todas las de COLUMNAS_ROSTER).
+        comprimir (bool): Si es True se escribe con gzip. Por defecto se comprime si path termina en '.gz'.
+        modo (str): Modo de apertura del archivo ('w' para escritura, 'a' para anexado).
+                    En modo 'a' no se vuelve a escribir la fila de encabezados.
+
+    Retorna:
+        int: La cantidad de jugadores exportados.
+    '''
+    columnas = normalizar_columnas(columnas)
+    if comprimir is None:
+        comprimir = path.endswith('.gz')
+    leer_fila = crear_lector_fila(columnas)
+    cantidad = 0
+    try:
+        with abrir_salida_texto(path, modo, comprimir) as archivo:
+            escritor = csv.writer(archivo)
+            if modo != 'a':
+                escritor.writerow(columnas)
+            for jugador in jugadores:
+                escritor.writerow(leer_fila(jugador))
+                cantidad += 1
+    except FileNotFoundError:
+        print(f"Error: Archivo no encontrado - {path}")
+    except PermissionError:
+        print(f"Error: Permiso denegado para acceder al archivo - {path}")
+    return cantidad
@@ -1,13 +1,18 @@
 from equipo import Equipo
 from jugador import Jugador 
 from estadisticas import Estadistica
+from ordenamiento import ordenar_jugadores, clave_estadistica, clave_atributo
 import re
 import os
 import json
+import csv
 import sqlite3
+from exportador_csv import exportar_roster_csv
+from escritor_db import pool_conexiones, insertar_masivo, mostrar_progreso
+from instrumentacion import instrumentar, medir
 
-mi_equipo = Equipo() 
 
+@instrumentar
 def exportar_csv(path: str, modo: str, contenido: str):
     """
     Exporta contenido a un archivo CSV.
@@ -47,6 +52,7 @@ def exportar_csv(path: str, modo: str, contenido: str):
     except PermissionError:
         print(f"Error: Permiso denegado para acceder al archivo - {path}")
 
+@instrumentar
 def exportar_json(path: str, modo: str, contenido: dict):
     '''
         Exporta un diccionario a un archivo JSON.
@@ -67,25 +73,29 @@ def exportar_json(path: str, modo: str, contenido: dict):
     except PermissionError:
         print(f"Error: Permiso denegado para acceder al archivo - {path}")
 
+@instrumentar
 def crear_db(path:str, nombre_tabla:str):
     '''
         Crea una base de datos SQLite y una tabla en ella.
 
     Esta función crea una base de datos SQLite en el archivo especificado por 'path' y luego crea una tabla
     con el nombre especificado por 'nombre_tabla'. La tabla contendrá tres columnas: 'id' (clave primaria autoincremental),
-    'nombre' (texto) y 'temporadas' (entero).
+    'nombre' (texto, único) y 'temporadas' (entero).
 
     Parámetros:
         path (str): Ruta donde se creará la base de datos SQLite con la extensión '.db'.
         nombre_tabla (str): Nombre de la tabla que se creará en la base de datos.
 
+    Retorna:
+        bool: True si la tabla quedó lista para insertar_filas_db (ver asegurar_nombre_unico).
     '''
-    with sqlite3.connect(f"{path}.db") as conexion:
+    conexion = pool_conexiones.obtener(f"{path}.db")
+    with conexion:
         try:
             sentencia = f''' create  table {nombre_tabla}
                             (
                                     id integer primary key autoincrement,
-                                    nombre text,
+                                    nombre text unique,
                                     temporadas integer
                             )
                         '''
@@ -93,8 +103,30 @@ def crear_db(path:str, nombre_tabla:str):
             print("Se creo la tabla personajes")                       
         except sqlite3.OperationalError:
             print("La tabla personajes ya existe") 
+            return asegurar_nombre_unico(conexion, nombre_tabla)
+    return True
+
+def asegurar_nombre_unico(conexion: sqlite3.Connection, nombre_tabla: str) -> bool:
+    '''
+    Las tablas creadas por versiones anteriores de crear_db no tenían el nombre único y sumaban
+    una fila repetida por jugador en cada exportación. Si la tabla no tiene nombres repetidos se
+    le agrega el índice único que necesita insertar_filas_db para actualizar en lugar de duplicar.
+    Si los tiene no se borra nada: se informa el error y retorna False para que no se exporte.
+    '''
+    for indice in conexion.execute(f'pragma index_list({nombre_tabla})').fetchall():
+        es_unico, nombre_indice = indice[2], indice[1]
+        if es_unico and [columna[2] for columna in conexion.execute(f"pragma index_info('{nombre_indice}')")] == ['nombre']:
+            return True
+    repetidos = conexion.execute(f'select count(*) - count(distinct nombre) from {nombre_tabla}').fetchone()[0]
+    if repetidos:
+        print(f"Error: La tabla {nombre_tabla} tiene {repetidos} filas con nombres repetidos de exportaciones anteriores. "
+              f"Elimine las filas repetidas (o la tabla) y vuelva a exportar.")
+        return False
+    conexion.execute(f'create unique index idx_{nombre_tabla}_nombre on {nombre_tabla}(nombre)')
+    return True
             
-def insertar_filas_db(path:str, nombre_tabla:str,diccionario:dict):
+@instrumentar
+def insertar_filas_db(path:str, nombre_tabla:str,diccionario:dict, reportar_progreso=None):
     '''
         Inserta filas en una tabla de una base de datos SQLite.
 
@@ -105,18 +137,24 @@ def insertar_filas_db(path:str, nombre_tabla:str,diccionario:dict):
         path (str): Ruta de la base de datos SQLite con la extensión '.db'.
         nombre_tabla (str): Nombre de la tabla en la que se insertarán las filas.
         diccionario (dict): Diccionario donde las claves son nombres (str) y los valores son temporadas (int).
-    ''' 
-    with sqlite3.connect(f"{path}.db") as conexion:
-        try:
-            for nombre,temporadas in diccionario.items():
-                conexion.execute(f"insert into {nombre_tabla}(nombre,temporadas) values (?,?)", (nombre,temporadas))
+        reportar_progreso (Callable[[int], None]): Opcional, recibe la cantidad de filas escritas después de cada lote.
 
-            conexion.commit()
-        except:
-            print("Error")
+    Todas las filas se insertan en una sola transacción con executemany (ver escritor_db.insertar_masivo).
+    Los jugadores que ya están en la tabla se actualizan en lugar de duplicarse, y solo se
+    escriben si cambió su valor, por lo que repetir la exportación no agrega filas.
+    ''' 
+    sentencia = f'''insert into {nombre_tabla}(nombre,temporadas) values (?,?)
+                    on conflict(nombre) do update set temporadas = excluded.temporadas
+                    where temporadas is not excluded.temporadas'''
+    try:
+        insertar_masivo(f"{path}.db", sentencia, diccionario.items(), reportar_progreso=reportar_progreso)
+    except sqlite3.Error as error:
+        print(f"Error: {error}")
                        
+@instrumentar
 def crear_db_posiciones(path:str, nombre_tabla:str):
-    with sqlite3.connect(f"{path}.db") as conexion:
+    conexion = pool_conexiones.obtener(f"{path}.db")
+    with conexion:
         try:
             sentencia = f''' create  table {nombre_tabla}
                             (
@@ -128,14 +166,13 @@ def crear_db_posiciones(path:str, nombre_tabla:str):
         except sqlite3.OperationalError:
             print("La tabla personajes ya existe") 
 
+@instrumentar
 def insertar_posisciones_db(path: str, nombre_tabla: str, lista_posisciones_unicas: list):
-    with sqlite3.connect(f"{path}.db") as conexion:
-        try:
-            for posicion in lista_posisciones_unicas:
-                conexion.execute(f'insert into {nombre_tabla}(Posiciones) values (?)', (posicion,))
-            conexion.commit()
-        except:
-            print('Error')
+    try:
+        insertar_masivo(f"{path}.db", f'insert into {nombre_tabla}(Posiciones) values (?)',
+                        ((posicion,) for posicion in lista_posisciones_unicas))
+    except sqlite3.Error as error:
+        print(f'Error: {error}')
 
 def convertir_string_a_diccionario(texto:str)->dict:
     """
@@ -188,6 +225,7 @@ def verificar_continuidad_de_ejecucion(mensaje:str)->bool:
             return True
         return False
 
+@instrumentar
 def quick_sort_lista_jugadores_recursivo(lista_jugadores:list[Jugador], menor_a_mayor:bool, campo:str):
     '''
     Se utliza para ordenar la lista de jugadores según un unico atributo de la clase estadistica
@@ -200,32 +238,9 @@ def quick_sort_lista_jugadores_recursivo(lista_jugadores:list[Jugador], menor_a_
     Retorna:
         list[Jugador]: La lista de jugadores ordenada de acuerdo al campo especificado y el orden indicado.
     '''
-    if len(lista_jugadores) <= 1:
-        return lista_jugadores
-
-    pivot = lista_jugadores[0]
-    lista_iz = []
-    lista_de = []
-
-    for jugador in lista_jugadores[1:]:
-        if menor_a_mayor:
-            if getattr(jugador.estadistica, campo) < getattr(pivot.estadistica, campo):
-                lista_iz.append(jugador)
-            else:
-                lista_de.append(jugador)
-        else:
-            if getattr(jugador.estadistica, campo) > getattr(pivot.estadistica, campo):
-                lista_iz.append(jugador)
-            else:
-                lista_de.append(jugador)
-
-    lista_iz = quick_sort_lista_jugadores_recursivo(lista_iz, menor_a_mayor,campo)
-    lista_iz.append(pivot)
-    lista_de = quick_sort_lista_jugadores_recursivo(lista_de, menor_a_mayor,campo)
-    lista_iz.extend(lista_de)
-
-    return lista_iz
+    return ordenar_jugadores(lista_jugadores, [(clave_estadistica(campo), menor_a_mayor)])
 
+@instrumentar
 def quick_sort_lista_jugadores_recursivo_dos_parametros(lista_jugadores:list[Jugador], menor_a_mayor:bool, campo_uno:str, campo_dos:str):
     '''
     Se utliza para ordenar la lista de jugadores según dos atributos sumados de la clase estadistica
@@ -239,34 +254,9 @@ def quick_sort_lista_jugadores_recursivo_dos_parametros(lista_jugadores:list[Jug
     Retorna:
         list[Jugador]: La lista de jugadores ordenada de acuerdo a la suma de los campos especificados y el orden indicado.
     '''
-    if len(lista_jugadores) <= 1:
-        return lista_jugadores
-
-    pivot = lista_jugadores[0]
-    lista_iz = []
-    lista_de = []
-
-    for jugador in lista_jugadores[1:]:
-        if menor_a_mayor:
-            if getattr(jugador.estadistica, campo_uno) + getattr(jugador.estadistica, campo_dos) <\
-                getattr(pivot.estadistica, campo_uno) + getattr(pivot.estadistica, campo_dos):
-                lista_iz.append(jugador)
-            else:
-                lista_de.append(jugador)
-        else:
-            if getattr(jugador.estadistica, campo_uno) + getattr(jugador.estadistica, campo_dos) >\
-                getattr(pivot.estadistica, campo_uno) + getattr(pivot.estadistica, campo_dos):
-                lista_iz.append(jugador)
-            else:
-                lista_de.append(jugador)
-
-    lista_iz = quick_sort_lista_jugadores_recursivo_dos_parametros(lista_iz, menor_a_mayor,campo_uno,campo_dos)
-    lista_iz.append(pivot)
-    lista_de = quick_sort_lista_jugadores_recursivo_dos_parametros(lista_de, menor_a_mayor,campo_uno,campo_dos)
-    lista_iz.extend(lista_de)
-
-    return lista_iz
+    return ordenar_jugadores(lista_jugadores, [((campo_uno, campo_dos), menor_a_mayor)])
 
+@instrumentar
 def quick_sort_lista_jugadores_atributo_primera_capa(lista_jugadores:list[Jugador], menor_a_mayor:bool, campo:str):
     '''
     Se utliza para ordenar la lista de jugadores según un unico atributo de la clase Jugador
@@ -279,43 +269,71 @@ def quick_sort_lista_jugadores_atributo_primera_capa(lista_jugadores:list[Jugado
     Retorna:
         list[Jugador]: La lista de jugadores ordenada de acuerdo al campo especificado y el orden indicado.
     '''
-    if len(lista_jugadores) <= 1:
-        return lista_jugadores
+    return ordenar_jugadores(lista_jugadores, [(clave_atributo(campo), menor_a_mayor)])
 
-    pivot = lista_jugadores[0]
-    lista_iz = []
-    lista_de = []
+def obtener_jugadores_ordenados_por(lista_de_jugadores:list[Jugador], mayor_a_menor:str,campo:str)->str:
+        return formatear_registros(obtener_registros_ordenados_por(lista_de_jugadores))
 
-    for jugador in lista_jugadores[1:]:
-        if menor_a_mayor:
-            if getattr(jugador, campo) < getattr(pivot, campo):
-                lista_iz.append(jugador)
-            else:
-                lista_de.append(jugador)
-        else:
-            if getattr(jugador, campo) > getattr(pivot, campo):
-                lista_iz.append(jugador)
-            else:
-                lista_de.append(jugador)
+@instrumentar
+def obtener_registros_ordenados_por(lista_de_jugadores: list[Jugador], campo: str = 'get_temporadas', mayor_a_menor: bool = True) -> list[tuple[str, int]]:
+    '''
+    Ordena los jugadores una sola vez y retorna los registros que consumen la pantalla y los exportadores.
 
-    lista_iz = quick_sort_lista_jugadores_atributo_primera_capa(lista_iz, menor_a_mayor,campo)
-    lista_iz.append(pivot)
-    lista_de = quick_sort_lista_jugadores_atributo_primera_capa(lista_de, menor_a_mayor,campo)
-    lista_iz.extend(lista_de)
+    Recibe:
+        lista_de_jugadores (list[Jugador]): Los jugadores a ordenar.
+        campo (str): El apartado estadístico por el que se ordena (por defecto 'get_temporadas').
+        mayor_a_menor (bool): Indica si se ordena de mayor a menor (True) o de menor a mayor (False).
 
-    return lista_iz
+    Retorna:
+        list[tuple[str, int]]: Una lista de pares (nombre del jugador, valor del campo) ordenada.
+    '''
+    obtener_valor = clave_estadistica(campo)
+    jugadores_ordenados = ordenar_jugadores(lista_de_jugadores, [(obtener_valor, not mayor_a_menor)])
+    return [(jugador.nombre, obtener_valor(jugador)) for jugador in jugadores_ordenados]
 
-def obtener_jugadores_ordenados_por(lista_de_jugadores:list[Jugador], mayor_a_menor:str,campo:str)->str:
-        string_retorno = ''
-        jugadores_ordenados_por_temporada = quick_sort_lista_jugadores_recursivo(lista_de_jugadores,False,'get_temporadas')
-        for jugador in jugadores_ordenados_por_temporada:
-            string_retorno += f'{jugador.nombre}: {jugador.estadistica.get_temporadas} temporadas \n'
-        return string_retorno
+@instrumentar
+def formatear_registros(registros: list[tuple[str, int]], unidad: str = 'temporadas') -> str:
+    '''
+    Arma el texto que se muestra por pantalla a partir de los registros, una línea por jugador.
+    '''
+    return ''.join(f'{nombre}: {valor} {unidad} \n' for nombre, valor in registros)
+
+@instrumentar
+def exportar_registros_csv(path: str, modo: str, registros: list[tuple[str, int]], encabezados: tuple = ('nombre', 'temporadas')):
+    '''
+    Exporta los registros a un archivo CSV con una fila de encabezados y una fila por jugador.
+    Usa el módulo csv, por lo que los valores con comas o comillas se escriben correctamente.
+    '''
+    try:
+        with open(path, modo, encoding='utf-8', newline='') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(encabezados)
+            escritor.writerows(registros)
+    except FileNotFoundError:
+        print(f"Error: Archivo no encontrado - {path}")
+    except PermissionError:
+        print(f"Error: Permiso denegado para acceder al archivo - {path}")
+
+@instrumentar
+def exportar_registros_json(path: str, modo: str, registros: list[tuple[str, int]]):
+    '''
+    Exporta los registros a un archivo JSON con el nombre de cada jugador como clave.
+    '''
+    exportar_json(path, modo, dict(registros))
+
+@instrumentar
+def exportar_registros_db(path: str, nombre_tabla: str, registros: list[tuple[str, int]], reportar_progreso=None):
+    '''
+    Crea la tabla si no existe e inserta los registros en la base de datos.
+    '''
+    if crear_db(path, nombre_tabla):
+        insertar_filas_db(path, nombre_tabla, dict(registros), reportar_progreso)
 
 def mostrar_nombre_y_apartado_estadisticos_jugador(jugador:Jugador,apartado_uno:str,apartado_dos:str)->str:
     return f'{jugador.nombre} {apartado_uno}: {getattr(jugador.estadistica, apartado_uno)} {apartado_dos}: {getattr(jugador.estadistica, apartado_dos)}' 
 
 
+@instrumentar
 def mostrar_nombre_y_apartado_estadisticos_equipo(lista_jugadores:list[Jugador],apartado_uno:str, apartado_dos:str):
 
     string_retorno = ''
@@ -326,6 +344,7 @@ def mostrar_nombre_y_apartado_estadisticos_equipo(lista_jugadores:list[Jugador],
 def obtener_porcentaje(valor_actual:int, valor_maximo:int):
     return (valor_actual * 100) / valor_maximo
 
+@instrumentar
 def listar_jugadores_ordenados_con_porcentaje(lista_jugadores_ordenados, apartado_uno, apartado_dos, hay_que_listar_todos = None):
     '''
         Lista los jugadores ordenados por un par de apartados estadísticos con su porcentaje en relación al máximo.
@@ -355,28 +374,51 @@ def listar_jugadores_ordenados_con_porcentaje(lista_jugadores_ordenados, apartad
     if hay_que_listar_todos:
         cantidad_a_listar = cantidad_jugadores  # Si no se especifica una cantidad, listar todos los jugadores.
     else:
-        while True:
-            cantidad_a_listar = input(f'Cuantos jugadores desea listar (1-{cantidad_jugadores})? ')
-            if not re.match(r'^\d+$', cantidad_a_listar):
-                print("La cantidad debe ser un número entero.")
-            else:
-                cantidad_a_listar = int(cantidad_a_listar)
-                if cantidad_a_listar < 1 or cantidad_a_listar > cantidad_jugadores:
-                    print(f"La cantidad debe estar entre 1 y {cantidad_jugadores}.")
-                else:
-                    break
+        cantidad_a_listar = pedir_cantidad_a_listar(cantidad_jugadores)
 
-    string_retorno = ''
     maximo_en_apartado_uno = getattr(lista_jugadores_ordenados[0].estadistica, apartado_uno)
     maximo_en_apartado_dos = getattr(lista_jugadores_ordenados[0].estadistica, apartado_dos)
     valores_maximos_sumados = maximo_en_apartado_uno + maximo_en_apartado_dos
 
-    for i, jugador in enumerate(lista_jugadores_ordenados[:cantidad_a_listar], start=1):
+    return formatear_jugadores_con_porcentaje(lista_jugadores_ordenados[:cantidad_a_listar], apartado_uno, apartado_dos, valores_maximos_sumados)
+
+def pedir_cantidad_a_listar(cantidad_jugadores: int) -> int:
+    '''
+    Le pide al usuario cuántos jugadores desea listar hasta que ingrese un número entre 1 y cantidad_jugadores.
+    '''
+    while True:
+        cantidad_a_listar = input(f'Cuantos jugadores desea listar (1-{cantidad_jugadores})? ')
+        if not re.match(r'^\d+$', cantidad_a_listar):
+            print("La cantidad debe ser un número entero.")
+        else:
+            cantidad_a_listar = int(cantidad_a_listar)
+            if cantidad_a_listar < 1 or cantidad_a_listar > cantidad_jugadores:
+                print(f"La cantidad debe estar entre 1 y {cantidad_jugadores}.")
+            else:
+                return cantidad_a_listar
+
+def formatear_jugadores_con_porcentaje(jugadores: list[Jugador], apartado_uno: str, apartado_dos: str, valores_maximos_sumados) -> str:
+    '''
+    Arma el listado numerado de jugadores con el porcentaje de la suma de los dos apartados
+    respecto de valores_maximos_sumados.
+    '''
+    lineas = []
+    for i, jugador in enumerate(jugadores, start=1):
         apartados_sumados_jugador_actual = getattr(jugador.estadistica, apartado_uno) + getattr(jugador.estadistica, apartado_dos)
-        string_retorno += f'{i}. {mostrar_nombre_y_apartado_estadisticos_jugador(jugador, apartado_uno, apartado_dos)} {round(obtener_porcentaje(apartados_sumados_jugador_actual, valores_maximos_sumados), 2)}%\n'
-    
-    return string_retorno
+        lineas.append(f'{i}. {mostrar_nombre_y_apartado_estadisticos_jugador(jugador, apartado_uno, apartado_dos)} {round(obtener_porcentaje(apartados_sumados_jugador_actual, valores_maximos_sumados), 2)}%\n')
+    return ''.join(lineas)
+
+@instrumentar
+def listar_top_jugadores_con_porcentaje(equipo: Equipo, cantidad_a_listar: int, apartado_uno: str, apartado_dos: str) -> str:
+    '''
+    Igual que listar_jugadores_ordenados_con_porcentaje pero sin ordenar todo el equipo:
+    selecciona solo los cantidad_a_listar mejores con Equipo.obtener_top_k, que además
+    retorna el máximo usado como 100%.
+    '''
+    jugadores, valores_maximos_sumados = equipo.obtener_top_k(cantidad_a_listar, apartado_uno, apartado_dos)
+    return formatear_jugadores_con_porcentaje(jugadores, apartado_uno, apartado_dos, valores_maximos_sumados)
     
+@instrumentar
 def imprimir_resultados(jugadores, dato_para_imprimir, apartado_estadistico=None):
     '''
     Imprime los resultados de una búsqueda de jugadores en función de un dato específico.
@@ -449,60 +491,74 @@ def mostrar_menu(patron_regex:str, menu:str): # Se utliza en bucle principal y s
         return opcion.upper()
     
 def dream_team_app(equipo:Equipo):
+    # Cada opción se mide con medir() después de sus input(), para no contar la espera del usuario
     ejecutar = True
     case_2_ejecutado, case_11_ejecutado = (None,None)
     while ejecutar:
         opcion = mostrar_menu('^[1-9]|10|11$',menu_inicial)
         match(opcion):
             case "1":
-                equipo.mostrar_jugadores()
+                with medir('opcion 1'):
+                    equipo.mostrar_jugadores()
             case "2":
                 case_2_ejecutado = True
-                jugador_elegido = mi_equipo.mostrar_estadistica_de_jugador_elegido_por_indice()
-                print(jugador_elegido.mostrar_estadistica_jugador())
+                jugador_elegido = equipo.mostrar_estadistica_de_jugador_elegido_por_indice()
+                with medir('opcion 2'):
+                    print(jugador_elegido.mostrar_estadistica_jugador())
             case '3':
                 if case_2_ejecutado:
-                    exportar_csv('archivo_prueba.csv','w',jugador_elegido.mostrar_estadistica_jugador())
+                    with medir('opcion 3'):
+                        exportar_roster_csv('archivo_prueba.csv',[jugador_elegido])
                 else:
                     print('\nprimero debe seleccionar un jugador...\n')
-                    jugador_elegido = mi_equipo.mostrar_estadistica_de_jugador_elegido_por_indice()
-                    print(jugador_elegido.mostrar_estadistica_jugador())
-                    exportar_csv('archivo_prueba.csv','w',jugador_elegido.mostrar_estadistica_jugador())
+                    jugador_elegido = equipo.mostrar_estadistica_de_jugador_elegido_por_indice()
+                    with medir('opcion 3'):
+                        print(jugador_elegido.mostrar_estadistica_jugador())
+                        exportar_roster_csv('archivo_prueba.csv',[jugador_elegido])
                 case_2_ejecutado = None 
             case '5':
-                jugadores_ordenados_por_promedio_de_puntos = quick_sort_lista_jugadores_atributo_primera_capa(equipo.lista_jugadores,True,'nombre')
-                imprimir_resultados(jugadores_ordenados_por_promedio_de_puntos,'get_promedio_puntos_por_partido')
+                with medir('opcion 5'):
+                    jugadores_ordenados_por_promedio_de_puntos = quick_sort_lista_jugadores_atributo_primera_capa(equipo.lista_jugadores,True,'nombre')
+                    imprimir_resultados(jugadores_ordenados_por_promedio_de_puntos,'get_promedio_puntos_por_partido')
             case '6': 
-                equipo.buscar_hall_oh_fame_por_nombre()
+                jugadores_consultados = equipo.buscar_jugador_por_nombre()
+                with medir('opcion 6'):
+                    equipo.buscar_hall_oh_fame_por_nombre(jugadores_consultados)
             case "7":
-                dato_a_buscar = "rebotes totales"
-                jugador_buscado = equipo.buscar_jugador_con_maximo_o_minimo_apartado_estadistico('get_rebotes_totales',True)
-                imprimir_resultados(jugador_buscado,dato_a_buscar, 'get_rebotes_totales')
+                with medir('opcion 7'):
+                    dato_a_buscar = "rebotes totales"
+                    jugador_buscado = equipo.buscar_jugador_con_maximo_o_minimo_apartado_estadistico('get_rebotes_totales',True)
+                    imprimir_resultados(jugador_buscado,dato_a_buscar, 'get_rebotes_totales')
             case "4":
                 jugador_buscado = equipo.buscar_jugador_por_nombre()
-                for jugador in jugador_buscado:
-                    jugador.mostrar_logros()
+                with medir('opcion 4'):
+                    for jugador in jugador_buscado:
+                        jugador.mostrar_logros()
 
             case '8':
                 ejecutar = True
                 salir_sub_menu = None
+                with medir('opcion 8'):
+                    registros_ordenados_por_temporadas = obtener_registros_ordenados_por(equipo.lista_jugadores,'get_temporadas')
+                    listado_ordenado_por_temporadas = formatear_registros(registros_ordenados_por_temporadas)
                 while ejecutar: 
-                    print(obtener_jugadores_ordenados_por(equipo.lista_jugadores,False,'get_temporadas'))  
+                    print(listado_ordenado_por_temporadas)  
                     opcion = mostrar_menu('^[Aa|Bb|Cc|Dd]{1}$', menu_punto_8)             
                     match(opcion):
                     
                         case 'A':
                             nombre_del_archivo = input('Ingrese el nombre con el que desea guardar el archivo: ').lower()
-                            exportar_csv(f'{nombre_del_archivo}.csv','w',obtener_jugadores_ordenados_por(equipo.lista_jugadores,False,'get_temporadas'))
+                            with medir('opcion 8 A'):
+                                exportar_registros_csv(f'{nombre_del_archivo}.csv','w',registros_ordenados_por_temporadas)
                         
                         case 'B':
                             nombre_del_archivo = input('Ingrese el nombre con el que desea guardar el archivo: ').lower()
-                            string_convertido_a_json = convertir_string_a_diccionario(obtener_jugadores_ordenados_por(equipo.lista_jugadores,False,'get_temporadas'))
-                            exportar_json(f'{nombre_del_archivo}.json','w',string_convertido_a_json) 
+                            with medir('opcion 8 B'):
+                                exportar_registros_json(f'{nombre_del_archivo}.json','w',registros_ordenados_por_temporadas) 
                             
                         case 'C':
-                            crear_db('db_jugadores_ordenados_por_temporadas','jugadores_ordenadados_temporadas')
-                            insertar_filas_db('db_jugadores_ordenados_por_temporadas','jugadores_ordenadados_temporadas',convertir_string_a_diccionario(obtener_jugadores_ordenados_por(equipo.lista_jugadores,False,'get_temporadas')))
+                            with medir('opcion 8 C'):
+                                exportar_registros_db('db_jugadores_ordenados_por_temporadas','jugadores_ordenadados_temporadas',registros_ordenados_por_temporadas,mostrar_progreso)
                             
                         case 'D':
                             salir_sub_menu = True
@@ -520,16 +576,19 @@ def dream_team_app(equipo:Equipo):
                     opcion = mostrar_menu('^[Aa|Bb|Cc|Dd]{1}$', menu_punto_9)
                     match(opcion):
                         case 'A':
-                            jugadores_ordenados_por_apartados_estadisticos_sumados = quick_sort_lista_jugadores_recursivo_dos_parametros(equipo.lista_jugadores,False,'get_robos_totales','get_bloqueos_totales')
-                            print(mostrar_nombre_y_apartado_estadisticos_equipo(jugadores_ordenados_por_apartados_estadisticos_sumados,'get_robos_totales','get_bloqueos_totales'))
+                            with medir('opcion 9 A'):
+                                jugadores_ordenados_por_apartados_estadisticos_sumados = quick_sort_lista_jugadores_recursivo_dos_parametros(equipo.lista_jugadores,False,'get_robos_totales','get_bloqueos_totales')
+                                print(mostrar_nombre_y_apartado_estadisticos_equipo(jugadores_ordenados_por_apartados_estadisticos_sumados,'get_robos_totales','get_bloqueos_totales'))
                             
                         case 'B':
-                            jugadores_ordenados_por_apartados_estadisticos_sumados = quick_sort_lista_jugadores_recursivo_dos_parametros(equipo.lista_jugadores,False,'get_robos_totales','get_bloqueos_totales')
-                            print(listar_jugadores_ordenados_con_porcentaje(jugadores_ordenados_por_apartados_estadisticos_sumados,'get_robos_totales','get_bloqueos_totales',True))
+                            with medir('opcion 9 B'):
+                                jugadores_ordenados_por_apartados_estadisticos_sumados = quick_sort_lista_jugadores_recursivo_dos_parametros(equipo.lista_jugadores,False,'get_robos_totales','get_bloqueos_totales')
+                                print(listar_jugadores_ordenados_con_porcentaje(jugadores_ordenados_por_apartados_estadisticos_sumados,'get_robos_totales','get_bloqueos_totales',True))
                             
                         case 'C':
-                            jugadores_ordenados_por_apartados_estadisticos_sumados = quick_sort_lista_jugadores_recursivo_dos_parametros(equipo.lista_jugadores,False,'get_robos_totales','get_bloqueos_totales')
-                            print(listar_jugadores_ordenados_con_porcentaje(jugadores_ordenados_por_apartados_estadisticos_sumados,'get_robos_totales','get_bloqueos_totales',False))
+                            cantidad_a_listar = pedir_cantidad_a_listar(len(equipo.lista_jugadores))
+                            with medir('opcion 9 C'):
+                                print(listar_top_jugadores_con_porcentaje(equipo,cantidad_a_listar,'get_robos_totales','get_bloqueos_totales'))
                             
                         case 'D':
                             salir_sub_menu = True
@@ -541,9 +600,10 @@ def dream_team_app(equipo:Equipo):
                         ejecutar = False    
                     limpiar_consola()
             case '10':
-                lista_posiciones = equipo.generar_lista_posiciones()
-                crear_db_posiciones('db_posiciones','tabla_posiciones')
-                insertar_posisciones_db('db_posiciones','tabla_posiciones',lista_posiciones)
+                with medir('opcion 10'):
+                    lista_posiciones = equipo.generar_lista_posiciones()
+                    crear_db_posiciones('db_posiciones','tabla_posiciones')
+                    insertar_posisciones_db('db_posiciones','tabla_posiciones',lista_posiciones)
                 
             case '11':
                 case_11_ejecutado = True
@@ -0,0 +1,152 @@
+import argparse
+import json
+import random
+from typing import Iterator
+
+POSICIONES = ('Base', 'Escolta', 'Alero', 'Ala-Pivot', 'Pivot')
+# Proporción aproximada de cada posición en una liga real
+PESOS_POSICIONES = (0.22, 0.22, 0.2, 0.18, 0.18)
+
+NOMBRES = ('Michael', 'Larry', 'Karl', 'John', 'Scottie', 'Patrick', 'David', 'Charles', 'Chris', 'Clyde',
+           'Christian', 'Earvin', 'Kevin', 'Tim', 'Shaquille', 'Kobe', 'Allen', 'Jason', 'Steve', 'Dirk',
+           'Paul', 'Ray', 'Tony', 'Manu', 'Pau', 'Dwyane', 'LeBron', 'Carmelo', 'Hakeem', 'Dwight',
+           'Russell', 'James', 'Anthony', 'Kawhi', 'Stephen', 'Klay', 'Giannis', 'Nikola', 'Luka', 'Joel')
+APELLIDOS = ('Jordan', 'Bird', 'Malone', 'Stockton', 'Pippen', 'Ewing', 'Robinson', 'Barkley', 'Mullin',
+             'Drexler', 'Laettner', 'Johnson', 'Garnett', 'Duncan', "O'Neal", 'Bryant', 'Iverson', 'Kidd',
+             'Nash', 'Nowitzki', 'Pierce', 'Allen', 'Parker', 'Ginóbili', 'Gasol', 'Wade', 'James', 'Anthony',
+             'Paul', 'Howard', 'Westbrook', 'Harden', 'Davis', 'Leonard', 'Curry', 'Thompson', 'Antetokounmpo',
+             'Jokić', 'Dončić', 'Embiid', 'Scola', 'Nocioni', 'Delfino', 'Prigioni', 'Oberto', 'Hernangómez',
+             'Rubio', 'Navarro', 'Calderón', 'Ibaka', 'Olajuwon', 'Chamberlain', 'Russell', 'Abdul-Jabbar',
+             'Erving', 'West', 'Baylor', 'Havlicek', 'Thomas', 'Dumars')
+
+# Promedios por partido típicos de cada posición: (puntos, rebotes, asistencias, robos, bloqueos)
+PERFILES_POSICION = {
+    'Base': (12.0, 3.2, 6.0, 1.3, 0.2),
+    'Escolta': (13.5, 3.8, 3.0, 1.1, 0.3),
+    'Alero': (12.5, 5.0, 2.5, 1.0, 0.5),
+    'Ala-Pivot': (11.5, 7.0, 1.8, 0.7, 0.9),
+    'Pivot': (10.5, 8.5, 1.5, 0.6, 1.5),
+}
+# Porcentaje de tiros de campo y de triples típicos de cada posición
+PORCENTAJES_POSICION = {
+    'Base': (44.0, 35.0),
+    'Escolta': (45.0, 36.0),
+    'Alero': (46.0, 34.0),
+    'Ala-Pivot': (49.0, 28.0),
+    'Pivot': (53.0, 18.0),
+}
+
+def _acotar(valor: float, minimo: float, maximo: float) -> float:
+    return max(minimo, min(maximo, valor))
+
+def generar_nombre(indice: int) -> str:
+    '''
+    Retorna un nombre único para el jugador 'indice' combinando nombres y apellidos reales.
+    Cuando se acaban las combinaciones se agrega un número romano al final.
+    '''
+    combinaciones = len(NOMBRES) * len(APELLIDOS)
+    vuelta, resto = divmod(indice, combinaciones)
+    nombre = f'{NOMBRES[resto % len(NOMBRES)]} {APELLIDOS[resto // len(NOMBRES)]}'
+    if vuelta:
+        nombre = f'{nombre} {_numero_romano(vuelta + 1)}'
+    return nombre
+
+def _numero_romano(numero: int) -> str:
+    valores = ((1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'), (100, 'C'), (90, 'XC'),
+               (50, 'L'), (40, 'XL'), (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I'))
+    romano = ''
+    for valor, simbolo in valores:
+        cantidad, numero = divmod(numero, valor)
+        romano += simbolo * cantidad
+    return romano
+
+def generar_logros(aleatorio: random.Random, temporadas: int, calidad: float, posicion: str) -> list[str]:
+    '''
+    Genera logros coherentes con la carrera: los jugadores de más calidad y más temporadas
+    acumulan más All-Star, campeonatos y premios, y son los que llegan al Salón de la Fama.
+    '''
+    logros = []
+    anio_debut = aleatorio.randint(1950, 2020)
+    campeonatos = int(aleatorio.random() < 0.25) * min(temporadas, aleatorio.randint(1, 3) + int(calidad > 2))
+    if campeonatos:
+        logros.append(f'{campeonatos} veces campeón de la NBA' if campeonatos > 1 else f'Campeón de la NBA ({anio_debut + aleatorio.randint(0, temporadas - 1)})')
+    if calidad > 1.5 and aleatorio.random() < 0.1:
+        mvps = aleatorio.randint(1, 4)
+        logros.append(f'{mvps} veces MVP de la NBA' if mvps > 1 else f'NBA MVP en {anio_debut + aleatorio.randint(0, temporadas - 1)}')
+    all_star = min(temporadas, int(max(0.0, calidad - 1.0) * temporadas * aleatorio.uniform(0.3, 1.0)))
+    if all_star:
+        logros.append(f'{all_star} veces All-Star')
+    if posicion in ('Base', 'Escolta') and calidad > 1.6 and aleatorio.random() < 0.05:
+        logros.append(f'{aleatorio.randint(1, 4)} veces líder de asistencias de la NBA')
+    if posicion in ('Ala-Pivot', 'Pivot') and aleatorio.random() < 0.03:
+        logros.append(f'Defensor del Año en la NBA en {anio_debut + aleatorio.randint(0, temporadas - 1)}')
+    if aleatorio.random() < 0.05:
+        logros.append(f'Medalla de oro olimpica ({aleatorio.randrange(1960, 2024, 4)})')
+    if aleatorio.random() < 0.02:
+        logros.append('Miembro del Salon de la Fama del Baloncesto Universitario')
+    if all_star >= 8 or (all_star >= 5 and campeonatos) or aleatorio.random() < 0.005:
+        logros.append('Miembro del Salon de la Fama del Baloncesto')
+    return logros
+
+def generar_diccionario_jugador(indice: int, aleatorio: random.Random) -> dict:
+    '''
+    Genera el diccionario de un jugador sintético con el mismo formato que dream_team.json.
+    Las estadísticas siguen distribuciones parecidas a las reales: carreras mayormente cortas,
+    promedios que dependen de la posición y de la calidad del jugador (lognormal, pocas
+    figuras y muchos suplentes) y totales calculados a partir de los partidos jugados.
+    '''
+    posicion = aleatorio.choices(POSICIONES, PESOS_POSICIONES)[0]
+    calidad = aleatorio.lognormvariate(0, 0.35)
+    temporadas = int(_acotar(aleatorio.gammavariate(2.0, 2.2 + calidad) + 1, 1, 22))
+    partidos = sum(aleatorio.randint(40, 82) for _ in range(temporadas))
+    puntos, rebotes, asistencias, robos, bloqueos = (promedio * calidad * aleatorio.uniform(0.75, 1.25)
+                                                     for promedio in PERFILES_POSICION[posicion])
+    tiros_de_campo, tiros_triples = PORCENTAJES_POSICION[posicion]
+    return {
+        'nombre': generar_nombre(indice),
+        'posicion': posicion,
+        'estadisticas': {
+            'temporadas': temporadas,
+            'puntos_totales': round(puntos * partidos),
+            'promedio_puntos_por_partido': round(puntos, 1),
+            'rebotes_totales': round(rebotes * partidos),
+            'promedio_rebotes_por_partido': round(rebotes, 1),
+            'asistencias_totales': round(asistencias * partidos),
+            'promedio_asistencias_por_partido': round(asistencias, 1),
+            'robos_totales': round(robos * partidos),
+            'bloqueos_totales': round(bloqueos * partidos),
+            'porcentaje_tiros_de_campo': round(_acotar(aleatorio.gauss(tiros_de_campo, 3.5), 30, 70), 1),
+            'porcentaje_tiros_libres': round(_acotar(aleatorio.gauss(76, 8), 40, 95), 1),
+            'porcentaje_tiros_triples': round(_acotar(aleatorio.gauss(tiros_triples, 6), 0, 50), 1),
+        },
+        'logros': generar_logros(aleatorio, temporadas, calidad, posicion),
+    }
+
+def generar_roster(cantidad: int, semilla: int = 0) -> Iterator[dict]:
+    '''
+    Genera de a uno los diccionarios de 'cantidad' jugadores sintéticos.
+    '''
+    aleatorio = random.Random(semilla)
+    for indice in range(cantidad):
+        yield generar_diccionario_jugador(indice, aleatorio)
+
+def escribir_roster(ruta: str, cantidad: int, semilla: int = 0, nombre_equipo: str = 'Equipo Sintetico') -> None:
+    '''
+    Escribe un archivo de roster sintético de 'cantidad' jugadores sin armarlo completo en memoria.
+    '''
+    with open(ruta, 'w', encoding='UTF-8') as archivo:
+        archivo.write(f'{{\n  "equipo": {json.dumps(nombre_equipo, ensure_ascii=False)},\n  "jugadores": [\n')
+        for indice, jugador in enumerate(generar_roster(cantidad, semilla)):
+            if indice:
+                archivo.write(',\n')
+            archivo.write(json.dumps(jugador, ensure_ascii=False))
+        archivo.write('\n  ]\n}\n')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Genera un roster sintético con el formato de dream_team.json')
+    parser.add_argument('ruta', help='Archivo JSON a generar')
+    parser.add_argument('--cantidad', '-n', type=int, default=10_000)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--equipo', default='Equipo Sintetico', help='Nombre del equipo que se escribe en el archivo')
+    argumentos = parser.parse_args()
+    escribir_roster(argumentos.ruta, argumentos.cantidad, argumentos.semilla, argumentos.equipo)
@@ -0,0 +1,136 @@
+import json
+import mmap
+import os
+import re
+import struct
+from array import array
+from jugador import Jugador
+from decodificador_jugadores import decodificar_jugador
+
+ENCABEZADO = struct.Struct('<4sIqq')
+MARCA = b'DTOF'
+VERSION_INDICE = 1
+
+_token = re.compile(rb'[{}\[\]"]')
+_fin_string = re.compile(rb'(?:[^"\\]|\\.)*"', re.S)
+_no_espacio = re.compile(rb'[^ \t\n\r]')
+# Todo lo que no es una llave o un corchete, incluyendo strings completos (que pueden contenerlos)
+_relleno = re.compile(rb'(?:[^{}"\[\]]+|"(?:[^"\\]+|\\.)*")*', re.S)
+
+def ruta_indice_offsets(ruta: str) -> str:
+    return f'{ruta}.offsets'
+
+def calcular_offsets(datos) -> array:
+    '''
+    Recorre los bytes de un archivo de roster sin decodificar su contenido y retorna un arreglo
+    con el byte de inicio y de fin de cada elemento del arreglo 'jugadores', de a pares.
+    '''
+    offsets = array('q')
+    profundidad = 0
+    posicion = 0
+    clave_actual = None
+    en_jugadores = False
+    inicio_elemento = 0
+    while True:
+        if en_jugadores and profundidad >= 3:
+            # Dentro de un jugador solo interesan las llaves y corchetes para encontrar dónde termina
+            inicio = _relleno.match(datos, posicion).end()
+            caracter = datos[inicio:inicio + 1]
+            if caracter not in (b'{', b'[', b'}', b']'):
+                raise ValueError(f'Archivo de roster mal formado cerca del byte {inicio}')
+        else:
+            coincidencia = _token.search(datos, posicion)
+            if coincidencia is None:
+                return offsets
+            caracter = coincidencia.group()
+            inicio = coincidencia.start()
+        if caracter == b'"':
+            fin = _fin_string.match(datos, inicio + 1).end()
+            if profundidad == 1:
+                siguiente = _no_espacio.search(datos, fin)
+                if siguiente and datos[siguiente.start():siguiente.start() + 1] == b':':
+                    clave_actual = datos[inicio + 1:fin - 1]
+            posicion = fin
+            continue
+        if caracter in (b'{', b'['):
+            profundidad += 1
+            if profundidad == 2 and caracter == b'[' and clave_actual == b'jugadores':
+                en_jugadores = True
+            elif en_jugadores and profundidad == 3:
+                inicio_elemento = inicio
+        else:
+            if en_jugadores and profundidad == 3:
+                offsets.append(inicio_elemento)
+                offsets.append(inicio + 1)
+            elif en_jugadores and profundidad == 2:
+                en_jugadores = False
+            profundidad -= 1
+        posicion = inicio + 1
+
+def guardar_indice_offsets(ruta: str, offsets: array) -> None:
+    estado = os.stat(ruta)
+    ruta_temporal = f'{ruta_indice_offsets(ruta)}.{os.getpid()}.tmp'
+    with open(ruta_temporal, 'wb') as archivo:
+        archivo.write(ENCABEZADO.pack(MARCA, VERSION_INDICE, estado.st_mtime_ns, estado.st_size))
+        offsets.tofile(archivo)
+    os.replace(ruta_temporal, ruta_indice_offsets(ruta))
+
+def cargar_indice_offsets(ruta: str):
+    '''
+    Retorna los offsets guardados en el índice del roster, o None si no existe
+    o el archivo de origen cambió desde que se generó.
+    '''
+    try:
+        with open(ruta_indice_offsets(ruta), 'rb') as archivo:
+            marca, version, mtime_ns, tamanio = ENCABEZADO.unpack(archivo.read(ENCABEZADO.size))
+            estado = os.stat(ruta)
+            if (marca, version, mtime_ns, tamanio) != (MARCA, VERSION_INDICE, estado.st_mtime_ns, estado.st_size):
+                return None
+            offsets = array('q')
+            offsets.frombytes(archivo.read())
+            return offsets
+    except (OSError, struct.error, ValueError):
+        return None
+
+class LectorRoster:
+    '''
+    Acceso aleatorio a los jugadores de un archivo de roster: el archivo se mapea en memoria
+    y solo se decodifica el jugador pedido, usando el índice de offsets guardado junto al
+    archivo (se genera la primera vez o cuando el archivo cambia).
+    '''
+    def __init__(self, ruta: str, clase_jugador: type = Jugador) -> None:
+        self.ruta = ruta
+        self.clase_jugador = clase_jugador
+        self.__archivo = open(ruta, 'rb')
+        self.__datos = mmap.mmap(self.__archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__offsets = cargar_indice_offsets(ruta)
+        if self.__offsets is None:
+            self.__offsets = calcular_offsets(self.__datos)
+            try:
+                guardar_indice_offsets(ruta, self.__offsets)
+            except OSError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self.__offsets) // 2
+
+    def obtener_diccionario(self, indice: int) -> dict:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError('Índice de jugador fuera de rango')
+        inicio, fin = self.__offsets[2 * indice], self.__offsets[2 * indice + 1]
+        return json.loads(self.__datos[inicio:fin])
+
+    def __getitem__(self, indice: int) -> Jugador:
+        return decodificar_jugador(self.obtener_diccionario(indice), self.clase_jugador, indice)
+
+    def cerrar(self) -> None:
+        self.__datos.close()
+        self.__archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
@@ -0,0 +1,435 @@
+import bisect
+import heapq
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Iterable
+from jugador import Jugador
+
+def normalizar_texto(texto: str) -> str:
+    '''
+    Pasa un texto a minúsculas y le quita los acentos para poder compararlo sin
+    importar cómo fue escrito ('Salón' y 'salon' quedan iguales).
+    '''
+    descompuesto = unicodedata.normalize('NFKD', texto.casefold())
+    return ''.join(caracter for caracter in descompuesto if not unicodedata.combining(caracter)).strip()
+
+LOGRO_HALL_OF_FAME = "Miembro del Salon de la Fama del Baloncesto"
+_cantidad_de_veces = re.compile(r'^\d+ veces ')
+
+def normalizar_logro(logro: str) -> list[str]:
+    '''
+    Retorna las claves con las que se indexa un logro: el texto normalizado y, si empieza
+    con una cantidad ('6 veces campeón de la NBA'), también el texto sin la cantidad
+    ('campeon de la nba').
+    '''
+    clave = normalizar_texto(logro)
+    sin_cantidad = _cantidad_de_veces.sub('', clave)
+    return [clave] if sin_cantidad == clave else [clave, sin_cantidad]
+
+def obtener_trigramas(texto: str) -> set[str]:
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+class IndiceNombres:
+    '''
+    Índice de nombres de jugadores que responde búsquedas por subcadena (con trigramas)
+    y por prefijo (con una lista ordenada), sin distinguir mayúsculas ni acentos.
+    Los resultados respetan el orden en que se agregaron los jugadores.
+    '''
+    def __init__(self, jugadores: Iterable[Jugador] = ()) -> None:
+        self.jugadores = []
+        self.__posiciones = {}
+        self.__nombres = []
+        self.__trigramas = defaultdict(set)
+        # Al construir se ordena una sola vez al final en lugar de insertar ordenado cada nombre
+        self.__nombres_ordenados = [self.__registrar(jugador) for jugador in jugadores]
+        self.__nombres_ordenados.sort()
+
+    def __registrar(self, jugador: Jugador) -> tuple[str, int]:
+        posicion = len(self.jugadores)
+        nombre = normalizar_texto(jugador.nombre or '')
+        self.jugadores.append(jugador)
+        self.__posiciones[jugador] = posicion
+        self.__nombres.append(nombre)
+        for trigrama in obtener_trigramas(nombre):
+            self.__trigramas[trigrama].add(posicion)
+        return (nombre, posicion)
+
+    def agregar(self, jugador: Jugador) -> int:
+        nombre, posicion = self.__registrar(jugador)
+        bisect.insort(self.__nombres_ordenados, (nombre, posicion))
+        return posicion
+
+    def quitar(self, jugador: Jugador) -> None:
+        '''
+        Quita un jugador del índice. Su posición queda vacía para no mover las de los demás.
+        '''
+        posicion = self.__posiciones.pop(jugador, None)
+        if posicion is None:
+            return
+        nombre = self.__nombres[posicion]
+        for trigrama in obtener_trigramas(nombre):
+            self.__trigramas[trigrama].discard(posicion)
+        i = bisect.bisect_left(self.__nombres_ordenados, (nombre, posicion))
+        del self.__nombres_ordenados[i]
+        self.__nombres[posicion] = ''
+        self.jugadores[posicion] = None
+
+    def buscar_subcadena(self, texto: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores cuyo nombre contiene el texto recibido.
+        Los textos de menos de tres caracteres no tienen trigramas y se comparan contra todos los nombres.
+        '''
+        texto = normalizar_texto(texto)
+        if not texto:
+            return []
+        trigramas = obtener_trigramas(texto)
+        if not trigramas:
+            candidatos = range(len(self.__nombres))
+        else:
+            conjuntos = sorted((self.__trigramas.get(trigrama, set()) for trigrama in trigramas), key=len)
+            candidatos = sorted(set.intersection(*conjuntos))
+        return [self.jugadores[posicion] for posicion in candidatos if texto in self.__nombres[posicion]]
+
+    def buscar_prefijo(self, prefijo: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores cuyo nombre empieza con el prefijo recibido.
+        '''
+        prefijo = normalizar_texto(prefijo)
+        posiciones = []
+        i = bisect.bisect_left(self.__nombres_ordenados, (prefijo,))
+        while i < len(self.__nombres_ordenados) and self.__nombres_ordenados[i][0].startswith(prefijo):
+            posiciones.append(self.__nombres_ordenados[i][1])
+            i += 1
+        return [self.jugadores[posicion] for posicion in sorted(posiciones)]
+
+class IndiceLogros:
+    '''
+    Índice invertido de logros: para cada logro normalizado guarda las posiciones de los
+    jugadores que lo tienen, para responder "quién tiene el logro X" sin recorrer a todos.
+    '''
+    def __init__(self, jugadores: Iterable[Jugador] = ()) -> None:
+        self.jugadores = []
+        self.__posiciones = {}
+        self.__posiciones_por_logro = defaultdict(set)
+        self.__consultas_resueltas = {}
+        self.__claves_por_logro = {}
+        self.__claves_consultadas = {}
+        for jugador in jugadores:
+            self.agregar(jugador)
+
+    def agregar(self, jugador: Jugador) -> int:
+        posicion = len(self.jugadores)
+        self.jugadores.append(jugador)
+        self.__posiciones[jugador] = posicion
+        for logro in jugador.lista_logros or ():
+            claves = self.__claves_por_logro.get(logro)
+            if claves is None:
+                claves = self.__claves_por_logro[logro] = normalizar_logro(logro)
+            for clave in claves:
+                self.__posiciones_por_logro[clave].add(posicion)
+        self.__consultas_resueltas.clear()
+        return posicion
+
+    def __claves(self, logros) -> set[str]:
+        claves = set()
+        for logro in logros or ():
+            claves.update(normalizar_logro(logro))
+        return claves
+
+    def __quitar_claves(self, posicion: int, claves: set[str]) -> None:
+        for clave in claves:
+            posiciones = self.__posiciones_por_logro.get(clave)
+            if posiciones is not None:
+                posiciones.discard(posicion)
+                if not posiciones:
+                    del self.__posiciones_por_logro[clave]
+
+    def quitar(self, jugador: Jugador) -> None:
+        '''
+        Quita un jugador del índice. Su posición queda vacía para no mover las de los demás.
+        '''
+        posicion = self.__posiciones.pop(jugador, None)
+        if posicion is None:
+            return
+        self.__quitar_claves(posicion, self.__claves(jugador.lista_logros))
+        self.jugadores[posicion] = None
+        self.__consultas_resueltas.clear()
+
+    def actualizar(self, jugador: Jugador, logros_anteriores: list[str]) -> None:
+        '''
+        Reindexa los logros de un jugador que ya estaba en el índice, conservando su posición.
+        '''
+        posicion = self.__posiciones.get(jugador)
+        if posicion is None:
+            self.agregar(jugador)
+            return
+        self.__quitar_claves(posicion, self.__claves(logros_anteriores))
+        for clave in self.__claves(jugador.lista_logros):
+            self.__posiciones_por_logro[clave].add(posicion)
+        self.__consultas_resueltas.clear()
+
+    def __clave(self, logro: str) -> str:
+        # tiene_logro se llama por cada jugador con el mismo texto: se normaliza una sola vez
+        clave = self.__claves_consultadas.get(logro)
+        if clave is None:
+            if len(self.__claves_consultadas) > 1024:
+                self.__claves_consultadas.clear()
+            clave = self.__claves_consultadas[logro] = normalizar_texto(logro)
+        return clave
+
+    def __posiciones_que_contienen(self, clave: str) -> set[int]:
+        if clave not in self.__consultas_resueltas:
+            posiciones = set()
+            for clave_indexada, posiciones_logro in self.__posiciones_por_logro.items():
+                if clave in clave_indexada:
+                    posiciones |= posiciones_logro
+            self.__consultas_resueltas[clave] = posiciones
+        return self.__consultas_resueltas[clave]
+
+    def __posiciones_de_logro(self, logro: str, exacto: bool) -> set[int]:
+        # Las búsquedas usan la clave exacta y, si no existe, cualquier logro que la contenga
+        clave = self.__clave(logro)
+        posiciones = self.__posiciones_por_logro.get(clave)
+        if posiciones is not None:
+            return posiciones
+        return set() if exacto else self.__posiciones_que_contienen(clave)
+
+    def posiciones_con_logro(self, logro: str) -> set[int]:
+        '''
+        Retorna las posiciones de los jugadores que tienen exactamente el logro
+        (sin distinguir mayúsculas, acentos ni la cantidad de veces).
+        '''
+        return set(self.__posiciones_de_logro(logro, exacto=True))
+
+    def posiciones_con_logro_que_contenga(self, texto: str) -> set[int]:
+        '''
+        Retorna las posiciones de los jugadores que tienen algún logro que contiene el texto
+        (por ejemplo 'MVP de las Finales').
+        '''
+        return set(self.__posiciones_que_contienen(self.__clave(texto)))
+
+    def tiene_logro(self, jugador: Jugador, logro: str) -> bool:
+        return self.__posiciones.get(jugador) in self.__posiciones_de_logro(logro, exacto=True)
+
+    def coincide_con_busqueda(self, jugador: Jugador, logro: str) -> bool:
+        '''
+        Retorna True si el jugador aparece en buscar(logro).
+        '''
+        return self.__posiciones.get(jugador) in self.__posiciones_de_logro(logro, exacto=False)
+
+    def contar(self, logro: str, exacto: bool = False) -> int:
+        return len(self.__posiciones_de_logro(logro, exacto))
+
+    def __jugadores_en_orden(self, posiciones: set[int]) -> list[Jugador]:
+        return [self.jugadores[posicion] for posicion in sorted(posiciones)]
+
+    def buscar(self, logro: str, exacto: bool = False) -> list[Jugador]:
+        '''
+        Retorna los jugadores que tienen el logro. Si no es exacto y ningún logro tiene ese texto,
+        se toman todos los logros que lo contienen.
+        '''
+        return self.__jugadores_en_orden(self.__posiciones_de_logro(logro, exacto))
+
+    def interseccion(self, *logros: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores que tienen todos los logros recibidos (con el criterio de buscar).
+        '''
+        conjuntos = sorted((self.__posiciones_de_logro(logro, exacto=False) for logro in logros), key=len)
+        return self.__jugadores_en_orden(set.intersection(*conjuntos) if conjuntos else set())
+
+    def union(self, *logros: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores que tienen al menos uno de los logros recibidos (con el criterio de buscar).
+        '''
+        return self.__jugadores_en_orden(set().union(*(self.__posiciones_de_logro(logro, exacto=False) for logro in logros)))
+
+class IndicePosiciones:
+    '''
+    Filas (posiciones en la lista) de los jugadores agrupadas por la posición en la que juegan.
+    '''
+    def __init__(self, jugadores: Iterable[Jugador] = ()) -> None:
+        self.jugadores = list(jugadores)
+        self.__filas_por_posicion = defaultdict(list)
+        for fila, jugador in enumerate(self.jugadores):
+            self.__filas_por_posicion[jugador.posicion].append(fila)
+
+    def contar(self, *posiciones: str) -> int:
+        return sum(len(self.__filas_por_posicion.get(posicion, ())) for posicion in set(posiciones))
+
+    def buscar(self, *posiciones: str) -> list[Jugador]:
+        '''
+        Retorna, en el orden de la lista, los jugadores que juegan en alguna de las posiciones recibidas.
+        '''
+        listas = [self.__filas_por_posicion.get(posicion, []) for posicion in set(posiciones)]
+        filas = listas[0] if len(listas) == 1 else heapq.merge(*listas)
+        return [self.jugadores[fila] for fila in filas]
+
+class IndiceEstadistica:
+    '''
+    Valores de un apartado estadístico ordenados junto con la fila (posición en la lista)
+    de cada jugador, para responder rangos ('más de 10 asistencias por partido') con bisect.
+    Los jugadores sin valor en el apartado no se incluyen.
+    '''
+    def __init__(self, jugadores: Iterable[Jugador], apartado_estadistico: str) -> None:
+        pares = sorted((valor, fila) for fila, jugador in enumerate(jugadores)
+                       if (valor := getattr(jugador.estadistica, apartado_estadistico)) is not None)
+        self.valores = [valor for valor, _ in pares]
+        self.filas = [fila for _, fila in pares]
+
+    def __limites(self, minimo, incluye_minimo: bool, maximo, incluye_maximo: bool) -> tuple[int, int]:
+        desde = 0 if minimo is None else (bisect.bisect_left if incluye_minimo else bisect.bisect_right)(self.valores, minimo)
+        hasta = len(self.valores) if maximo is None else (bisect.bisect_right if incluye_maximo else bisect.bisect_left)(self.valores, maximo)
+        return desde, max(desde, hasta)
+
+    def contar(self, minimo=None, incluye_minimo: bool = True, maximo=None, incluye_maximo: bool = True) -> int:
+        desde, hasta = self.__limites(minimo, incluye_minimo, maximo, incluye_maximo)
+        return hasta - desde
+
+    def rango(self, minimo=None, incluye_minimo: bool = True, maximo=None, incluye_maximo: bool = True) -> list[int]:
+        '''
+        Retorna, ordenadas, las filas de los jugadores cuyo valor está entre minimo y maximo.
+        Un límite en None no restringe.
+        '''
+        desde, hasta = self.__limites(minimo, incluye_minimo, maximo, incluye_maximo)
+        return sorted(self.filas[desde:hasta])
+
+def distancia_levenshtein(a: str, b: str) -> int:
+    '''
+    Retorna la cantidad mínima de letras a insertar, borrar o reemplazar para pasar de 'a' a 'b'.
+    '''
+    # El prefijo y el sufijo comunes no cambian la distancia: se descartan antes de armar la tabla
+    inicio = 0
+    while inicio < len(a) and inicio < len(b) and a[inicio] == b[inicio]:
+        inicio += 1
+    fin_a, fin_b = len(a), len(b)
+    while fin_a > inicio and fin_b > inicio and a[fin_a - 1] == b[fin_b - 1]:
+        fin_a -= 1
+        fin_b -= 1
+    a, b = a[inicio:fin_a], b[inicio:fin_b]
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    anterior = list(range(len(b) + 1))
+    for i, letra_a in enumerate(a, 1):
+        actual = [i]
+        for j, letra_b in enumerate(b, 1):
+            actual.append(min(anterior[j] + 1, actual[j - 1] + 1, anterior[j - 1] + (letra_a != letra_b)))
+        anterior = actual
+    return anterior[-1]
+
+class ArbolBK:
+    '''
+    Árbol BK: índice métrico de textos por distancia de edición. Cada hijo cuelga de su padre
+    según la distancia entre ambos, y por la desigualdad triangular una búsqueda con radio r
+    solo necesita bajar por los hijos a distancia entre d - r y d + r del padre.
+    '''
+    def __init__(self, textos: Iterable[str] = ()) -> None:
+        self.raiz = None
+        self.cantidad = 0
+        for texto in textos:
+            self.agregar(texto)
+
+    def agregar(self, texto: str) -> None:
+        if self.raiz is None:
+            self.raiz = (texto, {})
+            self.cantidad += 1
+            return
+        nodo = self.raiz
+        while True:
+            distancia = distancia_levenshtein(texto, nodo[0])
+            if distancia == 0:
+                return
+            hijo = nodo[1].get(distancia)
+            if hijo is None:
+                nodo[1][distancia] = (texto, {})
+                self.cantidad += 1
+                return
+            nodo = hijo
+
+    def buscar(self, texto: str, radio: int) -> list[tuple[int, str]]:
+        '''
+        Retorna los pares (distancia, texto) de los textos a distancia menor o igual al radio.
+        '''
+        resultado = []
+        pendientes = [self.raiz] if self.raiz is not None else []
+        while pendientes:
+            texto_nodo, hijos = pendientes.pop()
+            distancia = distancia_levenshtein(texto, texto_nodo)
+            if distancia <= radio:
+                resultado.append((distancia, texto_nodo))
+            for distancia_hijo, hijo in hijos.items():
+                if distancia - radio <= distancia_hijo <= distancia + radio:
+                    pendientes.append(hijo)
+        return resultado
+
+def radio_por_defecto(texto: str) -> int:
+    # Una letra mal cada cuatro, entre 1 y 3: 'jordn' admite 1, 'abdul-jabar' admite 2
+    return min(3, max(1, len(texto) // 4))
+
+class IndiceNombresAproximado:
+    '''
+    Búsqueda de nombres tolerante a errores de tipeo. Las palabras de los nombres se guardan
+    normalizadas en un ArbolBK; cada palabra de la búsqueda se compara contra ellas (no contra
+    todos los jugadores) y se retornan los jugadores que tienen, para cada palabra buscada,
+    una palabra parecida en su nombre, ordenados por la suma de las distancias.
+    '''
+    def __init__(self, jugadores: Iterable[Jugador] = ()) -> None:
+        self.jugadores = []
+        self.__posiciones = {}
+        self.__posiciones_por_palabra = defaultdict(set)
+        self.__arbol = ArbolBK()
+        for jugador in jugadores:
+            self.agregar(jugador)
+
+    def agregar(self, jugador: Jugador) -> int:
+        posicion = len(self.jugadores)
+        self.jugadores.append(jugador)
+        self.__posiciones[jugador] = posicion
+        for palabra in normalizar_texto(jugador.nombre or '').split():
+            if palabra not in self.__posiciones_por_palabra:
+                self.__arbol.agregar(palabra)
+            self.__posiciones_por_palabra[palabra].add(posicion)
+        return posicion
+
+    def quitar(self, jugador: Jugador) -> None:
+        '''
+        Quita un jugador del índice. Sus palabras quedan en el árbol (sin jugadores) para no rearmarlo.
+        '''
+        posicion = self.__posiciones.pop(jugador, None)
+        if posicion is None:
+            return
+        for palabra in normalizar_texto(jugador.nombre or '').split():
+            self.__posiciones_por_palabra[palabra].discard(posicion)
+        self.jugadores[posicion] = None
+
+    def buscar(self, texto: str, cantidad: int = 5, distancia_maxima: int = None) -> list[tuple[Jugador, int]]:
+        '''
+        Retorna hasta 'cantidad' pares (jugador, distancia) con los nombres más parecidos al texto,
+        de menor a mayor distancia (y en el orden del índice si empatan). La distancia es la suma,
+        para cada palabra buscada, de la distancia de edición a la palabra más parecida del nombre.
+
+        Recibe:
+            texto (str): Nombre o parte del nombre, con o sin errores ('Jordn', 'magic jonson').
+            cantidad (int): Cantidad máxima de jugadores a retornar.
+            distancia_maxima (int): Distancia máxima admitida para cada palabra buscada. Por defecto
+                                    depende del largo de la palabra (ver radio_por_defecto).
+        '''
+        puntajes = None
+        for palabra in normalizar_texto(texto).split():
+            radio = radio_por_defecto(palabra) if distancia_maxima is None else distancia_maxima
+            distancias = {}
+            for distancia, palabra_indexada in sorted(self.__arbol.buscar(palabra, radio), reverse=True):
+                for posicion in self.__posiciones_por_palabra[palabra_indexada]:
+                    distancias[posicion] = distancia
+            if puntajes is None:
+                puntajes = distancias
+            else:
+                puntajes = {posicion: puntaje + distancias[posicion] for posicion, puntaje in puntajes.items() if posicion in distancias}
+            if not puntajes:
+                return []
+        if puntajes is None:
+            return []
+        mejores = heapq.nsmallest(cantidad, puntajes.items(), key=lambda item: (item[1], item[0]))
+        return [(self.jugadores[posicion], puntaje) for posicion, puntaje in mejores]
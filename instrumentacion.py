@@ -0,0 +1,144 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+# Ejemplos: DREAM_TEAM_METRICAS=1  |  DREAM_TEAM_METRICAS=memoria,traza=traza.json
+VARIABLE_ENTORNO = 'DREAM_TEAM_METRICAS'
+RUTA_TRAZA_POR_DEFECTO = 'dream_team_traza.json'
+
+def leer_opciones(valor: str) -> dict:
+    '''
+    Interpreta el valor de la variable de entorno: una lista separada por comas con
+    'tabla' (resumen al salir), 'memoria' (medir memoria asignada con tracemalloc) y
+    'traza' o 'traza=archivo.json' (traza en formato Chrome). Cualquier otro valor no vacío
+    (por ejemplo '1') equivale a 'tabla'. Retorna un diccionario vacío si está desactivada.
+    '''
+    opciones = {}
+    for parte in filter(None, (parte.strip() for parte in (valor or '').split(','))):
+        clave, _, argumento = parte.partition('=')
+        if clave == 'traza':
+            opciones['traza'] = argumento or RUTA_TRAZA_POR_DEFECTO
+        elif clave == 'memoria':
+            opciones['memoria'] = True
+        elif clave not in ('0', 'no', 'false'):
+            opciones['tabla'] = True
+    if opciones and 'traza' not in opciones:
+        opciones['tabla'] = True
+    return opciones
+
+class Metricas:
+    '''
+    Acumula, para cada función u operación medida, la cantidad de llamadas, el tiempo total
+    y máximo y la memoria neta asignada. Si se pide, guarda además cada llamada como evento
+    de una traza en formato Chrome (chrome://tracing o https://ui.perfetto.dev).
+    '''
+    def __init__(self, medir_memoria: bool = False, guardar_eventos: bool = False) -> None:
+        self.medir_memoria = medir_memoria
+        self.guardar_eventos = guardar_eventos
+        self.acumulados = {}
+        self.eventos = []
+        self.inicio_ns = time.perf_counter_ns()
+        self.__candado = threading.Lock()
+        if medir_memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def registrar(self, nombre: str, inicio_ns: int, duracion_ns: int, memoria: int) -> None:
+        with self.__candado:
+            acumulado = self.acumulados.get(nombre)
+            if acumulado is None:
+                acumulado = self.acumulados[nombre] = [0, 0, 0, 0]
+            acumulado[0] += 1
+            acumulado[1] += duracion_ns
+            acumulado[2] = max(acumulado[2], duracion_ns)
+            acumulado[3] += memoria
+            if self.guardar_eventos:
+                self.eventos.append({
+                    'name': nombre, 'cat': nombre.split('.')[0], 'ph': 'X', 'pid': os.getpid(),
+                    'tid': threading.get_ident(), 'ts': (inicio_ns - self.inicio_ns) / 1000,
+                    'dur': duracion_ns / 1000, 'args': {'memoria_bytes': memoria} if self.medir_memoria else {},
+                })
+
+    def medir(self, nombre: str):
+        return _Medicion(self, nombre)
+
+    def resumen(self) -> str:
+        '''
+        Retorna una tabla con una fila por operación, ordenada por tiempo total.
+        '''
+        encabezado = f'{"operacion":<60} {"llamadas":>9} {"total ms":>11} {"promedio ms":>12} {"maximo ms":>11}'
+        if self.medir_memoria:
+            encabezado += f' {"memoria KiB":>12}'
+        lineas = [encabezado, '-' * len(encabezado)]
+        for nombre, (llamadas, total, maximo, memoria) in sorted(self.acumulados.items(), key=lambda item: -item[1][1]):
+            linea = f'{nombre:<60} {llamadas:>9} {total / 1e6:>11.3f} {total / llamadas / 1e6:>12.3f} {maximo / 1e6:>11.3f}'
+            if self.medir_memoria:
+                linea += f' {memoria / 1024:>12.1f}'
+            lineas.append(linea)
+        return '\n'.join(lineas)
+
+    def guardar_traza(self, ruta: str) -> None:
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump({'traceEvents': self.eventos, 'displayTimeUnit': 'ms'}, archivo)
+
+class _Medicion:
+    __slots__ = ('metricas', 'nombre', 'inicio_ns', 'memoria_inicial')
+
+    def __init__(self, metricas: Metricas, nombre: str) -> None:
+        self.metricas = metricas
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.memoria_inicial = tracemalloc.get_traced_memory()[0] if self.metricas.medir_memoria else 0
+        self.inicio_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        duracion_ns = time.perf_counter_ns() - self.inicio_ns
+        memoria = tracemalloc.get_traced_memory()[0] - self.memoria_inicial if self.metricas.medir_memoria else 0
+        self.metricas.registrar(self.nombre, self.inicio_ns, duracion_ns, memoria)
+
+OPCIONES = leer_opciones(os.environ.get(VARIABLE_ENTORNO))
+metricas = Metricas(OPCIONES.get('memoria', False), 'traza' in OPCIONES) if OPCIONES else None
+_SIN_MEDICION = nullcontext()
+
+def medir(nombre: str):
+    '''
+    Context manager que mide el bloque con el nombre recibido. Con la instrumentación
+    desactivada retorna siempre el mismo contexto vacío.
+    '''
+    if metricas is None:
+        return _SIN_MEDICION
+    return metricas.medir(nombre)
+
+def instrumentar(funcion):
+    '''
+    Decorador que mide cada llamada a la función. Se decide al importar el módulo: con la
+    instrumentación desactivada retorna la misma función, sin ningún costo en las llamadas.
+    '''
+    if metricas is None:
+        return funcion
+    nombre = f'{funcion.__module__}.{funcion.__qualname__}'
+
+    @functools.wraps(funcion)
+    def funcion_medida(*args, **kwargs):
+        with metricas.medir(nombre):
+            return funcion(*args, **kwargs)
+    return funcion_medida
+
+def _reportar_al_salir() -> None:
+    if OPCIONES.get('tabla'):
+        print(metricas.resumen(), file=sys.stderr)
+    if 'traza' in OPCIONES:
+        try:
+            metricas.guardar_traza(OPCIONES['traza'])
+        except OSError as error:
+            print(f"Error: no se pudo guardar la traza - {error}", file=sys.stderr)
+
+if metricas is not None:
+    atexit.register(_reportar_al_salir)
@@ -1,5 +1,6 @@
-from estadisticas import Estadistica
+from estadisticas import Estadistica, EstadisticaCompacta, CAMPOS_ESTADISTICOS
 import copy
+import sys
 
 class Jugador:
     def __init__(self,jugador:dict) -> None:
@@ -7,6 +8,21 @@ class Jugador:
         self.nombre = jugador.get('nombre')
         self.posicion =jugador.get('posicion')
         self.estadistica = Estadistica(jugador['estadisticas'])
+
+    clase_estadistica = Estadistica
+
+    @classmethod
+    def desde_valores(cls, nombre: str, posicion: str, logros: list, estadistica):
+        '''
+        Arma un Jugador a partir de valores ya validados y de su estadística ya construida.
+        Es el constructor que usa el decodificador de jugadores para no pasar por un diccionario.
+        '''
+        jugador = object.__new__(cls)
+        jugador.lista_logros = logros
+        jugador.nombre = nombre
+        jugador.posicion = posicion
+        jugador.estadistica = estadistica
+        return jugador
         
     def mostrar_nombre_y_posicion(self):
         print(f'Nombre: {self.nombre} posicion: {self.posicion}')
@@ -37,6 +53,26 @@ class Jugador:
             Temporadas: {self.estadistica.get_temporadas}
             '''
 
+    def a_diccionario(self) -> dict:
+        '''
+        Retorna el jugador con el mismo formato que tiene en el archivo JSON del equipo.
+        '''
+        return {
+            'nombre': self.nombre,
+            'posicion': self.posicion,
+            'estadisticas': {campo: getattr(self.estadistica, f'get_{campo}') for campo in CAMPOS_ESTADISTICOS},
+            'logros': list(self.lista_logros or ()),
+        }
+
+    def actualizar_desde(self, jugador) -> None:
+        '''
+        Copia la posición, las estadísticas y los logros de otro jugador con el mismo nombre,
+        conservando este objeto (y las referencias que otros tengan a él).
+        '''
+        self.posicion = jugador.posicion
+        self.estadistica = jugador.estadistica
+        self.lista_logros = list(jugador.lista_logros or ())
+
     def is_hall_of_fame(self)->bool:
         '''
         recibe un jugador y retorna True si ser hall of fame está entre sos logros
@@ -44,4 +80,75 @@ class Jugador:
         '''
         mensaje = "Miembro del Salon de la Fama del Baloncesto"
         return mensaje in self.lista_logros
-        
+
+class TablaLogros:
+    '''
+    Tabla compartida de logros: cada texto distinto se guarda una sola vez
+    y los jugadores compactos solo guardan su id.
+    '''
+    def __init__(self) -> None:
+        self.textos = []
+        self.__ids = {}
+
+    def obtener_id(self, logro: str) -> int:
+        id_logro = self.__ids.get(logro)
+        if id_logro is None:
+            id_logro = len(self.textos)
+            self.textos.append(sys.intern(logro))
+            self.__ids[logro] = id_logro
+        return id_logro
+
+tabla_logros = TablaLogros()
+
+class JugadorCompacto:
+    '''
+    Versión de Jugador con __slots__, posición internada y logros guardados como una
+    tupla de ids de la tabla_logros compartida. Tiene los mismos métodos que Jugador.
+    '''
+    __slots__ = ('nombre', 'posicion', 'estadistica', 'ids_logros')
+
+    def __init__(self, jugador: dict) -> None:
+        self.ids_logros = tuple(tabla_logros.obtener_id(logro) for logro in jugador.get('logros') or ())
+        self.nombre = jugador.get('nombre')
+        posicion = jugador.get('posicion')
+        self.posicion = sys.intern(posicion) if posicion is not None else None
+        self.estadistica = EstadisticaCompacta(jugador['estadisticas'])
+
+    clase_estadistica = EstadisticaCompacta
+
+    @classmethod
+    def desde_valores(cls, nombre: str, posicion: str, logros: list, estadistica):
+        '''
+        Igual que Jugador.desde_valores.
+        '''
+        jugador = object.__new__(cls)
+        jugador.ids_logros = tuple([tabla_logros.obtener_id(logro) for logro in logros])
+        jugador.nombre = nombre
+        jugador.posicion = sys.intern(posicion)
+        jugador.estadistica = estadistica
+        return jugador
+
+    @property
+    def lista_logros(self) -> list[str]:
+        return [tabla_logros.textos[id_logro] for id_logro in self.ids_logros]
+
+    def __getstate__(self) -> tuple:
+        # Los ids solo tienen sentido en este proceso: se guardan los textos de los logros
+        return (self.nombre, self.posicion, self.estadistica, self.lista_logros)
+
+    def __setstate__(self, estado: tuple) -> None:
+        self.nombre, posicion, self.estadistica, lista_logros = estado
+        self.posicion = sys.intern(posicion) if posicion is not None else None
+        self.ids_logros = tuple(tabla_logros.obtener_id(logro) for logro in lista_logros)
+
+    def actualizar_desde(self, jugador) -> None:
+        self.posicion = sys.intern(jugador.posicion) if jugador.posicion is not None else None
+        self.estadistica = jugador.estadistica
+        self.ids_logros = tuple(tabla_logros.obtener_id(logro) for logro in jugador.lista_logros or ())
+
+    mostrar_nombre_y_posicion = Jugador.mostrar_nombre_y_posicion
+    mostrar_logros = Jugador.mostrar_logros
+    mostrar_nombre_y_apartado_estadisticos_jugador = Jugador.mostrar_nombre_y_apartado_estadisticos_jugador
+    mostrar_estadistica_jugador = Jugador.mostrar_estadistica_jugador
+    a_diccionario = Jugador.a_diccionario
+    is_hall_of_fame = Jugador.is_hall_of_fame
@@ -0,0 +1,113 @@
+import json
+import re
+from typing import Iterator
+from jugador import Jugador
+from decodificador_jugadores import decodificar_jugador
+
+_decodificador = json.JSONDecoder()
+_no_espacio = re.compile(r'[^ \t\n\r]')
+
+class _LectorIncremental:
+    '''
+    Lee un archivo de texto por bloques y decodifica valores JSON de a uno,
+    conservando en memoria solo el bloque actual y el valor que se está leyendo.
+    '''
+    def __init__(self, archivo, tamanio_bloque: int) -> None:
+        self.archivo = archivo
+        self.tamanio_bloque = tamanio_bloque
+        self.buffer = ''
+        self.posicion = 0
+        self.fin_de_archivo = False
+
+    def cargar_bloque(self) -> bool:
+        bloque = self.archivo.read(self.tamanio_bloque)
+        if not bloque:
+            self.fin_de_archivo = True
+            return False
+        self.buffer = self.buffer[self.posicion:] + bloque
+        self.posicion = 0
+        return True
+
+    def siguiente_caracter(self) -> str:
+        '''
+        Retorna el próximo caracter que no sea un espacio sin consumirlo.
+        Retorna '' si se llegó al final del archivo.
+        '''
+        while True:
+            coincidencia = _no_espacio.search(self.buffer, self.posicion)
+            if coincidencia:
+                self.posicion = coincidencia.start()
+                return self.buffer[self.posicion]
+            self.posicion = len(self.buffer)
+            if not self.cargar_bloque():
+                return ''
+
+    def consumir(self, esperado: str) -> None:
+        if self.siguiente_caracter() != esperado:
+            raise json.JSONDecodeError(f'Se esperaba {esperado!r}', self.buffer, self.posicion)
+        self.posicion += 1
+
+    def decodificar_valor(self):
+        '''
+        Decodifica el próximo valor JSON completo. Si el bloque actual lo corta
+        a la mitad se leen más bloques hasta poder decodificarlo.
+        '''
+        self.siguiente_caracter()
+        while True:
+            try:
+                valor, fin = _decodificador.raw_decode(self.buffer, self.posicion)
+                # Un número al final del buffer podría continuar en el próximo bloque
+                if fin < len(self.buffer) or self.fin_de_archivo:
+                    self.posicion = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self.fin_de_archivo:
+                    raise
+            self.cargar_bloque()
+
+def iterar_diccionarios_jugadores(ruta: str, tamanio_bloque: int = 65536) -> Iterator[dict]:
+    '''
+    Recorre el arreglo 'jugadores' de un archivo de roster sin cargar el archivo completo.
+
+    Recibe:
+        ruta (str): Ruta del archivo JSON del equipo.
+        tamanio_bloque (int): Cantidad de caracteres que se leen del archivo por vez.
+
+    Retorna:
+        Iterator[dict]: Un generador que produce el diccionario de cada jugador a medida que se lee.
+    '''
+    with open(ruta, 'r', encoding='UTF-8') as archivo:
+        lector = _LectorIncremental(archivo, tamanio_bloque)
+        lector.consumir('{')
+        if lector.siguiente_caracter() == '}':
+            return
+        while True:
+            clave = lector.decodificar_valor()
+            lector.consumir(':')
+            if clave == 'jugadores':
+                lector.consumir('[')
+                if lector.siguiente_caracter() == ']':
+                    return
+                while True:
+                    yield lector.decodificar_valor()
+                    if lector.siguiente_caracter() != ',':
+                        lector.consumir(']')
+                        return
+                    lector.posicion += 1
+            lector.decodificar_valor()
+            if lector.siguiente_caracter() != ',':
+                lector.consumir('}')
+                return
+            lector.posicion += 1
+
+def generar_jugadores(ruta: str, tamanio_bloque: int = 65536, clase_jugador: type = Jugador) -> Iterator[Jugador]:
+    '''
+    Genera los objetos Jugador de un archivo de roster de a uno, a medida que se leen.
+    El diccionario de cada jugador se descarta apenas se construye su objeto.
+    Lanza ErrorDecodificacion al llegar a un jugador que no cumple el esquema.
+    '''
+    try:
+        for indice, diccionario_jugador in enumerate(iterar_diccionarios_jugadores(ruta, tamanio_bloque)):
+            yield decodificar_jugador(diccionario_jugador, clase_jugador, indice)
+    except FileNotFoundError:
+        print("Error: Archivo no encontrado")
@@ -0,0 +1,193 @@
+import argparse
+import glob
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from equipo import Equipo
+from jugador import Jugador
+from decodificador_jugadores import decodificar_jugadores, decodificar_valores, construir_jugadores
+from seguimiento_cambios import Cambios
+
+def resolver_rutas(patron: str) -> list[str]:
+    '''
+    Recibe un directorio (se toman todos sus .json) o un patrón glob y retorna las rutas ordenadas.
+    '''
+    if os.path.isdir(patron):
+        patron = os.path.join(patron, '*.json')
+    return sorted(glob.glob(patron))
+
+def _leer_json_equipo(ruta: str) -> tuple[str, list[dict]]:
+    with open(ruta, 'r', encoding='UTF-8') as archivo:
+        datos = json.load(archivo)
+    nombre_equipo = datos.get('equipo') or os.path.splitext(os.path.basename(ruta))[0]
+    return nombre_equipo, datos.get('jugadores', [])
+
+def cargar_archivo_equipo(ruta: str, clase_jugador: type = Jugador) -> tuple[str, list[Jugador]]:
+    '''
+    Lee un archivo de equipo y retorna su nombre (o el nombre del archivo si no lo tiene)
+    y la lista de jugadores.
+    '''
+    nombre_equipo, diccionarios = _leer_json_equipo(ruta)
+    return nombre_equipo, decodificar_jugadores(diccionarios, clase_jugador)
+
+def leer_archivo_equipo(ruta: str) -> tuple[str, list[tuple]]:
+    '''
+    Igual que cargar_archivo_equipo pero retorna los valores ya validados de cada jugador (ver
+    decodificador_jugadores.decodificar_valores) en lugar de los objetos. Se ejecuta en los procesos
+    del pool: las tuplas vuelven al proceso principal mucho más rápido que los objetos serializados.
+    '''
+    nombre_equipo, diccionarios = _leer_json_equipo(ruta)
+    return nombre_equipo, decodificar_valores(diccionarios)
+
+class CambiosLiga(Cambios):
+    '''
+    Cambios de una Liga. Además de los de Cambios, recuerda los archivos leídos y el origen
+    (archivo, equipo) de cada jugador leído, para que aplicar_cambios pueda registrar el de los agregados.
+    '''
+    def __init__(self, cambios: Cambios, rutas: list[str], origen_de_jugador: dict) -> None:
+        super().__init__(cambios.agregados, cambios.modificados, cambios.eliminados, cambios.hashes,
+                         cambios.clave, cambios.completo)
+        self.rutas = rutas
+        self.origen_de_jugador = origen_de_jugador
+
+class Liga(Equipo):
+    '''
+    Colección de varios equipos (un archivo JSON por equipo y temporada) que se consulta como un
+    único Equipo. Los archivos se leen y validan en paralelo en un pool de procesos, los jugadores
+    se arman en el proceso principal y cada uno recuerda el archivo y el equipo del que proviene.
+    '''
+    def __init__(self, patron: str, procesos: int = None, columnar: bool = False, compacto: bool = False) -> None:
+        '''
+        Recibe:
+            patron (str): Directorio con los archivos de los equipos o patrón glob (por ejemplo 'equipos/*_1992.json').
+            procesos (int): Cantidad de procesos del pool (por defecto la cantidad de núcleos).
+            columnar (bool): Ver Equipo.
+            compacto (bool): Ver Equipo.
+        '''
+        self.procesos = procesos
+        self.rutas = resolver_rutas(patron)
+        self.__origen_de_jugador = {}
+        super().__init__(patron, columnar=columnar, compacto=compacto)
+
+    def rutas_archivos(self) -> list[str]:
+        return resolver_rutas(self.ruta)
+
+    def clave_jugador(self, jugador: Jugador) -> tuple:
+        '''
+        Los archivos de distintas temporadas repiten nombres: cada jugador se identifica por su archivo y su nombre.
+        '''
+        return self.archivo_de(jugador), jugador.nombre
+
+    def hashes_por_nombre(self) -> dict[str, str]:
+        hashes = self.hashes_jugadores()
+        # Con nombres repetidos quedan menos hashes que jugadores y las exportaciones delta se escriben completas
+        return {jugador.nombre: hashes[self.clave_jugador(jugador)] for jugador in self.lista_jugadores}
+
+    def __leer_archivos(self) -> tuple[list[str], list[Jugador], dict]:
+        '''
+        Lee todos los archivos de la liga sin modificarla.
+        Retorna (rutas, jugadores, {jugador: (archivo, nombre de su equipo)}).
+        '''
+        rutas = self.rutas_archivos()
+        if len(rutas) <= 1 or self.procesos == 1:
+            return (rutas, *self.__unir_resultados(rutas, map(cargar_archivo_equipo, rutas, [self.clase_jugador] * len(rutas))))
+        with ProcessPoolExecutor(max_workers=self.procesos) as pool:
+            # Cada archivo se arma mientras los procesos siguen leyendo los siguientes
+            equipos = [(nombre_equipo, construir_jugadores(valores, self.clase_jugador))
+                       for nombre_equipo, valores in pool.map(leer_archivo_equipo, rutas)]
+        return (rutas, *self.__unir_resultados(rutas, equipos))
+
+    def __unir_resultados(self, rutas: list[str], equipos) -> tuple[list[Jugador], dict]:
+        origen_de_jugador = {}
+        lista_jugadores = []
+        for ruta, (nombre_equipo, jugadores) in zip(rutas, equipos):
+            for jugador in jugadores:
+                origen_de_jugador[jugador] = (ruta, nombre_equipo)
+            lista_jugadores.extend(jugadores)
+        return lista_jugadores, origen_de_jugador
+
+    def cargar_lista_jugadores(self) -> list[Jugador]:
+        self.rutas, lista_jugadores, self.__origen_de_jugador = self.__leer_archivos()
+        return lista_jugadores
+
+    def cambios_en_archivo(self) -> 'CambiosLiga':
+        '''
+        Vuelve a leer todos los archivos de la liga y los compara con los jugadores cargados, sin
+        modificar la liga. Los cambios recuerdan además el origen de cada jugador leído.
+        '''
+        rutas, jugadores, origen_de_jugador = self.__leer_archivos()
+        cambios = self.cambios_respecto_de(jugadores, clave=lambda jugador: (origen_de_jugador[jugador][0], jugador.nombre))
+        return CambiosLiga(cambios, rutas, origen_de_jugador)
+
+    def aplicar_cambios(self, cambios: Cambios) -> None:
+        '''
+        Igual que Equipo.aplicar_cambios. Si los cambios vienen de cambios_en_archivo los jugadores
+        agregados quedan asociados a su archivo y su equipo y la liga toma la lista de archivos nueva.
+        '''
+        super().aplicar_cambios(cambios)
+        origenes_leidos = {}
+        if isinstance(cambios, CambiosLiga):
+            origenes_leidos = cambios.origen_de_jugador
+            self.rutas = cambios.rutas
+        origen_anterior = self.__origen_de_jugador
+        # Los eliminados dejan de estar en la lista; los que siguen conservan su objeto y su origen
+        self.__origen_de_jugador = {jugador: origenes_leidos[jugador] if jugador in origenes_leidos else origen_anterior.get(jugador, (None, None))
+                                    for jugador in self.lista_jugadores}
+
+    def agregar_jugador(self, jugador: Jugador, nombre_equipo: str = None, ruta: str = None) -> None:
+        self.__origen_de_jugador[jugador] = (ruta, nombre_equipo)
+        super().agregar_jugador(jugador)
+
+    def eliminar_jugador(self, jugador: Jugador) -> None:
+        super().eliminar_jugador(jugador)
+        self.__origen_de_jugador.pop(jugador, None)
+
+    def equipo_de(self, jugador: Jugador) -> str:
+        '''
+        Retorna el nombre del equipo del que proviene el jugador.
+        '''
+        return self.__origen_de_jugador.get(jugador, (None, None))[1]
+
+    def archivo_de(self, jugador: Jugador) -> str:
+        '''
+        Retorna el archivo (equipo y temporada) del que proviene el jugador.
+        '''
+        return self.__origen_de_jugador.get(jugador, (None, None))[0]
+
+    def nombres_equipos(self) -> list[str]:
+        return list(dict.fromkeys(self.equipo_de(jugador) for jugador in self.lista_jugadores))
+
+    def jugadores_de_equipo(self, nombre_equipo: str) -> list[Jugador]:
+        '''
+        Retorna los jugadores del equipo en todos sus archivos (por ejemplo, en todas sus temporadas).
+        '''
+        return [jugador for jugador in self.lista_jugadores if self.equipo_de(jugador) == nombre_equipo]
+
+    def jugadores_de_archivo(self, ruta: str) -> list[Jugador]:
+        return [jugador for jugador in self.lista_jugadores if self.archivo_de(jugador) == ruta]
+
+def medir_carga(cantidad_archivos: int, jugadores_por_archivo: int) -> None:
+    '''
+    Compara el tiempo de cargar una liga sintética con un solo proceso y con un pool.
+    La ganancia del pool depende de la cantidad de núcleos: con uno solo es más lento.
+    '''
+    from generador_roster import escribir_roster
+    with tempfile.TemporaryDirectory() as directorio:
+        for numero in range(cantidad_archivos):
+            escribir_roster(os.path.join(directorio, f'equipo_{numero}.json'), jugadores_por_archivo,
+                            semilla=numero, nombre_equipo=f'Equipo Sintetico {numero}')
+        for procesos, descripcion in ((1, 'un solo proceso'), (None, f'pool de {os.cpu_count()} procesos')):
+            inicio = time.perf_counter()
+            liga = Liga(directorio, procesos=procesos)
+            tiempo = time.perf_counter() - inicio
+            print(f'{descripcion}: {len(liga.lista_jugadores)} jugadores de {len(liga.nombres_equipos())} equipos en {tiempo:.3f} s')
+            del liga
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Mide la carga de una liga con y sin pool de procesos')
+    parser.add_argument('--archivos', type=int, default=8)
+    parser.add_argument('--jugadores', type=int, default=50_000)
+    argumentos = parser.parse_args()
+    medir_carga(argumentos.archivos, argumentos.jugadores)
@@ -1,5 +1,15 @@
-from equipo import Equipo
+import sys
+from registro_equipos import obtener_equipo
 from funciones_auxiliares import dream_team_app
 
-dream_team = Equipo()
-dream_team_app(dream_team)
\ No newline at end of file
+if len(sys.argv) > 1:
+    # Modo sin interacción: python main.py --batch operaciones.json [--salida resultados.json]
+    from modo_batch import main
+    main(sys.argv[1:])
+else:
+    try:
+        dream_team = obtener_equipo()
+    except ValueError as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+    dream_team_app(dream_team)
@@ -0,0 +1,162 @@
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from equipo import Equipo
+from estadisticas import normalizar_apartado
+from registro_equipos import obtener_equipo
+from exportador_csv import exportar_roster_csv
+from funciones_auxiliares import (quick_sort_lista_jugadores_atributo_primera_capa, obtener_registros_ordenados_por,
+                                  exportar_registros_csv, exportar_registros_json, exportar_registros_db,
+                                  crear_db_posiciones, insertar_posisciones_db, obtener_porcentaje)
+
+# Opciones que escriben archivos: se ejecutan en orden, después de las de solo lectura
+OPCIONES_CON_ESCRITURA = {'3', '8', '10'}
+
+def _resumen(jugador, *apartados: str) -> dict:
+    resumen = {'nombre': jugador.nombre}
+    for apartado in apartados:
+        # Acepta el apartado con o sin 'get_'; uno inválido es ValueError y no un atributo cualquiera
+        campo = normalizar_apartado(apartado)
+        resumen[campo] = getattr(jugador.estadistica, f'get_{campo}')
+    return resumen
+
+def opcion_1(equipo: Equipo) -> list[dict]:
+    return [{'nombre': jugador.nombre, 'posicion': jugador.posicion} for jugador in equipo.iterar_jugadores()]
+
+def _jugador_por_numero(equipo: Equipo, indice: int):
+    # El menú numera desde 1: sin validar, el 0 sería obtener_jugador(-1), el último jugador
+    if indice < 1:
+        raise ValueError(f'Indice invalido: {indice}, los jugadores se numeran desde 1')
+    return equipo.obtener_jugador(indice - 1)
+
+def opcion_2(equipo: Equipo, indice: int) -> dict:
+    return _jugador_por_numero(equipo, indice).a_diccionario()
+
+def opcion_3(equipo: Equipo, indice: int, archivo: str = 'archivo_prueba.csv') -> dict:
+    filas = exportar_roster_csv(archivo, [_jugador_por_numero(equipo, indice)])
+    return {'archivo': archivo, 'filas': filas}
+
+def opcion_4(equipo: Equipo, nombre: str) -> list[dict]:
+    return [{'nombre': jugador.nombre, 'logros': jugador.lista_logros} for jugador in equipo.buscar_tolerante(nombre)[0]]
+
+def opcion_5(equipo: Equipo) -> list[dict]:
+    jugadores = quick_sort_lista_jugadores_atributo_primera_capa(equipo.lista_jugadores, True, 'nombre')
+    return [_resumen(jugador, 'get_promedio_puntos_por_partido') for jugador in jugadores]
+
+def opcion_6(equipo: Equipo, nombre: str) -> list[dict]:
+    return [{'nombre': jugador.nombre, 'hall_of_fame': equipo.es_hall_of_fame(jugador)} for jugador in equipo.buscar_tolerante(nombre)[0]]
+
+def opcion_7(equipo: Equipo, apartado: str = 'get_rebotes_totales', mayor: bool = True) -> list[dict]:
+    jugadores = equipo.buscar_jugador_con_maximo_o_minimo_apartado_estadistico(apartado, mayor)
+    return [_resumen(jugador, apartado) for jugador in jugadores]
+
+def opcion_8(equipo: Equipo, formato: str = None, archivo: str = None) -> list[dict]:
+    registros = obtener_registros_ordenados_por(equipo.lista_jugadores, 'get_temporadas')
+    match formato:
+        case 'csv':
+            exportar_registros_csv(f'{archivo}.csv', 'w', registros)
+        case 'json':
+            exportar_registros_json(f'{archivo}.json', 'w', registros)
+        case 'db':
+            exportar_registros_db(archivo or 'db_jugadores_ordenados_por_temporadas', 'jugadores_ordenadados_temporadas', registros)
+        case None:
+            pass
+        case _:
+            raise ValueError(f'Formato inválido: {formato}')
+    return [{'nombre': nombre, 'temporadas': temporadas} for nombre, temporadas in registros]
+
+def opcion_9(equipo: Equipo, modo: str = 'A', cantidad: int = None) -> list[dict]:
+    apartados = ('get_robos_totales', 'get_bloqueos_totales')
+    modo = modo.upper()
+    if modo == 'C':
+        jugadores, maximo = equipo.obtener_top_k(cantidad or len(equipo.lista_jugadores), *apartados)
+    elif modo in ('A', 'B'):
+        jugadores = equipo.ordenar_por_estadisticas(*apartados)
+        maximo = sum(getattr(jugadores[0].estadistica, apartado) for apartado in apartados) if jugadores else None
+    else:
+        raise ValueError(f'Modo inválido: {modo}')
+    resultado = [_resumen(jugador, *apartados) for jugador in jugadores]
+    if modo != 'A':
+        for resumen, jugador in zip(resultado, jugadores):
+            valor = sum(getattr(jugador.estadistica, apartado) for apartado in apartados)
+            resumen['porcentaje'] = round(obtener_porcentaje(valor, maximo), 2)
+    return resultado
+
+def opcion_10(equipo: Equipo, archivo: str = 'db_posiciones', tabla: str = 'tabla_posiciones') -> list[str]:
+    lista_posiciones = equipo.generar_lista_posiciones()
+    crear_db_posiciones(archivo, tabla)
+    insertar_posisciones_db(archivo, tabla, lista_posiciones)
+    return lista_posiciones
+
+OPERACIONES = {
+    '1': opcion_1, '2': opcion_2, '3': opcion_3, '4': opcion_4, '5': opcion_5,
+    '6': opcion_6, '7': opcion_7, '8': opcion_8, '9': opcion_9, '10': opcion_10,
+}
+
+def ejecutar_operacion(equipo: Equipo, operacion: dict) -> dict:
+    '''
+    Ejecuta una operación del tipo {"opcion": "7", "apartado": "get_rebotes_totales"} y retorna
+    {"opcion": ..., "resultado": ...} o {"opcion": ..., "error": ...} si falló.
+    '''
+    parametros = dict(operacion)
+    opcion = str(parametros.pop('opcion', ''))
+    try:
+        funcion = OPERACIONES.get(opcion)
+        if funcion is None:
+            raise ValueError(f'Opcion invalida: {opcion}')
+        return {'opcion': opcion, 'resultado': funcion(equipo, **parametros)}
+    except Exception as error:
+        return {'opcion': opcion, 'error': f'{type(error).__name__}: {error}'}
+
+def leer_operaciones(path: str) -> list[dict]:
+    '''
+    Lee las operaciones de un archivo JSON con una lista o de un archivo con un objeto JSON por línea.
+    '''
+    with open(path, 'r', encoding='utf-8') as archivo:
+        contenido = archivo.read()
+    if contenido.lstrip().startswith('['):
+        return json.loads(contenido)
+    return [json.loads(linea) for linea in contenido.splitlines() if linea.strip()]
+
+def ejecutar_batch(equipo: Equipo, operaciones: list[dict], hilos: int = 1) -> list[dict]:
+    '''
+    Ejecuta las operaciones contra un único equipo y retorna los resultados en el mismo orden.
+    Las operaciones de solo lectura se reparten entre 'hilos' hilos; las que escriben
+    archivos (3, 8 y 10) se ejecutan después, una por vez y en el orden del archivo.
+    '''
+    # Los índices se construyen antes para que los hilos no los armen a la vez
+    equipo.indice_nombres
+    equipo.indice_logros
+    resultados = [None] * len(operaciones)
+    lectura = [i for i, operacion in enumerate(operaciones) if str(operacion.get('opcion')) not in OPCIONES_CON_ESCRITURA]
+    indices_lectura = set(lectura)
+    escritura = [i for i in range(len(operaciones)) if i not in indices_lectura]
+    with ThreadPoolExecutor(max_workers=max(hilos, 1)) as pool:
+        for i, resultado in zip(lectura, pool.map(lambda i: ejecutar_operacion(equipo, operaciones[i]), lectura)):
+            resultados[i] = resultado
+    for i in escritura:
+        resultados[i] = ejecutar_operacion(equipo, operaciones[i])
+    return resultados
+
+def main(argumentos: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Ejecuta las opciones del menu del Dream Team sin interacción')
+    parser.add_argument('--batch', '-b', required=True, help='Archivo JSON o NDJSON con las operaciones')
+    parser.add_argument('--salida', '-s', help='Archivo JSON donde guardar los resultados (por defecto la salida estándar)')
+    parser.add_argument('--equipo', '-e', default='dream_team.json', help='Archivo JSON del equipo')
+    parser.add_argument('--hilos', type=int, default=1, help='Cantidad de operaciones de lectura a ejecutar a la vez')
+    argumentos = parser.parse_args(argumentos)
+
+    # Los mensajes que imprimen las funciones del menu van a stderr para no mezclarse con el JSON
+    with redirect_stdout(sys.stderr):
+        resultados = ejecutar_batch(obtener_equipo(argumentos.equipo), leer_operaciones(argumentos.batch), argumentos.hilos)
+    if argumentos.salida:
+        with open(argumentos.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(resultados, archivo, ensure_ascii=False, indent=4)
+    else:
+        json.dump(resultados, sys.stdout, ensure_ascii=False, indent=4)
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import operator
+from typing import Callable, Iterable
+
+def clave_estadistica(apartado: str) -> Callable:
+    '''
+    Retorna una clave que obtiene un apartado de la clase Estadistica del jugador (por ejemplo 'get_temporadas').
+    '''
+    return operator.attrgetter(f'estadistica.{apartado}')
+
+def clave_suma_estadisticas(*apartados: str) -> Callable:
+    '''
+    Retorna una clave que suma varios apartados de la clase Estadistica del jugador.
+    '''
+    obtener_apartados = operator.attrgetter(*(f'estadistica.{apartado}' for apartado in apartados))
+    if len(apartados) == 1:
+        return obtener_apartados
+    return lambda jugador: sum(obtener_apartados(jugador))
+
+def clave_atributo(atributo: str) -> Callable:
+    '''
+    Retorna una clave que obtiene un atributo propio de la clase Jugador (por ejemplo 'nombre').
+    '''
+    return operator.attrgetter(atributo)
+
+def crear_clave(especificacion) -> Callable:
+    '''
+    Convierte la especificación de una clave de ordenamiento en una función:
+        - un callable se usa tal cual
+        - una tupla o lista de apartados se interpreta como la suma de esos apartados
+        - un string que empieza con 'get_' es un apartado de la clase Estadistica
+        - cualquier otro string es un atributo de la clase Jugador
+    '''
+    if callable(especificacion):
+        return especificacion
+    if isinstance(especificacion, (tuple, list)):
+        return clave_suma_estadisticas(*especificacion)
+    if especificacion.startswith('get_'):
+        return clave_estadistica(especificacion)
+    return clave_atributo(especificacion)
+
+def ordenar_jugadores(lista_jugadores: Iterable, claves: list[tuple]) -> list:
+    '''
+    Ordena jugadores por una o más claves.
+
+    Recibe:
+        lista_jugadores (Iterable[Jugador]): Los jugadores que se desea ordenar. No se modifica.
+        claves (list[tuple]): Pares (especificacion, menor_a_mayor) en orden de prioridad.
+                              Ver crear_clave para las especificaciones aceptadas.
+
+    Retorna:
+        list[Jugador]: Una nueva lista ordenada. El ordenamiento es estable, no es recursivo
+        y cada clave se calcula una sola vez por jugador.
+    '''
+    lista_ordenada = list(lista_jugadores)
+    # Se ordena desde la clave menos prioritaria: al ser estable cada pasada respeta las anteriores
+    for especificacion, menor_a_mayor in reversed(claves):
+        lista_ordenada.sort(key=crear_clave(especificacion), reverse=not menor_a_mayor)
+    return lista_ordenada
@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import time
+from urllib.parse import quote
+
+CONSULTAS_POR_DEFECTO = (
+    '/buscar?nombre={nombre}',
+    '/hall_of_fame?nombre={nombre}',
+    '/extremo?apartado=get_rebotes_totales&mayor=1',
+    '/extremo?apartado=get_temporadas&mayor=0',
+    '/ordenados?apartados=get_robos_totales,get_bloqueos_totales&cantidad=10',
+    '/posiciones',
+)
+NOMBRES = ('jordan', 'magic', 'bird', 'malone', 'stockton', 'pippen', 'ewing', 'robinson')
+
+async def _leer_respuesta(lector: asyncio.StreamReader) -> int:
+    linea_estado = await lector.readline()
+    if not linea_estado:
+        raise ConnectionError('El servidor cerró la conexión')
+    largo = 0
+    while True:
+        encabezado = await lector.readline()
+        if encabezado in (b'\r\n', b''):
+            break
+        nombre, _, valor = encabezado.decode('latin-1').partition(':')
+        if nombre.strip().lower() == 'content-length':
+            largo = int(valor)
+    await lector.readexactly(largo)
+    return int(linea_estado.split()[1])
+
+async def _cliente(host: str, puerto: int, rutas: list[str], fin: float, latencias: list[float], errores: list[int]) -> None:
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    i = 0
+    try:
+        while time.perf_counter() < fin:
+            ruta = rutas[i % len(rutas)]
+            i += 1
+            inicio = time.perf_counter()
+            escritor.write(f'GET {ruta} HTTP/1.1\r\nHost: {host}\r\n\r\n'.encode('latin-1'))
+            await escritor.drain()
+            estado = await _leer_respuesta(lector)
+            latencias.append(time.perf_counter() - inicio)
+            if estado != 200:
+                errores.append(estado)
+    finally:
+        escritor.close()
+
+def percentil(valores_ordenados: list[float], porcentaje: float) -> float:
+    if not valores_ordenados:
+        return 0.0
+    posicion = min(len(valores_ordenados) - 1, int(round(porcentaje / 100 * (len(valores_ordenados) - 1))))
+    return valores_ordenados[posicion]
+
+async def medir(host: str, puerto: int, conexiones: int, duracion: float, rutas: list[str]) -> dict:
+    '''
+    Abre la cantidad de conexiones recibida y hace consultas sin pausa durante 'duracion' segundos.
+    Retorna las peticiones por segundo y las latencias (en milisegundos) p50, p99 y máxima.
+    '''
+    latencias = []
+    errores = []
+    inicio = time.perf_counter()
+    fin = inicio + duracion
+    # Cada conexión empieza en una consulta distinta para no pedir todas lo mismo a la vez
+    await asyncio.gather(*(_cliente(host, puerto, rutas[i % len(rutas):] + rutas[:i % len(rutas)], fin, latencias, errores)
+                           for i in range(conexiones)))
+    tiempo = time.perf_counter() - inicio
+    latencias.sort()
+    return {
+        'peticiones': len(latencias),
+        'errores': len(errores),
+        'peticiones_por_segundo': len(latencias) / tiempo,
+        'p50_ms': percentil(latencias, 50) * 1000,
+        'p99_ms': percentil(latencias, 99) * 1000,
+        'maximo_ms': (latencias[-1] if latencias else 0.0) * 1000,
+    }
+
+def armar_rutas(consultas=CONSULTAS_POR_DEFECTO, nombres=NOMBRES) -> list[str]:
+    return [consulta.format(nombre=quote(nombre)) for consulta in consultas for nombre in nombres]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Prueba de carga local del servidor de consultas del equipo')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', '-p', type=int, default=8080)
+    parser.add_argument('--conexiones', '-c', type=int, default=32)
+    parser.add_argument('--duracion', '-d', type=float, default=10.0, help='Duración en segundos')
+    argumentos = parser.parse_args()
+    resultado = asyncio.run(medir(argumentos.host, argumentos.puerto, argumentos.conexiones, argumentos.duracion, armar_rutas()))
+    print(f"{resultado['peticiones']} peticiones ({resultado['errores']} con error) | "
+          f"{resultado['peticiones_por_segundo']:.0f} peticiones/s | "
+          f"p50: {resultado['p50_ms']:.2f} ms | p99: {resultado['p99_ms']:.2f} ms | máximo: {resultado['maximo_ms']:.2f} ms")
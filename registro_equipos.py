@@ -0,0 +1,32 @@
+import os
+import threading
+from equipo import Equipo
+
+_equipos = {}
+_candado = threading.Lock()
+
+def obtener_equipo(ruta: str = 'dream_team.json', **opciones) -> Equipo:
+    '''
+    Retorna el Equipo compartido del archivo recibido. La primera llamada para una ruta
+    lo carga; las siguientes, desde cualquier módulo o hilo, reciben la misma instancia.
+
+    Recibe:
+        ruta (str): Ruta del archivo JSON del equipo.
+        opciones: Parámetros de Equipo (lazy, columnar, compacto, usar_snapshot).
+                  Solo se usan la primera vez que se carga esa ruta.
+    '''
+    clave = os.path.abspath(ruta)
+    equipo = _equipos.get(clave)
+    if equipo is None:
+        with _candado:
+            equipo = _equipos.get(clave)
+            if equipo is None:
+                equipo = _equipos[clave] = Equipo(ruta, **opciones)
+    return equipo
+
+def descartar_equipo(ruta: str = 'dream_team.json') -> None:
+    '''
+    Quita el equipo del registro; la próxima llamada a obtener_equipo lo vuelve a cargar.
+    '''
+    with _candado:
+        _equipos.pop(os.path.abspath(ruta), None)
@@ -0,0 +1,33 @@
+import argparse
+import gc
+import tracemalloc
+from jugador import Jugador, JugadorCompacto
+from generador_roster import generar_roster
+
+def medir_bytes_por_jugador(clase_jugador: type, cantidad: int) -> float:
+    '''
+    Construye 'cantidad' jugadores sintéticos con la clase recibida y retorna
+    los bytes que quedan reservados por cada jugador una vez construidos.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    jugadores = [clase_jugador(diccionario) for diccionario in generar_roster(cantidad)]
+    gc.collect()
+    fin = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del jugadores
+    return (fin - inicio) / cantidad
+
+def mostrar_reporte(cantidad: int) -> None:
+    antes = medir_bytes_por_jugador(Jugador, cantidad)
+    despues = medir_bytes_por_jugador(JugadorCompacto, cantidad)
+    print(f'Jugadores sintéticos: {cantidad}')
+    print(f'Jugador:          {antes:10.1f} bytes por jugador')
+    print(f'JugadorCompacto:  {despues:10.1f} bytes por jugador')
+    print(f'Ahorro:           {100 - despues * 100 / antes:10.1f}%')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compara la memoria por jugador de Jugador y JugadorCompacto')
+    parser.add_argument('--cantidad', type=int, default=1_000_000)
+    mostrar_reporte(parser.parse_args().cantidad)
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+from typing import Callable, Iterable
+from jugador import Jugador
+from estadisticas import CAMPOS_ESTADISTICOS, CAMPOS_ENTEROS
+from exportador_csv import exportar_roster_csv, normalizar_columnas
+
+def _valor_canonico(campo: str, valor):
+    # Las vistas columnares guardan todo como float: 52 y 52.0 tienen que dar el mismo hash
+    if valor is None:
+        return None
+    return int(valor) if campo in CAMPOS_ENTEROS else float(valor)
+
+def hash_jugador(jugador: Jugador) -> str:
+    '''
+    Retorna un hash del contenido del jugador (nombre, posición, estadísticas y logros).
+    Dos jugadores con el mismo contenido tienen el mismo hash sin importar cómo se guardan
+    sus estadísticas (Estadistica, EstadisticaCompacta o una vista columnar).
+    '''
+    estadistica = jugador.estadistica
+    contenido = (
+        jugador.nombre,
+        jugador.posicion,
+        tuple(_valor_canonico(campo, getattr(estadistica, f'get_{campo}')) for campo in CAMPOS_ESTADISTICOS),
+        tuple(jugador.lista_logros or ()),
+    )
+    return hashlib.blake2b(repr(contenido).encode('utf-8'), digest_size=16).hexdigest()
+
+def clave_nombre(jugador: Jugador) -> str:
+    return jugador.nombre
+
+def calcular_hashes(jugadores: Iterable[Jugador], clave: Callable[[Jugador], object] = clave_nombre) -> dict:
+    '''
+    Retorna un diccionario {clave: hash} del roster. Por defecto cada jugador se identifica por
+    su nombre; una Liga, por ejemplo, lo identifica por su archivo y su nombre.
+    '''
+    return {clave(jugador): hash_jugador(jugador) for jugador in jugadores}
+
+class Cambios:
+    '''
+    Resultado de comparar un roster con los hashes de una exportación anterior.
+
+    Atributos:
+        agregados (list[Jugador]): Jugadores cuyo nombre no estaba en la exportación anterior.
+        modificados (list[Jugador]): Jugadores que estaban pero cambió su contenido.
+        eliminados (list[str]): Nombres (o claves) que estaban en la exportación anterior y ya no están.
+        hashes (dict[str, str]): Los hashes del roster actual, para guardar después de exportar.
+        clave (Callable): La función con la que se identificó a cada jugador.
+        completo (bool): True si el roster actual tiene claves repetidas (por ejemplo dos jugadores con
+                         el mismo nombre). Como no se puede saber cuál de ellos cambió, todos sus
+                         jugadores figuran como agregados y hay que exportarlo o cargarlo completo.
+    '''
+    def __init__(self, agregados: list[Jugador], modificados: list[Jugador], eliminados: list[str], hashes: dict[str, str],
+                 clave: Callable[[Jugador], object] = clave_nombre, completo: bool = False) -> None:
+        self.agregados = agregados
+        self.modificados = modificados
+        self.eliminados = eliminados
+        self.hashes = hashes
+        self.clave = clave
+        self.completo = completo
+
+    @property
+    def pendientes(self) -> list[Jugador]:
+        return self.agregados + self.modificados
+
+    def __bool__(self) -> bool:
+        return bool(self.agregados or self.modificados or self.eliminados)
+
+    def __repr__(self) -> str:
+        return f'Cambios(agregados={len(self.agregados)}, modificados={len(self.modificados)}, eliminados={len(self.eliminados)})'
+
+def detectar_cambios(jugadores: Iterable[Jugador], hashes_anteriores: dict[str, str], hashes: dict[str, str] = None,
+                     clave: Callable[[Jugador], object] = clave_nombre) -> Cambios:
+    '''
+    Compara el roster con los hashes de la exportación anterior.
+
+    Recibe:
+        jugadores (Iterable[Jugador]): El roster actual.
+        hashes_anteriores (dict[str, str]): {clave: hash} de la exportación anterior.
+        hashes (dict[str, str]): Opcional, los hashes ya calculados del roster actual con la misma clave
+                                 (por ejemplo Equipo.hashes_jugadores()) para no recalcularlos.
+        clave (Callable): Cómo se identifica a cada jugador. Por defecto, por su nombre.
+    '''
+    jugadores = list(jugadores)
+    if hashes is None:
+        hashes = calcular_hashes(jugadores, clave)
+    eliminados = [clave_anterior for clave_anterior in hashes_anteriores if clave_anterior not in hashes]
+    if len(hashes) != len(jugadores):
+        return Cambios(jugadores, [], eliminados, hashes, clave, completo=True)
+    agregados = []
+    modificados = []
+    for jugador in jugadores:
+        clave_jugador = clave(jugador)
+        anterior = hashes_anteriores.get(clave_jugador)
+        if anterior is None:
+            agregados.append(jugador)
+        elif anterior != hashes[clave_jugador]:
+            modificados.append(jugador)
+    return Cambios(agregados, modificados, eliminados, hashes, clave)
+
+def ruta_estado(path: str) -> str:
+    return f'{path}.hashes'
+
+def cargar_estado(path: str) -> dict:
+    '''
+    Retorna el estado guardado de la última exportación a 'path', o None si no hay
+    (o si el archivo exportado ya no existe y hay que volver a escribirlo completo).
+    '''
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(ruta_estado(path), 'r', encoding='utf-8') as archivo:
+            return json.load(archivo)
+    except (OSError, ValueError):
+        return None
+
+def guardar_estado(path: str, estado: dict) -> None:
+    ruta_temporal = f'{ruta_estado(path)}.{os.getpid()}.tmp'
+    with open(ruta_temporal, 'w', encoding='utf-8') as archivo:
+        json.dump(estado, archivo, ensure_ascii=False)
+    os.replace(ruta_temporal, ruta_estado(path))
+
+def exportar_delta_csv(path: str, jugadores: Iterable[Jugador], columnas: Iterable[str] = None,
+                       hashes: dict[str, str] = None) -> Cambios:
+    '''
+    Exporta a CSV solo los jugadores agregados o modificados desde la exportación anterior,
+    anexándolos al final del archivo (la última fila de cada nombre es la vigente).
+    La primera vez, si cambian las columnas o si hay nombres repetidos (no se puede saber cuál de
+    ellos cambió), el archivo se escribe completo.
+    Las bajas no pueden representarse en el CSV y solo se informan en el resultado.
+    '''
+    columnas = list(normalizar_columnas(columnas))
+    jugadores = list(jugadores)
+    estado = cargar_estado(path)
+    completo = estado is None or estado.get('columnas') != columnas
+    cambios = detectar_cambios(jugadores, {} if completo else estado['hashes'], hashes)
+    if completo or cambios.completo:
+        exportar_roster_csv(path, jugadores, columnas)
+    elif cambios.pendientes:
+        exportar_roster_csv(path, cambios.pendientes, columnas, modo='a')
+    if os.path.exists(path):
+        guardar_estado(path, {'columnas': columnas, 'hashes': cambios.hashes})
+    return cambios
+
+def exportar_delta_ndjson(path: str, jugadores: Iterable[Jugador], hashes: dict[str, str] = None) -> Cambios:
+    '''
+    Exporta a NDJSON (un jugador en JSON por línea) solo los jugadores agregados o modificados
+    desde la exportación anterior, anexándolos al final del archivo. Cada baja se anexa como
+    {"nombre": ..., "eliminado": true}. La primera vez, o si hay nombres repetidos, el archivo se
+    escribe completo.
+    '''
+    jugadores = list(jugadores)
+    estado = cargar_estado(path)
+    cambios = detectar_cambios(jugadores, {} if estado is None else estado['hashes'], hashes)
+    completo = estado is None or cambios.completo
+    try:
+        with open(path, 'w' if completo else 'a', encoding='utf-8') as archivo:
+            for jugador in (jugadores if completo else cambios.pendientes):
+                archivo.write(json.dumps(jugador.a_diccionario(), ensure_ascii=False) + '\n')
+            for nombre in ([] if completo else cambios.eliminados):
+                archivo.write(json.dumps({'nombre': nombre, 'eliminado': True}, ensure_ascii=False) + '\n')
+    except FileNotFoundError:
+        print(f"Error: Archivo no encontrado - {path}")
+        return cambios
+    except PermissionError:
+        print(f"Error: Permiso denegado para acceder al archivo - {path}")
+        return cambios
+    guardar_estado(path, {'hashes': cambios.hashes})
+    return cambios
@@ -0,0 +1,260 @@
+import argparse
+import asyncio
+import json
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qs
+from equipo import Equipo
+from estadisticas import normalizar_apartado
+from registro_equipos import obtener_equipo
+from modo_batch import opcion_1, opcion_2, opcion_4, opcion_6, opcion_7
+from vigilante_archivo import VigilanteArchivo
+
+MOTIVOS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Content Too Large', 500: 'Internal Server Error'}
+TAMANIO_MAXIMO_CUERPO = 64 * 1024
+
+class CacheRespuestas:
+    '''
+    Cache LRU de respuestas ya serializadas, asociada a una versión del equipo:
+    cuando el equipo cambia (por ejemplo al recargarlo) se descarta completa.
+    '''
+    def __init__(self, capacidad: int = 1024) -> None:
+        self.capacidad = capacidad
+        self.version = None
+        self.aciertos = 0
+        self.fallos = 0
+        self.__respuestas = OrderedDict()
+
+    def obtener(self, version: int, clave: str):
+        if version != self.version:
+            self.__respuestas.clear()
+            self.version = version
+            self.fallos += 1
+            return None
+        respuesta = self.__respuestas.get(clave)
+        if respuesta is None:
+            self.fallos += 1
+        else:
+            self.aciertos += 1
+            self.__respuestas.move_to_end(clave)
+        return respuesta
+
+    def guardar(self, version: int, clave: str, respuesta: bytes) -> None:
+        if version != self.version or self.capacidad <= 0:
+            return
+        self.__respuestas[clave] = respuesta
+        if len(self.__respuestas) > self.capacidad:
+            self.__respuestas.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.__respuestas)
+
+def _parametro(parametros: dict, nombre: str, por_defecto=None):
+    valores = parametros.get(nombre)
+    if not valores:
+        if por_defecto is None:
+            raise ValueError(f'Falta el parámetro {nombre}')
+        return por_defecto
+    return valores[0]
+
+def _booleano(texto: str) -> bool:
+    return texto.lower() in ('1', 'true', 'si', 'mayor', 'desc')
+
+def consultar_ordenados(equipo: Equipo, parametros: dict) -> list[dict]:
+    apartados = [normalizar_apartado(apartado) for apartado in _parametro(parametros, 'apartados').split(',')]
+    mayor_a_menor = _booleano(_parametro(parametros, 'mayor', '1'))
+    cantidad = _parametro(parametros, 'cantidad', '')
+    if cantidad:
+        jugadores, _ = equipo.obtener_top_k(int(cantidad), *apartados, mayor_a_menor=mayor_a_menor)
+    else:
+        jugadores = equipo.ordenar_por_estadisticas(*apartados, menor_a_mayor=not mayor_a_menor)
+    resultado = []
+    for jugador in jugadores:
+        resumen = {'nombre': jugador.nombre}
+        for apartado in apartados:
+            resumen[apartado] = getattr(jugador.estadistica, f'get_{apartado}')
+        resultado.append(resumen)
+    return resultado
+
+# Cada ruta recibe el equipo y los parámetros de la consulta (parse_qs) y retorna algo serializable a JSON
+RUTAS = {
+    '/jugadores': lambda equipo, parametros: opcion_1(equipo),
+    '/jugador': lambda equipo, parametros: opcion_2(equipo, int(_parametro(parametros, 'indice'))),
+    '/buscar': lambda equipo, parametros: [jugador.a_diccionario() for jugador in equipo.buscar(_parametro(parametros, 'nombre'))],
+    '/logros': lambda equipo, parametros: opcion_4(equipo, _parametro(parametros, 'nombre')),
+    '/hall_of_fame': lambda equipo, parametros: opcion_6(equipo, _parametro(parametros, 'nombre')),
+    '/extremo': lambda equipo, parametros: opcion_7(equipo, _parametro(parametros, 'apartado'),
+                                                    _booleano(_parametro(parametros, 'mayor', '1'))),
+    '/ordenados': consultar_ordenados,
+    '/posiciones': lambda equipo, parametros: sorted(equipo.generar_lista_posiciones()),
+    '/aproximado': lambda equipo, parametros: [
+        {'nombre': jugador.nombre, 'distancia': distancia}
+        for jugador, distancia in equipo.buscar_aproximado(_parametro(parametros, 'nombre'), int(_parametro(parametros, 'cantidad', '5')))],
+    '/filtrar': lambda equipo, parametros: [jugador.a_diccionario() for jugador in equipo.filtrar(_parametro(parametros, 'consulta'))],
+}
+
+class ServidorEquipo:
+    '''
+    Servidor HTTP/JSON (asyncio, sin dependencias externas) que responde consultas sobre un
+    único Equipo en memoria. Las respuestas se guardan serializadas en una CacheRespuestas.
+
+    GET  /jugadores, /jugador?indice=, /buscar?nombre=, /aproximado?nombre=&cantidad=, /logros?nombre=, /hall_of_fame?nombre=,
+         /extremo?apartado=&mayor=, /ordenados?apartados=a,b&mayor=&cantidad=, /posiciones,
+         /filtrar?consulta= (ver el módulo consultas), /estado
+    POST /recargar
+    '''
+    def __init__(self, equipo: Equipo, capacidad_cache: int = 1024) -> None:
+        self.equipo = equipo
+        self.cache = CacheRespuestas(capacidad_cache)
+
+    async def recargar(self) -> tuple[int, bytes]:
+        '''
+        Vuelve a leer el archivo del equipo en otro hilo, para no frenar las consultas, y aplica
+        las diferencias desde el loop (ver Equipo.cambios_en_archivo y Equipo.aplicar_cambios).
+        Si mientras se leía el equipo cambió (por ejemplo lo actualizó vigilar_archivo) se vuelve
+        a comparar. Un archivo que no se puede leer responde 500 y deja el equipo como estaba.
+        '''
+        try:
+            while True:
+                version = self.equipo.version
+                cambios = await asyncio.to_thread(self.equipo.cambios_en_archivo)
+                if self.equipo.version == version:
+                    break
+            if cambios:
+                self.equipo.aplicar_cambios(cambios)
+        except Exception as error:
+            return 500, self.serializar({'error': f'No se pudo recargar {self.equipo.ruta} - {type(error).__name__}: {error}'})
+        return 200, self.serializar({'jugadores': len(self.equipo.lista_jugadores), 'version': self.equipo.version})
+
+    def responder(self, metodo: str, objetivo: str) -> tuple[int, bytes]:
+        '''
+        Resuelve una consulta y retorna el código de estado y el cuerpo JSON.
+        Las consultas se ejecutan en el hilo del loop: son operaciones en memoria y así
+        ninguna corre a la vez que se aplica una recarga (ver recargar).
+        '''
+        url = urlsplit(objetivo)
+        if metodo != 'GET':
+            return 405, self.serializar({'error': f'Método no permitido: {metodo}'})
+        if url.path == '/estado':
+            return 200, self.serializar({'jugadores': len(self.equipo.lista_jugadores), 'version': self.equipo.version,
+                                         'cache': len(self.cache), 'aciertos': self.cache.aciertos, 'fallos': self.cache.fallos})
+        consulta = RUTAS.get(url.path)
+        if consulta is None:
+            return 404, self.serializar({'error': f'Ruta inexistente: {url.path}'})
+
+        version = self.equipo.version
+        respuesta = self.cache.obtener(version, objetivo)
+        if respuesta is None:
+            try:
+                respuesta = self.serializar(consulta(self.equipo, parse_qs(url.query)))
+            except (ValueError, IndexError, AttributeError) as error:
+                return 400, self.serializar({'error': str(error)})
+            except Exception as error:
+                return 500, self.serializar({'error': f'{type(error).__name__}: {error}'})
+            self.cache.guardar(version, objetivo, respuesta)
+        return 200, respuesta
+
+    @staticmethod
+    def serializar(contenido) -> bytes:
+        return json.dumps(contenido, ensure_ascii=False).encode('utf-8')
+
+    async def atender_conexion(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        '''
+        Atiende las peticiones de una conexión (HTTP/1.1 con keep-alive) hasta que el cliente la cierra.
+        '''
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                try:
+                    metodo, objetivo, version_http = linea.decode('latin-1').split()
+                except ValueError:
+                    break
+                mantener = version_http == 'HTTP/1.1'
+                largo_cuerpo = 0
+                error = None
+                while True:
+                    encabezado = await lector.readline()
+                    if encabezado in (b'\r\n', b'\n', b''):
+                        break
+                    nombre, _, valor = encabezado.decode('latin-1').partition(':')
+                    nombre = nombre.strip().lower()
+                    if nombre == 'content-length':
+                        try:
+                            largo_cuerpo = int(valor)
+                        except ValueError:
+                            largo_cuerpo = -1
+                        if largo_cuerpo < 0:
+                            error = (400, f'Content-Length inválido: {valor.strip()}')
+                        elif largo_cuerpo > TAMANIO_MAXIMO_CUERPO:
+                            error = (413, f'El cuerpo supera los {TAMANIO_MAXIMO_CUERPO} bytes')
+                    elif nombre == 'connection':
+                        mantener = valor.strip().lower() != 'close'
+
+                if error:
+                    # El cuerpo no se lee, así que la conexión no puede seguir: se responde y se cierra
+                    estado, mensaje = error
+                    mantener = False
+                    cuerpo = self.serializar({'error': mensaje})
+                else:
+                    if largo_cuerpo:
+                        await lector.readexactly(largo_cuerpo)
+                    if metodo == 'POST' and urlsplit(objetivo).path == '/recargar':
+                        estado, cuerpo = await self.recargar()
+                    else:
+                        estado, cuerpo = self.responder(metodo, objetivo)
+                escritor.write(f'HTTP/1.1 {estado} {MOTIVOS[estado]}\r\n'
+                               f'Content-Type: application/json; charset=utf-8\r\n'
+                               f'Content-Length: {len(cuerpo)}\r\n'
+                               f'Connection: {"keep-alive" if mantener else "close"}\r\n\r\n'.encode('latin-1') + cuerpo)
+                await escritor.drain()
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar(self, host: str = '127.0.0.1', puerto: int = 8080) -> asyncio.Server:
+        return await asyncio.start_server(self.atender_conexion, host, puerto)
+
+async def vigilar_archivo(equipo: Equipo, intervalo: float) -> None:
+    '''
+    Revisa el archivo del equipo cada 'intervalo' segundos. La lectura y la comparación corren
+    en otro hilo para no frenar las consultas; los cambios se aplican desde el loop, entre
+    consultas. La versión del equipo cambia, por lo que la cache se descarta sola.
+    '''
+    vigilante = VigilanteArchivo(equipo, intervalo)
+    while True:
+        await asyncio.sleep(intervalo)
+        detectado = await asyncio.to_thread(vigilante.detectar)
+        if detectado is None:
+            continue
+        cambios = vigilante.aplicar(*detectado)
+        if cambios:
+            print(f'{equipo.ruta} actualizado: {cambios}')
+
+async def servir(equipo: Equipo, host: str, puerto: int, capacidad_cache: int, intervalo_vigilancia: float = None) -> None:
+    servidor = await ServidorEquipo(equipo, capacidad_cache).iniciar(host, puerto)
+    print(f'Sirviendo {equipo.ruta} ({len(equipo.lista_jugadores)} jugadores) en http://{host}:{puerto}')
+    tarea_vigilancia = asyncio.create_task(vigilar_archivo(equipo, intervalo_vigilancia)) if intervalo_vigilancia else None
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        if tarea_vigilancia is not None:
+            tarea_vigilancia.cancel()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Servidor HTTP/JSON de consultas sobre el equipo')
+    parser.add_argument('--equipo', '-e', default='dream_team.json', help='Archivo JSON del equipo')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', '-p', type=int, default=8080)
+    parser.add_argument('--cache', type=int, default=1024, help='Cantidad de respuestas guardadas (0 para desactivar)')
+    parser.add_argument('--vigilar', type=float, metavar='SEGUNDOS', help='Aplicar los cambios del archivo del equipo revisándolo cada SEGUNDOS')
+    argumentos = parser.parse_args()
+    try:
+        asyncio.run(servir(obtener_equipo(argumentos.equipo), argumentos.host, argumentos.puerto, argumentos.cache, argumentos.vigilar))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,163 @@
+import argparse
+import gc
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from estadisticas import CAMPOS_ESTADISTICOS
+
+VERSION_SNAPSHOT = 2
+TAMANIO_BLOQUE_HASH = 1024 * 1024
+
+@contextmanager
+def sin_recolector_de_basura():
+    '''
+    Desactiva el recolector de basura mientras se crean muchos objetos de una vez.
+    Al deserializar cientos de miles de jugadores el recolector se dispara una y otra vez
+    recorriendo objetos que no son basura, y eso domina el tiempo de carga.
+    '''
+    estaba_activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if estaba_activo:
+            gc.enable()
+
+def ruta_snapshot(ruta: str) -> str:
+    return f'{ruta}.snapshot'
+
+def calcular_hash(ruta: str) -> str:
+    hash_archivo = hashlib.blake2b(digest_size=16)
+    with open(ruta, 'rb') as archivo:
+        for bloque in iter(lambda: archivo.read(TAMANIO_BLOQUE_HASH), b''):
+            hash_archivo.update(bloque)
+    return hash_archivo.hexdigest()
+
+def _encabezado_esperado() -> dict:
+    # Los campos identifican el orden de las estadísticas en cada tupla guardada: si la clase
+    # Estadistica cambia, el snapshot viejo se descarta en lugar de cargarse con los valores corridos
+    return {
+        'version': VERSION_SNAPSHOT,
+        'python': list(sys.version_info[:2]),
+        'marshal': marshal.version,
+        'campos': list(CAMPOS_ESTADISTICOS),
+    }
+
+def valores_jugador(jugador) -> tuple:
+    '''
+    Retorna el jugador como la tupla de decodificar_valores: (nombre, posicion, logros, estadísticas
+    en el orden de CAMPOS_ESTADISTICOS). Sirve para cualquier clase de jugador y de estadística.
+    '''
+    estadistica = jugador.estadistica
+    return (jugador.nombre, jugador.posicion, list(jugador.lista_logros or ()),
+            tuple(getattr(estadistica, f'get_{campo}') for campo in CAMPOS_ESTADISTICOS))
+
+def guardar_snapshot(ruta: str, jugadores: list) -> bool:
+    '''
+    Guarda junto al archivo del roster una copia binaria de los valores de los jugadores
+    (con marshal, solo tuplas, listas, textos y números), con la fecha de modificación,
+    el tamaño y el hash del archivo de origen.
+    Retorna False si no se pudo escribir (el snapshot es opcional, el error no se propaga).
+    '''
+    try:
+        estado = os.stat(ruta)
+        encabezado = _encabezado_esperado()
+        encabezado.update(mtime_ns=estado.st_mtime_ns, tamanio=estado.st_size, hash=calcular_hash(ruta))
+        valores = [valores_jugador(jugador) for jugador in jugadores]
+        ruta_temporal = f'{ruta_snapshot(ruta)}.{os.getpid()}.tmp'
+        with open(ruta_temporal, 'wb') as archivo:
+            marshal.dump(encabezado, archivo)
+            marshal.dump(valores, archivo)
+        os.replace(ruta_temporal, ruta_snapshot(ruta))
+        return True
+    except (OSError, ValueError):
+        return False
+
+def _actualizar_encabezado(ruta: str, encabezado: dict, estado: os.stat_result, contenido: bytes) -> None:
+    '''
+    Reescribe el snapshot con la fecha de modificación actual del origen, copiando los jugadores
+    ya serializados sin volver a generarlos. Si no se puede escribir se deja como estaba.
+    '''
+    encabezado = dict(encabezado, mtime_ns=estado.st_mtime_ns)
+    ruta_temporal = f'{ruta_snapshot(ruta)}.{os.getpid()}.tmp'
+    try:
+        with open(ruta_temporal, 'wb') as archivo:
+            marshal.dump(encabezado, archivo)
+            archivo.write(contenido)
+        os.replace(ruta_temporal, ruta_snapshot(ruta))
+    except OSError:
+        pass
+
+def cargar_snapshot(ruta: str, clase_jugador: type):
+    '''
+    Retorna la lista de jugadores guardada en el snapshot del roster, armados con los constructores
+    de 'clase_jugador' (ver decodificador_jugadores.construir_jugadores), o None si no existe, quedó
+    desactualizado, es de otra versión o de otros campos estadísticos, o no se puede leer.
+    A diferencia de pickle, leerlo no puede ejecutar código ni crear objetos de ninguna clase.
+    Si la fecha y el tamaño del origen coinciden se usa directamente; si no, se compara el hash
+    del contenido antes de descartarlo, y si coincide se guarda la fecha nueva para no volver
+    a calcular el hash en el próximo inicio.
+    '''
+    # Import local: decodificador_jugadores importa sin_recolector_de_basura de este módulo
+    from decodificador_jugadores import construir_jugadores
+    try:
+        with open(ruta_snapshot(ruta), 'rb') as archivo:
+            encabezado = marshal.load(archivo)
+            esperado = _encabezado_esperado()
+            if not isinstance(encabezado, dict) or any(encabezado.get(clave) != valor for clave, valor in esperado.items()):
+                return None
+            estado = os.stat(ruta)
+            vigente = (encabezado['mtime_ns'], encabezado['tamanio']) == (estado.st_mtime_ns, estado.st_size)
+            if not vigente and (encabezado['tamanio'] != estado.st_size or encabezado['hash'] != calcular_hash(ruta)):
+                return None
+            # marshal.load sobre el archivo lee de a pocos bytes: es varias veces más lento que leerlo entero
+            contenido = archivo.read()
+        with sin_recolector_de_basura():
+            valores = marshal.loads(contenido)
+        jugadores = construir_jugadores(valores, clase_jugador)
+        if not vigente:
+            _actualizar_encabezado(ruta, encabezado, estado, contenido)
+        return jugadores
+    # Un archivo dañado o editado a mano puede no tener la forma de las tuplas guardadas
+    except (OSError, EOFError, KeyError, IndexError, TypeError, ValueError):
+        return None
+
+def medir_inicio(tamanios: list[int]) -> None:
+    '''
+    Mide cuánto tarda en construirse un Equipo leyendo el JSON y leyendo el snapshot,
+    para rosters sintéticos de los tamaños recibidos.
+    '''
+    from equipo import Equipo
+    from generador_roster import escribir_roster
+    with tempfile.TemporaryDirectory() as directorio:
+        for tamanio in tamanios:
+            ruta = os.path.join(directorio, f'roster_{tamanio}.json')
+            escribir_roster(ruta, tamanio)
+
+            # Cada equipo se libera fuera de la medición para no contar su destrucción
+            inicio = time.perf_counter()
+            equipo = Equipo(ruta)
+            tiempo_json = time.perf_counter() - inicio
+            del equipo
+
+            inicio = time.perf_counter()
+            equipo = Equipo(ruta, usar_snapshot=True)
+            tiempo_primera_carga = time.perf_counter() - inicio
+            del equipo
+
+            inicio = time.perf_counter()
+            equipo = Equipo(ruta, usar_snapshot=True)
+            tiempo_snapshot = time.perf_counter() - inicio
+            del equipo
+
+            print(f'{tamanio:>9} jugadores | JSON: {tiempo_json:8.3f} s | '
+                  f'JSON + escribir snapshot: {tiempo_primera_carga:8.3f} s | snapshot: {tiempo_snapshot:8.3f} s')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Mide el tiempo de inicio de Equipo con y sin snapshot')
+    parser.add_argument('--tamanios', type=int, nargs='+', default=[12, 10_000, 1_000_000])
+    medir_inicio(parser.parse_args().tamanios)
@@ -0,0 +1,120 @@
+import os
+import threading
+from typing import Callable
+from equipo import Equipo
+from seguimiento_cambios import Cambios
+
+def firma_archivo(ruta: str):
+    '''
+    Retorna (inodo, fecha de modificación en ns, tamaño) del archivo, o None si no existe.
+    El inodo cambia cuando un editor guarda escribiendo un archivo nuevo y renombrándolo.
+    '''
+    try:
+        estado = os.stat(ruta)
+    except OSError:
+        return None
+    return (estado.st_ino, estado.st_mtime_ns, estado.st_size)
+
+def firma_archivos(rutas: list[str]):
+    '''
+    Retorna la firma de todos los archivos recibidos junto con sus rutas, de modo que también
+    cambia si se agrega o se quita un archivo. Retorna None si no hay archivos o alguno no existe.
+    '''
+    firmas = tuple((ruta, firma_archivo(ruta)) for ruta in rutas)
+    if not firmas or any(firma is None for _, firma in firmas):
+        return None
+    return firmas
+
+class VigilanteArchivo:
+    '''
+    Revisa cada cierto intervalo si cambió el archivo de un Equipo (o alguno de los archivos de
+    una Liga, ver Equipo.rutas_archivos) sin servicios externos, comparando inodo, fecha de
+    modificación y tamaño, y si cambió aplica al equipo solo las diferencias (ver
+    Equipo.cambios_en_archivo y Equipo.aplicar_cambios).
+
+    Puede usarse llamando a revisar() desde el propio bucle del programa o con iniciar(), que
+    revisa en un hilo aparte. En ese caso el candado recibido se toma mientras se aplican los
+    cambios, para que quien consulta el equipo desde otros hilos pueda tomarlo también.
+    revisar() también puede hacerse en dos pasos: detectar(), que lee y compara el archivo sin
+    modificar el equipo (y puede correr en otro hilo), y aplicar() con su resultado.
+    '''
+    def __init__(self, equipo: Equipo, intervalo: float = 1.0, al_cambiar: Callable[[Cambios], None] = None,
+                 candado: threading.Lock = None) -> None:
+        self.equipo = equipo
+        self.intervalo = intervalo
+        self.al_cambiar = al_cambiar
+        self.candado = candado or threading.Lock()
+        self.firma = firma_archivos(equipo.rutas_archivos())
+        self.__firma_con_error = None
+        self.__detener = threading.Event()
+        self.__hilo = None
+
+    def detectar(self):
+        '''
+        Si el archivo cambió desde la última sincronización, lo lee y retorna (firma, versión del
+        equipo, cambios) para pasarle a aplicar(). Si no cambió, no existe o todavía no es un JSON
+        válido (por ejemplo a mitad de una escritura), retorna None. La firma solo se guarda al
+        aplicar, así que un archivo que no se pudo leer se vuelve a intentar en cada revisión.
+        '''
+        firma = firma_archivos(self.equipo.rutas_archivos())
+        if firma is None or firma == self.firma:
+            return None
+        version = self.equipo.version
+        try:
+            cambios = self.equipo.cambios_en_archivo()
+        except (ValueError, OSError, KeyError, TypeError, AttributeError) as error:
+            # Se avisa una sola vez por cada versión del archivo que falla
+            if firma != self.__firma_con_error:
+                self.__firma_con_error = firma
+                print(f"Error: no se pudo recargar {self.equipo.ruta} - {error}")
+            return None
+        return firma, version, cambios
+
+    def aplicar(self, firma, version: int, cambios: Cambios) -> Cambios:
+        '''
+        Aplica al equipo los cambios obtenidos con detectar() y guarda la firma del archivo.
+        Si el equipo cambió desde entonces (por ejemplo porque se lo recargó) no aplica nada
+        y retorna None: el archivo se vuelve a comparar en la próxima revisión.
+        '''
+        with self.candado:
+            if self.equipo.version != version:
+                return None
+            if cambios:
+                self.equipo.aplicar_cambios(cambios)
+            self.firma = firma
+        if cambios and self.al_cambiar is not None:
+            self.al_cambiar(cambios)
+        return cambios
+
+    def revisar(self) -> Cambios:
+        '''
+        Si el archivo cambió desde la última revisión, sincroniza el equipo y retorna los cambios
+        (ver detectar y aplicar). Si no hay nada que aplicar retorna None.
+        '''
+        detectado = self.detectar()
+        if detectado is None:
+            return None
+        return self.aplicar(*detectado)
+
+    def __vigilar(self) -> None:
+        while not self.__detener.wait(self.intervalo):
+            self.revisar()
+
+    def iniciar(self) -> None:
+        if self.__hilo is None:
+            self.__detener.clear()
+            self.__hilo = threading.Thread(target=self.__vigilar, name='vigilante-archivo', daemon=True)
+            self.__hilo.start()
+
+    def detener(self) -> None:
+        if self.__hilo is not None:
+            self.__detener.set()
+            self.__hilo.join()
+            self.__hilo = None
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.detener()